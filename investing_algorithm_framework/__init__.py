@@ -18,10 +18,11 @@ from .domain import ApiException, combine_backtests, PositionSize, \
     DEFAULT_LOGGING_CONFIG, DataType, DataProvider, \
     TradeStatus, TradeRiskType, generate_backtest_summary_metrics, \
     APPLICATION_DIRECTORY, DataSource, OrderExecutor, PortfolioProvider, \
-    SnapshotInterval, AWS_S3_STATE_BUCKET_NAME, BacktestEvaluationFocus
+    SnapshotInterval, AWS_S3_STATE_BUCKET_NAME, BacktestEvaluationFocus, \
+    DataStorageFormat
 from .infrastructure import AzureBlobStorageStateHandler, \
     CSVOHLCVDataProvider, CCXTOHLCVDataProvider, PandasOHLCVDataProvider, \
-    AWSS3StorageStateHandler
+    AWSS3StorageStateHandler, convert_ohlcv_files
 from .create_app import create_app
 from .download_data import download
 from .services import get_annual_volatility, get_sortino_ratio, \
@@ -192,5 +193,7 @@ __all__ = [
     "BacktestRun",
     "load_backtests_from_directory",
     "save_backtests_to_directory",
-    "DataError"
+    "DataError",
+    "DataStorageFormat",
+    "convert_ohlcv_files",
 ]
@@ -1,7 +1,10 @@
 import inspect
 import logging
+import multiprocessing
 import os
 import threading
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Any, Dict, Tuple
 
@@ -20,15 +23,19 @@ from investing_algorithm_framework.domain import DATABASE_NAME, TimeUnit, \
     PortfolioConfiguration, SnapshotInterval, DataType, combine_backtests, \
     PortfolioProvider, OrderExecutor, ImproperlyConfigured, TimeFrame, \
     DataProvider, INDEX_DATETIME, tqdm, BacktestPermutationTest, \
-    LAST_SNAPSHOT_DATETIME, BACKTESTING_FLAG, generate_backtest_summary_metrics
+    LAST_SNAPSHOT_DATETIME, BACKTESTING_FLAG, IN_MEMORY_BACKTEST_STORAGE, \
+    BACKTEST_FAST_FORWARD, BACKTEST_DATABASE_NAME
 from investing_algorithm_framework.infrastructure import setup_sqlalchemy, \
     create_all_tables, CCXTOrderExecutor, CCXTPortfolioProvider, \
     BacktestOrderExecutor, CCXTOHLCVDataProvider, clear_db, \
     PandasOHLCVDataProvider
 from investing_algorithm_framework.services import OrderBacktestService, \
     BacktestPortfolioService, BacktestTradeOrderEvaluator, \
-    DefaultTradeOrderEvaluator, get_risk_free_rate_us
+    DefaultTradeOrderEvaluator, get_risk_free_rate_us, VectorBacktestData
 from .app_hook import AppHook
+from .backtest_worker import initialize_backtest_worker, \
+    run_backtest_in_worker, initialize_vector_backtest_worker, \
+    run_vector_backtest_in_worker
 from .eventloop import EventLoopService
 from .analysis import create_ohlcv_permutation
 
@@ -66,6 +73,7 @@ class App:
         self._tasks = []
         self._strategies = []
         self._data_providers: List[Tuple[DataProvider, int]] = []
+        self._default_data_provider = None
         self._on_initialize_hooks = []
         self._on_strategy_run_hooks = []
         self._on_after_initialize_hooks = []
@@ -305,7 +313,9 @@ class App:
             ENVIRONMENT: Environment.BACKTEST.value,
             BACKTESTING_START_DATE: backtest_date_range.start_date,
             BACKTESTING_END_DATE: backtest_date_range.end_date,
-            DATABASE_NAME: "backtest-database.sqlite3",
+            DATABASE_NAME: self.config.get(
+                BACKTEST_DATABASE_NAME, "backtest-database.sqlite3"
+            ),
             DATABASE_DIRECTORY_NAME: "backtest_databases",
             DATABASE_DIRECTORY_PATH: os.path.join(
                 self.resource_directory_path,
@@ -367,6 +377,44 @@ class App:
         # Setup sql if needed
         setup_sqlalchemy(self)
         create_all_tables()
+        self.container.config.repository_type.from_value("sql")
+        self.clear_status_caches()
+
+    def initialize_in_memory_storage(self):
+        """
+        Function to initialize in-memory storage for the app. The
+        repositories of the app will store their objects in a dict based
+        store instead of the database, which removes the database
+        overhead from backtests. The store is cleared, so that a run
+        starts with an empty store.
+
+        Returns:
+            None
+        """
+        resource_directory_path = self.resource_directory_path
+
+        if not os.path.exists(resource_directory_path):
+            os.makedirs(resource_directory_path)
+            logger.info(
+                f"Resource directory created at {resource_directory_path}"
+            )
+
+        self.container.in_memory_store().clear()
+        self.container.config.repository_type.from_value("in_memory")
+        self.clear_status_caches()
+
+    def clear_status_caches(self):
+        """
+        Function to clear the caches of the open orders and open trades
+        of the order and trade services. This function should be called
+        when the storage of the app is replaced, so that no orders or
+        trades of a previous run are served from the caches.
+
+        Returns:
+            None
+        """
+        self.container.order_status_cache().clear()
+        self.container.trade_status_cache().clear()
 
     def initialize_data_sources(
         self,
@@ -398,7 +446,9 @@ class App:
             )
 
         # Add the default data providers
-        data_provider_service.add_data_provider(CCXTOHLCVDataProvider())
+        data_provider_service.add_data_provider(
+            self._get_default_data_provider()
+        )
 
         # Initialize all data sources
         data_provider_service.index_data_providers(data_sources)
@@ -407,7 +457,8 @@ class App:
         self,
         data_sources: List[DataSource],
         backtest_date_range: BacktestDateRange,
-        show_progress: bool = True
+        show_progress: bool = True,
+        max_workers: int = None
     ):
         """
         Function to initialize the data sources for the app in backtest mode.
@@ -421,6 +472,10 @@ class App:
                 backtest. This should be an instance of BacktestDateRange.
             show_progress (bool): Whether to show a progress bar when
                 preparing the backtest data for each data provider.
+            max_workers (int, optional): The number of data providers
+                that prepare their backtest data concurrently. Defaults
+                to the BACKTEST_DATA_PREPARATION_WORKERS configuration
+                value.
 
         Returns:
             None
@@ -439,33 +494,36 @@ class App:
             )
 
         # Add the default data providers
-        data_provider_service.add_data_provider(CCXTOHLCVDataProvider())
+        data_provider_service.add_data_provider(
+            self._get_default_data_provider()
+        )
 
         # Initialize all data sources
         data_provider_service.index_backtest_data_providers(
             data_sources, backtest_date_range, show_progress=show_progress
         )
 
-        description = "Preparing backtest data for all data sources"
-        data_providers = data_provider_service.data_provider_index.get_all()
-
         # Prepare the backtest data for each data provider
-        if not show_progress:
-            for _, data_provider in data_providers:
-                data_provider.prepare_backtest_data(
-                    backtest_start_date=backtest_date_range.start_date,
-                    backtest_end_date=backtest_date_range.end_date
-                )
-        else:
-            for _, data_provider in \
-                    tqdm(
-                        data_providers, desc=description, colour="green"
-                    ):
-
-                data_provider.prepare_backtest_data(
-                    backtest_start_date=backtest_date_range.start_date,
-                    backtest_end_date=backtest_date_range.end_date
-                )
+        data_provider_service.prepare_backtest_data(
+            backtest_date_range=backtest_date_range,
+            show_progress=show_progress,
+            max_workers=max_workers
+        )
+
+    def _get_default_data_provider(self) -> DataProvider:
+        """
+        Get the default CCXT OHLCV data provider. The data provider is
+        created once, so the has_data answers of the data provider stay
+        cached in the data provider index across initializations.
+
+        Returns:
+            DataProvider: The default data provider.
+        """
+
+        if self._default_data_provider is None:
+            self._default_data_provider = CCXTOHLCVDataProvider()
+
+        return self._default_data_provider
 
     def initialize_backtest_services(self):
         """
@@ -515,6 +573,7 @@ class App:
                 portfolio_configuration_service=portfolio_conf_service,
                 portfolio_snapshot_service=portfolio_snap_service,
                 configuration_service=configuration_service,
+                status_cache=self.container.order_status_cache(),
             )
         )
 
@@ -646,6 +705,9 @@ class App:
             if event_loop_service is not None:
                 self._run_history = event_loop_service.history
 
+            # Close the connections that were opened to fetch live data
+            self.container.data_provider_service().close()
+
             try:
                 # Upload state if state handler is provided
                 if self._state_handler is not None:
@@ -813,6 +875,8 @@ class App:
             Tuple[bool, Dict[str, Any]]: A tuple containing a boolean
                 indicating if the data is complete and a dictionary
                 with information about missing data for each data source.
+                The missing data is reported as a list of gaps with
+                a start date, end date and length.
         """
         data_sources = []
         missing_data_info = {}
@@ -851,12 +915,12 @@ class App:
                             backtest_date_range.end_date
                         )
 
-                    missing_dates = \
-                        data_provider.get_missing_data_dates(
+                    missing_data_gaps = \
+                        data_provider.get_missing_data_gaps(
                             required_start_date,
                             backtest_date_range.end_date
                         )
-                    if len(missing_dates) > 0:
+                    if len(missing_data_gaps) > 0:
                         missing_data_info[data_source.identifier] = {
                             "data_source_id": data_source.identifier,
                             "completeness_percentage": (
@@ -865,10 +929,11 @@ class App:
                                     number_of_required_data_points
                                 ) * 100
                             ),
-                            "missing_data_points": len(
-                                missing_dates
+                            "missing_data_points": int(
+                                missing_data_gaps["length"].sum()
                             ),
-                            "missing_dates": missing_dates,
+                            "missing_data_gaps":
+                                missing_data_gaps.to_dicts(),
                             "data_source_file_path":
                                 data_provider.get_data_source_file_path()
                         }
@@ -898,6 +963,7 @@ class App:
         market: Optional[str] = None,
         trading_symbol: Optional[str] = None,
         continue_on_error: bool = False,
+        workers: Optional[int] = None,
     ) -> List[Backtest]:
         """
         Run vectorized backtests for a set of strategies. The provided
@@ -949,6 +1015,12 @@ class App:
                 backtests if an error occurs in one of the backtests. If set
                 to True, the backtest will return an empty Backtest instance
                 in case of an error. If set to False, the error will be raised.
+            workers (Optional[int]): The number of worker processes to
+                run the backtests of a date range in. The data of the
+                strategies is loaded once per date range and sent to
+                each worker process, so the strategies need to be
+                picklable. Defaults to running the backtests one by one
+                in the current process.
 
         Returns:
             List[Backtest]: List of Backtest instances for each strategy
@@ -987,21 +1059,18 @@ class App:
                     show_progress=show_progress
                 )
 
-            for strategy in tqdm(
-                strategies, colour="green", desc="Running backtests"
-            ):
-                backtest = self.run_vector_backtest(
-                    backtest_date_range=backtest_date_range,
-                    initial_amount=initial_amount,
-                    strategy=strategy,
-                    snapshot_interval=snapshot_interval,
-                    risk_free_rate=risk_free_rate,
-                    skip_data_sources_initialization=True,
-                    market=market,
-                    trading_symbol=trading_symbol,
-                    continue_on_error=continue_on_error
-                )
-                backtests.append(backtest)
+            backtests = self._run_vector_backtests_for_date_range(
+                strategies=strategies,
+                backtest_date_range=backtest_date_range,
+                initial_amount=initial_amount,
+                snapshot_interval=snapshot_interval,
+                risk_free_rate=risk_free_rate,
+                market=market,
+                trading_symbol=trading_symbol,
+                continue_on_error=continue_on_error,
+                workers=workers,
+                description="Running backtests"
+            )
         else:
             for backtest_date_range in tqdm(
                 backtest_date_ranges,
@@ -1018,27 +1087,29 @@ class App:
                     '%Y-%m-%d'
                 )
                 end_date = backtest_date_range.end_date.strftime('%Y-%m-%d')
+                date_range_backtests = \
+                    self._run_vector_backtests_for_date_range(
+                        strategies=strategies,
+                        backtest_date_range=backtest_date_range,
+                        initial_amount=initial_amount,
+                        snapshot_interval=snapshot_interval,
+                        risk_free_rate=risk_free_rate,
+                        market=market,
+                        trading_symbol=trading_symbol,
+                        continue_on_error=continue_on_error,
+                        workers=workers,
+                        description=f"Running backtests for "
+                                    f"{start_date} to {end_date}"
+                    )
 
-                for strategy in tqdm(
-                    strategies,
-                        colour="green",
-                        desc=f"Running backtests for "
-                             f"{start_date} to {end_date}"
+                for strategy, backtest in zip(
+                    strategies, date_range_backtests
                 ):
 
                     if strategy not in backtests_ordered_by_strategy:
                         backtests_ordered_by_strategy[strategy] = []
 
-                    backtests_ordered_by_strategy[strategy].append(
-                            self.run_vector_backtest(
-                                backtest_date_range=backtest_date_range,
-                                initial_amount=initial_amount,
-                                strategy=strategy,
-                                snapshot_interval=snapshot_interval,
-                                risk_free_rate=risk_free_rate,
-                                skip_data_sources_initialization=True
-                            )
-                        )
+                    backtests_ordered_by_strategy[strategy].append(backtest)
 
             for strategy in backtests_ordered_by_strategy:
                 backtests.append(
@@ -1047,6 +1118,116 @@ class App:
 
         return backtests
 
+    def _run_vector_backtests_for_date_range(
+        self,
+        strategies,
+        backtest_date_range,
+        initial_amount,
+        snapshot_interval,
+        risk_free_rate,
+        market,
+        trading_symbol,
+        continue_on_error,
+        workers,
+        description
+    ) -> List[Backtest]:
+        """
+        Function to run the vector backtests of a list of strategies for
+        one date range. The data of the strategies is loaded once and
+        shared by all strategies.
+
+        With more than one worker, the data of all strategies is loaded
+        up front and the strategies are run in a pool of worker
+        processes. Each worker process receives the loaded data once.
+
+        Args:
+            strategies (List[TradingStrategy]): The strategies to backtest.
+            backtest_date_range (BacktestDateRange): The date range.
+            initial_amount (float): The initial amount of the backtests.
+            snapshot_interval (SnapshotInterval): The snapshot interval.
+            risk_free_rate (float): The risk-free rate.
+            market (str): The market of the backtests.
+            trading_symbol (str): The trading symbol of the backtests.
+            continue_on_error (bool): Whether to continue when a
+                backtest fails.
+            workers (int): The number of worker processes.
+            description (str): The description of the progress bar.
+
+        Returns:
+            List[Backtest]: The backtests in the order of the strategies
+        """
+        vector_backtest_data = VectorBacktestData(
+            self.container.data_provider_service()
+        )
+
+        if workers is None or workers <= 1 or len(strategies) <= 1:
+            return [
+                self.run_vector_backtest(
+                    backtest_date_range=backtest_date_range,
+                    initial_amount=initial_amount,
+                    strategy=strategy,
+                    snapshot_interval=snapshot_interval,
+                    risk_free_rate=risk_free_rate,
+                    skip_data_sources_initialization=True,
+                    market=market,
+                    trading_symbol=trading_symbol,
+                    continue_on_error=continue_on_error,
+                    vector_backtest_data=vector_backtest_data
+                )
+                for strategy in tqdm(
+                    strategies, colour="green", desc=description
+                )
+            ]
+
+        self.initialize_backtest_config(
+            backtest_date_range=backtest_date_range,
+            snapshot_interval=snapshot_interval,
+            initial_amount=initial_amount
+        )
+        vector_backtest_data.load(
+            strategies,
+            backtest_date_range.start_date,
+            backtest_date_range.end_date
+        )
+        worker_state = {
+            "portfolio_configurations": self.get_portfolio_configurations(),
+            "vector_backtest_data": vector_backtest_data,
+        }
+        backtest_kwargs = [
+            {
+                "strategy": strategy,
+                "backtest_date_range": backtest_date_range,
+                "risk_free_rate": risk_free_rate,
+                "initial_amount": initial_amount,
+                "market": market,
+                "trading_symbol": trading_symbol,
+                "continue_on_error": continue_on_error,
+            }
+            for strategy in strategies
+        ]
+        workers = min(workers, len(strategies))
+
+        # Worker processes are spawned instead of forked, because the
+        # thread pool of polars does not survive a fork
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initialize_vector_backtest_worker,
+            initargs=(worker_state,)
+        ) as executor:
+            return list(
+                tqdm(
+                    executor.map(
+                        run_vector_backtest_in_worker,
+                        backtest_kwargs,
+                        chunksize=max(1, len(backtest_kwargs) // (workers * 4))
+                    ),
+                    total=len(backtest_kwargs),
+                    colour="green",
+                    desc=description
+                )
+            )
+
     def run_vector_backtest(
         self,
         backtest_date_range: BacktestDateRange,
@@ -1060,6 +1241,7 @@ class App:
         market: str = None,
         trading_symbol: str = None,
         continue_on_error: bool = False,
+        vector_backtest_data: VectorBacktestData = None,
     ) -> Backtest:
         """
         Run vectorized backtests for a strategy. The provided
@@ -1112,6 +1294,9 @@ class App:
                 backtests if an error occurs in one of the backtests. If set
                 to True, the backtest will return an empty Backtest instance
                 in case of an error. If set to False, the error will be raised.
+            vector_backtest_data (VectorBacktestData): The data that is
+                shared between the vector backtests of the date range. If
+                not provided, the data is retrieved from the data providers.
 
         Returns:
             Backtest: Instance of Backtest
@@ -1143,48 +1328,17 @@ class App:
                 )
 
         backtest_service = self.container.backtest_service()
-        backtest_service.validate_strategy_for_vector_backtest(strategy)
-
-        try:
-            run = backtest_service.create_vector_backtest(
-                strategy=strategy,
-                backtest_date_range=backtest_date_range,
-                risk_free_rate=risk_free_rate,
-                market=market,
-                trading_symbol=trading_symbol,
-                initial_amount=initial_amount
-            )
-            backtest = Backtest(
-                backtest_runs=[run],
-                risk_free_rate=risk_free_rate,
-                backtest_summary=generate_backtest_summary_metrics(
-                    [run.backtest_metrics]
-                )
-            )
-        except Exception as e:
-            logger.error(
-                f"Error occurred during vector backtest for strategy "
-                f"{strategy.strategy_id}: {str(e)}"
-            )
-            if continue_on_error:
-                backtest = Backtest(
-                    backtest_runs=[],
-                    risk_free_rate=risk_free_rate,
-                )
-            else:
-                raise e
-
-        # Add the metadata to the backtest
-        if metadata is None:
-
-            if strategy.metadata is None:
-                backtest.metadata = {}
-            else:
-                backtest.metadata = strategy.metadata
-        else:
-            backtest.metadata = metadata
-
-        return backtest
+        return backtest_service.run_vector_backtest(
+            strategy=strategy,
+            backtest_date_range=backtest_date_range,
+            risk_free_rate=risk_free_rate,
+            market=market,
+            trading_symbol=trading_symbol,
+            initial_amount=initial_amount,
+            metadata=metadata,
+            continue_on_error=continue_on_error,
+            vector_backtest_data=vector_backtest_data
+        )
 
     def run_backtests(
         self,
@@ -1195,12 +1349,21 @@ class App:
         algorithms: Optional[List[Algorithm]] = None,
         snapshot_interval: SnapshotInterval = SnapshotInterval.DAILY,
         risk_free_rate: Optional[float] = None,
+        workers: Optional[int] = None,
     ) -> List[Backtest]:
         """
         Function to run multiple backtests for a list of algorithms over
         a list of date ranges. This function will run each algorithm
         for each date range and return a list of backtest reports.
 
+        With more than one worker, the backtests are run in a pool of
+        worker processes. Each worker process has its own app, dependency
+        container and backtest database. The backtest data of each date
+        range is prepared once before the backtests are run, so that the
+        workers read the stored data instead of downloading it. The
+        algorithms, data providers and hooks of the app need to be
+        picklable to be sent to the worker processes.
+
         Args:
             algorithms: List of Algorithm instances to run backtests for.
             backtest_date_ranges (List[BacktestDateRange]): List of date ranges
@@ -1215,9 +1378,13 @@ class App:
                 and other performance metrics. If not provided, the default
                 risk-free rate will be tried to be fetched from the
                 US Treasury website.
+            workers (Optional[int]): The number of worker processes to
+                run the backtests in. Defaults to running the backtests
+                one by one in the current process.
 
         Returns:
-            List[Backtest]: List of Backtest instances containing the results
+            List[Backtest]: List of Backtest instances containing the
+                results, in the order of the date ranges and algorithms
         """
         backtests = []
 
@@ -1248,6 +1415,16 @@ class App:
                     "connection"
                 )
 
+        if workers is not None and workers > 1:
+            return self._run_backtests_in_workers(
+                backtest_date_ranges=backtest_date_ranges,
+                algorithms=final_algorithms,
+                initial_amount=initial_amount,
+                snapshot_interval=snapshot_interval,
+                risk_free_rate=risk_free_rate,
+                workers=workers
+            )
+
         for date_range in backtest_date_ranges:
             for algorithm in final_algorithms:
                 backtest = self.run_backtest(
@@ -1261,6 +1438,114 @@ class App:
 
         return backtests
 
+    def _run_backtests_in_workers(
+        self,
+        backtest_date_ranges,
+        algorithms,
+        initial_amount,
+        snapshot_interval,
+        risk_free_rate,
+        workers
+    ) -> List[Backtest]:
+        """
+        Function to run the backtests of run_backtests in a pool of
+        worker processes.
+
+        Args:
+            backtest_date_ranges (List[BacktestDateRange]): List of
+                date ranges.
+            algorithms (List[Algorithm]): List of algorithms.
+            initial_amount (float): The initial amount of the backtests.
+            snapshot_interval (SnapshotInterval): The snapshot interval.
+            risk_free_rate (float): The risk-free rate.
+            workers (int): The number of worker processes.
+
+        Returns:
+            List[Backtest]: List of Backtest instances, in the order of
+                the date ranges and algorithms
+        """
+        algorithm_factory = self.container.algorithm_factory()
+
+        # Prepare the backtest data of each date range once, the
+        # workers load the stored data when preparing their data providers
+        for date_range in backtest_date_ranges:
+            self.initialize_backtest_config(
+                backtest_date_range=date_range,
+                snapshot_interval=snapshot_interval,
+                initial_amount=initial_amount
+            )
+            data_sources = []
+
+            for algorithm in algorithms:
+                data_sources.extend(
+                    algorithm_factory.create_algorithm(
+                        algorithm=algorithm,
+                        strategies=list(self._strategies)
+                    ).data_sources
+                )
+
+            self.initialize_data_sources_backtest(data_sources, date_range)
+
+        # The workers name their databases after this process, so that
+        # only the databases of this pool are removed afterwards
+        database_name = f"backtest-database-{os.getpid()}"
+        worker_state = {
+            "name": self._name,
+            "config": dict(self.config),
+            "database_name": database_name,
+            "portfolio_configurations": self.get_portfolio_configurations(),
+            "market_credentials": self.get_market_credentials(),
+            "data_providers": self._data_providers,
+            "strategies": self._strategies,
+            "tasks": self._tasks,
+            "on_strategy_run_hooks": self._on_strategy_run_hooks,
+        }
+        backtest_kwargs = [
+            {
+                "backtest_date_range": date_range,
+                "initial_amount": initial_amount,
+                "algorithm": algorithm,
+                "snapshot_interval": snapshot_interval,
+                "risk_free_rate": risk_free_rate,
+            }
+            for date_range in backtest_date_ranges
+            for algorithm in algorithms
+        ]
+
+        if len(backtest_kwargs) == 0:
+            return []
+
+        # Worker processes are spawned instead of forked, because the
+        # thread pool of polars does not survive a fork
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(backtest_kwargs)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=initialize_backtest_worker,
+                initargs=(worker_state,)
+            ) as executor:
+                return list(
+                    executor.map(run_backtest_in_worker, backtest_kwargs)
+                )
+        finally:
+            self._remove_worker_databases(database_name)
+
+    def _remove_worker_databases(self, database_name):
+        database_directory_path = os.path.join(
+            self.resource_directory_path, "backtest_databases"
+        )
+
+        for file_path in glob(
+            os.path.join(database_directory_path, f"{database_name}-*")
+        ):
+
+            try:
+                os.remove(file_path)
+            except OSError as e:
+                logger.warning(
+                    f"Could not remove worker database {file_path}: {e}"
+                )
+
     def run_backtest(
         self,
         backtest_date_range: BacktestDateRange,
@@ -1314,7 +1599,12 @@ class App:
             snapshot_interval=snapshot_interval,
             initial_amount=initial_amount
         )
-        self.initialize_storage(remove_database_if_exists=True)
+
+        if self.config.get(IN_MEMORY_BACKTEST_STORAGE, False):
+            self.initialize_in_memory_storage()
+        else:
+            self.initialize_storage(remove_database_if_exists=True)
+
         self.initialize_backtest_services()
         self.initialize_backtest_portfolios()
 
@@ -1353,6 +1643,11 @@ class App:
             backtest_date_range.end_date
         )
 
+        if self.config.get(BACKTEST_FAST_FORWARD, False):
+            schedule = backtest_service.add_entry_signals_to_schedule(
+                schedule, algorithm.strategies, backtest_date_range
+            )
+
         # Initialize event loop
         event_loop_service = EventLoopService(
             configuration_service=self.container.configuration_service(),
@@ -2191,12 +2486,19 @@ class App:
 
     def cleanup_backtest_resources(self):
         """
-        Clean up the backtest database and remove SQLAlchemy models/tables.
+        Clean up the backtest database and remove SQLAlchemy models/tables,
+        or clear the in-memory store if the backtest ran in memory.
         """
         logger.info("Cleaning up backtest resources")
         config = self.config
         environment = config[ENVIRONMENT]
 
         if Environment.BACKTEST.equals(environment):
-            db_uri = config.get(SQLALCHEMY_DATABASE_URI)
-            clear_db(db_uri)
+
+            if config.get(IN_MEMORY_BACKTEST_STORAGE, False):
+                self.container.in_memory_store().clear()
+            else:
+                db_uri = config.get(SQLALCHEMY_DATABASE_URI)
+                clear_db(db_uri)
+
+            self.clear_status_caches()
@@ -0,0 +1,126 @@
+import os
+
+from investing_algorithm_framework.domain import BACKTEST_DATABASE_NAME
+from investing_algorithm_framework.services import BacktestService, \
+    PortfolioConfigurationService
+
+# The app of the worker process, created once by initialize_backtest_worker
+_worker_app = None
+
+# The backtest service and data of the worker process, created once by
+# initialize_vector_backtest_worker
+_worker_backtest_service = None
+_worker_vector_backtest_data = None
+
+
+def initialize_backtest_worker(worker_state):
+    """
+    Initializer of the worker processes of App.run_backtests. Each
+    worker process creates its own app with its own dependency container
+    from the state of the app that runs the backtests. The worker uses
+    a backtest database of its own, so that the backtests of the
+    workers do not share a database file. The name of the database
+    file is the database name of the worker state suffixed with the
+    pid of the worker.
+
+    Args:
+        worker_state (dict): The state of the app, with its name,
+            config, database name, portfolio configurations, market
+            credentials, data providers, strategies, tasks and
+            on_strategy_run hooks.
+
+    Returns:
+        None
+    """
+    # Imported here, because the create_app module imports the app package
+    from investing_algorithm_framework.create_app import create_app
+
+    global _worker_app
+    app = create_app(name=worker_state["name"])
+    app.set_config_with_dict(worker_state["config"])
+    app.set_config(
+        BACKTEST_DATABASE_NAME,
+        f"{worker_state['database_name']}-{os.getpid()}.sqlite3"
+    )
+
+    for portfolio_configuration in worker_state["portfolio_configurations"]:
+        app.add_portfolio_configuration(portfolio_configuration)
+
+    for market_credential in worker_state["market_credentials"]:
+        app.add_market_credential(market_credential)
+
+    for data_provider, priority in worker_state["data_providers"]:
+        app.add_data_provider(data_provider, priority=priority)
+
+    app.add_strategies(worker_state["strategies"])
+    app.add_tasks(worker_state["tasks"])
+
+    for app_hook in worker_state["on_strategy_run_hooks"]:
+        app.on_strategy_run(app_hook)
+
+    _worker_app = app
+
+
+def run_backtest_in_worker(backtest_kwargs):
+    """
+    Runs a backtest with the app of the worker process.
+
+    Args:
+        backtest_kwargs (dict): The keyword arguments for App.run_backtest.
+
+    Returns:
+        Backtest: The backtest that has been run.
+    """
+    return _worker_app.run_backtest(**backtest_kwargs)
+
+
+def initialize_vector_backtest_worker(worker_state):
+    """
+    Initializer of the worker processes of App.run_vector_backtests.
+    Vector backtests only need the portfolio configurations and the
+    data of the strategies, so each worker process creates a backtest
+    service that uses the loaded vector backtest data instead of an app.
+
+    Args:
+        worker_state (dict): The portfolio configurations and the
+            loaded VectorBacktestData of the date range.
+
+    Returns:
+        None
+    """
+    global _worker_backtest_service, _worker_vector_backtest_data
+    portfolio_configuration_service = PortfolioConfigurationService(
+        portfolio_repository=None, position_repository=None
+    )
+
+    for portfolio_configuration in worker_state["portfolio_configurations"]:
+        portfolio_configuration_service.add(portfolio_configuration)
+
+    _worker_vector_backtest_data = worker_state["vector_backtest_data"]
+    _worker_backtest_service = BacktestService(
+        data_provider_service=None,
+        order_service=None,
+        portfolio_service=None,
+        portfolio_snapshot_service=None,
+        position_repository=None,
+        trade_service=None,
+        configuration_service=None,
+        portfolio_configuration_service=portfolio_configuration_service,
+    )
+
+
+def run_vector_backtest_in_worker(backtest_kwargs):
+    """
+    Runs a vector backtest with the backtest service and data of the
+    worker process.
+
+    Args:
+        backtest_kwargs (dict): The keyword arguments for
+            BacktestService.run_vector_backtest.
+
+    Returns:
+        Backtest: The backtest that has been run.
+    """
+    return _worker_backtest_service.run_vector_backtest(
+        vector_backtest_data=_worker_vector_backtest_data, **backtest_kwargs
+    )
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from datetime import datetime, timedelta, timezone
 from time import sleep
 from typing import List, Set, Dict
@@ -7,7 +8,8 @@ import polars as pl
 from investing_algorithm_framework.domain import Environment, ENVIRONMENT, \
     OrderStatus, DataSource, DataType, tqdm, \
     TradeStatus, SNAPSHOT_INTERVAL, SnapshotInterval, OperationalException, \
-    LAST_SNAPSHOT_DATETIME, INDEX_DATETIME
+    LAST_SNAPSHOT_DATETIME, INDEX_DATETIME, IN_MEMORY_BACKTEST_STORAGE
+from investing_algorithm_framework.infrastructure import unit_of_work
 from investing_algorithm_framework.services import TradeOrderEvaluator
 
 from .algorithm import Algorithm
@@ -332,6 +334,8 @@ class EventLoopService:
         - If `schedule` is provided, the event loop will run according to
             the schedule, iterating through each row and using the "date"
             column to determine the current date for that iteration.
+            Schedule dates with an entry_signal flag set to False are
+            fast forwarded when there are no open orders and trades.
 
         Args:
             number_of_iterations: Optional; the number of iterations to run.
@@ -356,20 +360,18 @@ class EventLoopService:
                     self._configuration_service.add_value(
                         INDEX_DATETIME, current_time
                     )
-                    strategy_ids = schedule[current_time]["strategy_ids"]
-                    # task_ids = schedule[current_time]["task_ids"]
-                    strategies = self._get_strategies(strategy_ids)
-                    self._run_iteration(strategies=strategies, tasks=[])
+                    self._run_scheduled_iteration(
+                        current_time, schedule[current_time]
+                    )
 
             else:
                 for current_time in sorted_times:
                     self._configuration_service.add_value(
                         INDEX_DATETIME, current_time
                     )
-                    strategy_ids = schedule[current_time]["strategy_ids"]
-                    # task_ids = schedule[current_time]["task_ids"]
-                    strategies = self._get_strategies(strategy_ids)
-                    self._run_iteration(strategies=strategies, tasks=[])
+                    self._run_scheduled_iteration(
+                        current_time, schedule[current_time]
+                    )
         else:
             if number_of_iterations is None:
                 try:
@@ -420,18 +422,119 @@ class EventLoopService:
 
         self.cleanup()
 
+    def _run_scheduled_iteration(self, current_datetime, schedule_entry):
+        """
+        Runs the iteration of a schedule date. If the schedule date
+        has no entry signal and there are no open orders and trades,
+        the iteration is fast forwarded and only the snapshot of the
+        portfolios is taken.
+
+        Args:
+            current_datetime: The date of the schedule entry.
+            schedule_entry: The schedule entry with the strategy ids,
+                task ids and optionally the entry signal flag.
+
+        Returns:
+            None
+        """
+
+        if self._can_fast_forward(schedule_entry):
+            with self._unit_of_work():
+                self._snapshot(
+                    current_datetime=current_datetime,
+                    open_orders=[],
+                    created_orders=[]
+                )
+            return
+
+        strategy_ids = schedule_entry["strategy_ids"]
+        # task_ids = schedule_entry["task_ids"]
+        strategies = self._get_strategies(strategy_ids)
+        self._run_iteration(strategies=strategies, tasks=[])
+
+    def _can_fast_forward(self, schedule_entry) -> bool:
+        """
+        Checks if the iteration of a schedule entry can be skipped. This
+        is only the case when the schedule has been fast forward enabled
+        with entry signal flags, the entry has no entry signal, and there
+        are no open orders, created orders or open trades that need to be
+        evaluated.
+
+        Args:
+            schedule_entry: The schedule entry to check.
+
+        Returns:
+            bool: True if the iteration can be skipped, False otherwise.
+        """
+
+        if schedule_entry.get("entry_signal", True) or self.tasks:
+            return False
+
+        return not (
+            self._order_service.exists({"status": OrderStatus.OPEN})
+            or self._order_service.exists({"status": OrderStatus.CREATED})
+            or self._trade_service.exists({"status": TradeStatus.OPEN})
+        )
+
     def _run_iteration(
         self,
         strategies: List[TradingStrategy] = None,
         tasks: List = None
     ):
         """
-        Runs a single iteration of the event loop. This method collects all
-        due strategies, fetches their data configurations, and runs the
-        strategies with the collected data. It also checks for pending orders,
-        stop loss orders, and take profit orders, and updates their status if
-        needed. Finally, it runs all tasks and strategies, and takes a snapshot
-        of the portfolios if needed.
+        Runs a single iteration of the event loop within a unit of work.
+        All repository operations of the iteration share one database
+        session, and the changes of the iteration are committed at once
+        when the iteration is finished. Orders that are placed on an
+        exchange are committed right away, so that their records are
+        kept when a later step of the iteration fails.
+
+        Args:
+            strategies: Optional; a list of strategies to
+                run in this iteration.
+            tasks: Optional; a list of tasks to run in this iteration.
+
+        Returns:
+            None
+        """
+        try:
+            with self._unit_of_work():
+                self._run_iteration_steps(strategies=strategies, tasks=tasks)
+        except Exception:
+            # The changes of the iteration are rolled back, so the cached
+            # open orders and trades no longer match the database
+            self._order_service.clear_status_cache()
+            self._trade_service.clear_status_cache()
+            raise
+
+    def _unit_of_work(self):
+        """
+        Returns the unit of work of an iteration. Backtests with the
+        in-memory repositories do not use the database, so their
+        iterations do not run in a unit of work.
+
+        Returns:
+            The context manager of the unit of work.
+        """
+        config = self._configuration_service.config
+
+        if config.get(IN_MEMORY_BACKTEST_STORAGE, False):
+            return nullcontext()
+
+        return unit_of_work()
+
+    def _run_iteration_steps(
+        self,
+        strategies: List[TradingStrategy] = None,
+        tasks: List = None
+    ):
+        """
+        Runs the steps of a single iteration of the event loop. This method
+        collects all due strategies, fetches their data configurations, and
+        runs the strategies with the collected data. It also checks for
+        pending orders, stop loss orders, and take profit orders, and updates
+        their status if needed. Finally, it runs all tasks and strategies,
+        and takes a snapshot of the portfolios if needed.
 
         Args:
             strategies: Optional; a list of strategies to
@@ -492,14 +595,17 @@ class EventLoopService:
                         end_date=data_source.end_date,
                     )
         else:
-            for data_source in data_sources:
-                data_object[data_source.get_identifier()] = \
-                    self._data_provider_service.get_data(
-                        data_source=data_source,
-                        date=current_datetime,
-                        start_date=data_source.start_date,
-                        end_date=data_source.end_date,
-                    )
+            data_sources = list(data_sources)
+
+            # Fetch the data of all data sources concurrently, so that
+            # the latency of an iteration does not grow with the number
+            # of data sources.
+            results = self._data_provider_service.get_data_for_data_sources(
+                data_sources=data_sources, date=current_datetime
+            )
+
+            for data_source, data in zip(data_sources, results):
+                data_object[data_source.get_identifier()] = data
 
         # Step 3: Check pending orders, stop losses, take profits
         self._trade_order_evaluator.evaluate(
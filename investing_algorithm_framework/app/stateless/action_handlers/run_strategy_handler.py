@@ -2,6 +2,7 @@ import json
 
 from investing_algorithm_framework.app.stateless.action_handlers \
     .action_handler_strategy import ActionHandlerStrategy
+from investing_algorithm_framework.infrastructure import unit_of_work
 
 
 class RunStrategyHandler(ActionHandlerStrategy):
@@ -19,19 +20,30 @@ class RunStrategyHandler(ActionHandlerStrategy):
             .get_strategies(payload.get("strategies", None))
         tasks = strategy_orchestrator_service.get_tasks()
 
-        for strategy in strategies:
-            strategy_orchestrator_service.run_strategy(
-                strategy=strategy,
-                context=context,
-                sync=True
-            )
-
-        for task in tasks:
-            strategy_orchestrator_service.run_task(
-                task=task,
-                context=context,
-                sync=True
-            )
+        # Run the strategies and tasks in one unit of work, so that all
+        # their changes are committed to the database at once
+        try:
+            with unit_of_work():
+
+                for strategy in strategies:
+                    strategy_orchestrator_service.run_strategy(
+                        strategy=strategy,
+                        context=context,
+                        sync=True
+                    )
+
+                for task in tasks:
+                    strategy_orchestrator_service.run_task(
+                        task=task,
+                        context=context,
+                        sync=True
+                    )
+        except Exception:
+            # The changes of the run are rolled back, so the cached open
+            # orders and trades no longer match the database
+            context.order_service.clear_status_cache()
+            context.trade_service.clear_status_cache()
+            raise
 
         return {
             "statusCode": 200,
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 import pandas as pd
 
@@ -153,6 +153,50 @@ class TradingStrategy:
             "generate_sell_signals method not implemented"
         )
 
+    def generate_entry_signal_dates(
+        self, data: Dict[str, Any]
+    ) -> Optional[List[datetime]]:
+        """
+        Function that can be implemented by the user to support fast
+        forwarding in backtests. This function should return the dates
+        at which the entry signal of the strategy is true for the
+        full backtest date range.
+
+        When fast forwarding is enabled with the BACKTEST_FAST_FORWARD
+        configuration, the event loop skips the schedule points at which
+        there are no open orders and trades and the entry signal of
+        the due strategies is false. The strategy is run at the first
+        schedule point at or after each of the returned dates.
+
+        By default None is returned, which means that the entry signal
+        dates of the strategy are unknown and that the strategy is run at
+        every schedule point.
+
+        Args:
+            data (Dict[str, Any]): All the data that matched the
+                data sources of the strategy for the full backtest
+                date range.
+
+        Returns:
+            List[datetime]: The dates at which the entry signal
+                of the strategy is true, or None if the strategy
+                can not be fast forwarded.
+        """
+        return None
+
+    @property
+    def supports_fast_forward(self) -> bool:
+        """
+        Whether the strategy implements generate_entry_signal_dates. The
+        data for the entry signal dates is only loaded for strategies
+        that support fast forwarding.
+
+        Returns:
+            bool: True if generate_entry_signal_dates is implemented.
+        """
+        return type(self).generate_entry_signal_dates \
+            is not TradingStrategy.generate_entry_signal_dates
+
     def run_strategy(self, context: Context, data: Dict[str, Any]):
         """
         Main function for running your strategy. This function will be called
@@ -6,13 +6,18 @@ from investing_algorithm_framework.infrastructure import SQLOrderRepository, \
     SQLPositionRepository, SQLPortfolioRepository, \
     SQLPortfolioSnapshotRepository, SQLTradeRepository, \
     SQLPositionSnapshotRepository, SQLTradeStopLossRepository, \
-    SQLTradeTakeProfitRepository, SQLOrderMetadataRepository
+    SQLTradeTakeProfitRepository, SQLOrderMetadataRepository, \
+    InMemoryStore, InMemoryOrderRepository, InMemoryPositionRepository, \
+    InMemoryPortfolioRepository, InMemoryPortfolioSnapshotRepository, \
+    InMemoryTradeRepository, InMemoryPositionSnapshotRepository, \
+    InMemoryTradeStopLossRepository, InMemoryTradeTakeProfitRepository, \
+    InMemoryOrderMetadataRepository
 from investing_algorithm_framework.services import OrderService, \
     PositionService, PortfolioService, PortfolioConfigurationService, \
     BacktestService, ConfigurationService, PortfolioSnapshotService, \
     PositionSnapshotService, MarketCredentialService, TradeService, \
     PortfolioSyncService, OrderExecutorLookup, PortfolioProviderLookup, \
-    DataProviderService
+    DataProviderService, StatusCache
 
 
 def setup_dependency_container(app, modules=None, packages=None):
@@ -25,8 +30,16 @@ class DependencyContainer(containers.DeclarativeContainer):
     """
     Dependency container for the app. It is responsible for managing the
     dependencies of the app.
+
+    The repositories are selected with the repository_type config
+    option, "sql" (default) for the SQL repositories and "in_memory"
+    for the in-memory repositories that share the in_memory_store.
+
+    The order and trade services share the order_status_cache and
+    trade_status_cache, so that the cached open orders and trades stay
+    consistent between the service instances.
     """
-    config = providers.Configuration()
+    config = providers.Configuration(default={"repository_type": "sql"})
     wiring_config = containers.WiringConfiguration()
     configuration_service = providers.ThreadSafeSingleton(
         ConfigurationService,
@@ -34,26 +47,76 @@ class DependencyContainer(containers.DeclarativeContainer):
     market_credential_service = providers.ThreadSafeSingleton(
         MarketCredentialService
     )
-    order_repository = providers.Factory(SQLOrderRepository)
+    in_memory_store = providers.ThreadSafeSingleton(InMemoryStore)
+    order_repository = providers.Selector(
+        config.repository_type,
+        sql=providers.Factory(SQLOrderRepository),
+        in_memory=providers.Factory(
+            InMemoryOrderRepository, store=in_memory_store
+        ),
+    )
     order_executor_lookup = providers.ThreadSafeSingleton(
         OrderExecutorLookup
     )
-    order_metadata_repository = providers.Factory(SQLOrderMetadataRepository)
-    position_repository = providers.Factory(SQLPositionRepository)
+    order_metadata_repository = providers.Selector(
+        config.repository_type,
+        sql=providers.Factory(SQLOrderMetadataRepository),
+        in_memory=providers.Factory(
+            InMemoryOrderMetadataRepository, store=in_memory_store
+        ),
+    )
+    position_repository = providers.Selector(
+        config.repository_type,
+        sql=providers.Factory(SQLPositionRepository),
+        in_memory=providers.Factory(
+            InMemoryPositionRepository, store=in_memory_store
+        ),
+    )
     portfolio_provider_lookup = providers.ThreadSafeSingleton(
         PortfolioProviderLookup,
     )
-    portfolio_repository = providers.Factory(SQLPortfolioRepository)
-    position_snapshot_repository = providers.Factory(
-        SQLPositionSnapshotRepository
-    )
-    portfolio_snapshot_repository = providers.Factory(
-        SQLPortfolioSnapshotRepository
+    portfolio_repository = providers.Selector(
+        config.repository_type,
+        sql=providers.Factory(SQLPortfolioRepository),
+        in_memory=providers.Factory(
+            InMemoryPortfolioRepository, store=in_memory_store
+        ),
+    )
+    position_snapshot_repository = providers.Selector(
+        config.repository_type,
+        sql=providers.Factory(SQLPositionSnapshotRepository),
+        in_memory=providers.Factory(
+            InMemoryPositionSnapshotRepository, store=in_memory_store
+        ),
+    )
+    portfolio_snapshot_repository = providers.Selector(
+        config.repository_type,
+        sql=providers.Factory(SQLPortfolioSnapshotRepository),
+        in_memory=providers.Factory(
+            InMemoryPortfolioSnapshotRepository, store=in_memory_store
+        ),
+    )
+    trade_repository = providers.Selector(
+        config.repository_type,
+        sql=providers.Factory(SQLTradeRepository),
+        in_memory=providers.Factory(
+            InMemoryTradeRepository, store=in_memory_store
+        ),
+    )
+    trade_take_profit_repository = providers.Selector(
+        config.repository_type,
+        sql=providers.Factory(SQLTradeTakeProfitRepository),
+        in_memory=providers.Factory(
+            InMemoryTradeTakeProfitRepository, store=in_memory_store
+        ),
+    )
+    trade_stop_loss_repository = providers.Selector(
+        config.repository_type,
+        sql=providers.Factory(SQLTradeStopLossRepository),
+        in_memory=providers.Factory(
+            InMemoryTradeStopLossRepository, store=in_memory_store
+        ),
     )
-    trade_repository = providers.Factory(SQLTradeRepository)
-    trade_take_profit_repository = providers\
-        .Factory(SQLTradeTakeProfitRepository)
-    trade_stop_loss_repository = providers.Factory(SQLTradeStopLossRepository)
     data_provider_service = providers.ThreadSafeSingleton(
         DataProviderService,
         configuration_service=configuration_service,
@@ -77,6 +140,8 @@ class DependencyContainer(containers.DeclarativeContainer):
         portfolio_repository=portfolio_repository,
         position_repository=position_repository,
     )
+    order_status_cache = providers.ThreadSafeSingleton(StatusCache)
+    trade_status_cache = providers.ThreadSafeSingleton(StatusCache)
     trade_service = providers.Factory(
         TradeService,
         order_repository=order_repository,
@@ -87,6 +152,7 @@ class DependencyContainer(containers.DeclarativeContainer):
         portfolio_repository=portfolio_repository,
         position_repository=position_repository,
         order_metadata_repository=order_metadata_repository,
+        status_cache=trade_status_cache,
     )
     position_service = providers.Factory(
         PositionService,
@@ -104,7 +170,8 @@ class DependencyContainer(containers.DeclarativeContainer):
         portfolio_snapshot_service=portfolio_snapshot_service,
         trade_service=trade_service,
         order_executor_lookup=order_executor_lookup,
-        portfolio_provider_lookup=portfolio_provider_lookup
+        portfolio_provider_lookup=portfolio_provider_lookup,
+        status_cache=order_status_cache,
     )
     portfolio_service = providers.Factory(
         PortfolioService,
@@ -11,7 +11,10 @@ from .constants import ITEMIZE, ITEMIZED, PER_PAGE, PAGE, ENVIRONMENT, \
     APP_MODE, DATABASE_DIRECTORY_NAME, BACKTESTING_INITIAL_AMOUNT, \
     APPLICATION_DIRECTORY, SNAPSHOT_INTERVAL, AWS_S3_STATE_BUCKET_NAME, \
     LAST_SNAPSHOT_DATETIME, DATA_DIRECTORY, INDEX_DATETIME, \
-    DATETIME_FORMAT_FILE_NAME, DEFAULT_DATETIME_FORMAT
+    DATETIME_FORMAT_FILE_NAME, DEFAULT_DATETIME_FORMAT, DATA_STORAGE_FORMAT, \
+    BACKTEST_DATA_PREPARATION_WORKERS, DATA_FETCH_TIMEOUT, CCXT_MARKETS_TTL, \
+    CCXT_MARKETS_CACHE_TTL, RESAMPLE_BACKTEST_OHLCV_DATA, \
+    IN_MEMORY_BACKTEST_STORAGE, BACKTEST_FAST_FORWARD, BACKTEST_DATABASE_NAME
 from .data_provider import DataProvider
 from .data_structures import PeekableQueue
 from .decimal_parsing import parse_decimal_to_string, parse_string_to_decimal
@@ -21,7 +24,8 @@ from .models import OrderStatus, OrderSide, OrderType, TimeInterval, \
     TimeUnit, TimeFrame, PortfolioConfiguration, Portfolio, Position, \
     Order, TradeStatus, StrategyProfile, Trade, MarketCredential, \
     AppMode, DataType, DataSource, PortfolioSnapshot, PositionSnapshot, \
-    TradeRiskType, TradeTakeProfit, TradeStopLoss, Event, SnapshotInterval
+    TradeRiskType, TradeTakeProfit, TradeStopLoss, Event, SnapshotInterval, \
+    DataStorageFormat
 from .order_executor import OrderExecutor
 from .portfolio_provider import PortfolioProvider
 from .services import MarketCredentialService, AbstractPortfolioSyncService, \
@@ -32,7 +36,10 @@ from .utils import random_string, append_dict_as_row_to_csv, \
     add_column_headers_to_csv, get_total_amount_of_rows, \
     convert_polars_to_pandas, random_number, is_jupyter_notebook, \
     csv_to_list, StoppableThread, load_csv_into_dict, tqdm, \
-    is_timezone_aware, sync_timezones, get_timezone
+    is_timezone_aware, sync_timezones, get_timezone, SlidingWindowIndex, \
+    get_missing_data_gaps, create_missing_data_gaps, \
+    clip_missing_data_gaps, expand_missing_data_gaps, count_data_points, \
+    PriceIndex
 from .backtesting import BacktestRun, BacktestSummaryMetrics, \
     BacktestDateRange, Backtest, BacktestMetrics, combine_backtests, \
     BacktestPermutationTest, BacktestEvaluationFocus, \
@@ -144,5 +151,22 @@ __all__ = [
     'combine_backtests',
     'PositionSize',
     'generate_backtest_summary_metrics',
-    'DataError'
+    'DataError',
+    'SlidingWindowIndex',
+    'PriceIndex',
+    'get_missing_data_gaps',
+    'create_missing_data_gaps',
+    'clip_missing_data_gaps',
+    'expand_missing_data_gaps',
+    'count_data_points',
+    'DataStorageFormat',
+    'DATA_STORAGE_FORMAT',
+    'BACKTEST_DATA_PREPARATION_WORKERS',
+    'DATA_FETCH_TIMEOUT',
+    'CCXT_MARKETS_TTL',
+    'CCXT_MARKETS_CACHE_TTL',
+    'RESAMPLE_BACKTEST_OHLCV_DATA',
+    'IN_MEMORY_BACKTEST_STORAGE',
+    'BACKTEST_FAST_FORWARD',
+    'BACKTEST_DATABASE_NAME',
 ]
@@ -79,5 +79,14 @@ CURRENT_UTC_DATETIME = "CURRENT_UTC_DATETIME"
 SNAPSHOT_INTERVAL = "SNAPSHOT_INTERVAL"
 DATETIME_FORMAT = "DATETIME_FORMAT"
 DATETIME_FORMAT_FILE_NAME = "DATETIME_FORMAT_FILE_NAME"
+DATA_STORAGE_FORMAT = "DATA_STORAGE_FORMAT"
+BACKTEST_DATA_PREPARATION_WORKERS = "BACKTEST_DATA_PREPARATION_WORKERS"
+DATA_FETCH_TIMEOUT = "DATA_FETCH_TIMEOUT"
+CCXT_MARKETS_TTL = "CCXT_MARKETS_TTL"
+CCXT_MARKETS_CACHE_TTL = "CCXT_MARKETS_CACHE_TTL"
+RESAMPLE_BACKTEST_OHLCV_DATA = "RESAMPLE_BACKTEST_OHLCV_DATA"
+IN_MEMORY_BACKTEST_STORAGE = "IN_MEMORY_BACKTEST_STORAGE"
+BACKTEST_FAST_FORWARD = "BACKTEST_FAST_FORWARD"
+BACKTEST_DATABASE_NAME = "BACKTEST_DATABASE_NAME"
 # Deployment
 AWS_S3_STATE_BUCKET_NAME = "AWS_S3_STATE_BUCKET_NAME"
@@ -1,12 +1,18 @@
+import asyncio
 from typing import List, Any, Union
 from abc import ABC, abstractmethod
 from datetime import datetime
+
+import polars as pl
+
 from investing_algorithm_framework.domain.exceptions import \
     ImproperlyConfigured
 from investing_algorithm_framework.domain.models.time_frame import TimeFrame
 from investing_algorithm_framework.domain.models.data.data_type import DataType
 from investing_algorithm_framework.domain.models.data.data_source import \
     DataSource
+from investing_algorithm_framework.domain.utils.data_completeness import \
+    create_missing_data_gaps
 
 
 class DataProvider(ABC):
@@ -214,6 +220,46 @@ class DataProvider(ABC):
         """
         raise NotImplementedError("Subclasses should implement this method.")
 
+    async def get_data_async(
+        self,
+        date: datetime = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        save: bool = False,
+    ) -> Any:
+        """
+        Asynchronous version of get_data, used to fetch the data of
+        multiple data sources concurrently. By default, get_data is
+        run in a worker thread. Data providers that can fetch their
+        data with non-blocking io can override this method.
+
+        Args:
+            start_date (datetime): The start date for the data.
+            end_date (datetime): The end date for the data.
+            date (datetime): The specific date for which to fetch data.
+            save (bool): Whether to save the data to the storage path.
+
+        Returns:
+            Any: The data for the given symbol and date range.
+        """
+        return await asyncio.to_thread(
+            self.get_data,
+            date=date,
+            start_date=start_date,
+            end_date=end_date,
+            save=save,
+        )
+
+    async def close_async(self) -> None:
+        """
+        Closes the resources, such as http sessions, that were opened
+        by get_data_async on the running event loop.
+
+        Returns:
+            None
+        """
+        pass
+
     @abstractmethod
     def prepare_backtest_data(
         self,
@@ -322,6 +368,32 @@ class DataProvider(ABC):
         """
         raise NotImplementedError("Subclasses should implement this method.")
 
+    def get_missing_data_gaps(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> pl.DataFrame:
+        """
+        Returns the gaps in the data between the given start and end
+        dates. By default, the gaps are created from the result of
+        get_missing_data_dates. Data providers can override this method
+        to compute the gaps without creating every missing date.
+
+        Args:
+            start_date (datetime): The start date for checking missing data.
+            end_date (datetime): The end date for checking missing data.
+
+        Returns:
+            pl.DataFrame: A DataFrame with a row for every gap and the
+                columns start, end and length (the number of
+                missing data points).
+        """
+        time_frame = TimeFrame.from_value(self.time_frame)
+        return create_missing_data_gaps(
+            self.get_missing_data_dates(start_date, end_date),
+            f"{time_frame.amount_of_minutes}m"
+        )
+
     @abstractmethod
     def get_data_source_file_path(self) -> Union[str, None]:
         """
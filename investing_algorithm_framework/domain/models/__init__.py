@@ -11,7 +11,7 @@ from .trade import Trade, TradeStatus, TradeStopLoss, TradeTakeProfit, \
     TradeRiskType
 from .snapshot_interval import SnapshotInterval
 from .event import Event
-from .data import DataSource, DataType
+from .data import DataSource, DataType, DataStorageFormat
 
 __all__ = [
     "OrderStatus",
@@ -40,4 +40,5 @@ __all__ = [
     "DataSource",
     "SnapshotInterval",
     "Event",
+    "DataStorageFormat",
 ]
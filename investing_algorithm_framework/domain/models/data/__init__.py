@@ -1,7 +1,9 @@
 from .data_source import DataSource
 from .data_type import DataType
+from .data_storage_format import DataStorageFormat
 
 __all__ = [
     "DataSource",
     "DataType",
+    "DataStorageFormat",
 ]
@@ -0,0 +1,78 @@
+from enum import Enum
+
+
+class DataStorageFormat(Enum):
+    """
+    File formats that can be used to store downloaded OHLCV data.
+
+    CSV is the default format and stays readable for backwards
+    compatibility. PARQUET (zstd compressed) and ARROW (Arrow IPC/Feather)
+    are binary columnar formats that do not need to be parsed on load,
+    support column projection and, for ARROW, memory mapped reads.
+    """
+    CSV = "CSV"
+    PARQUET = "PARQUET"
+    ARROW = "ARROW"
+
+    @staticmethod
+    def from_string(value: str):
+
+        if isinstance(value, str):
+
+            for entry in DataStorageFormat:
+
+                if value.upper() == entry.value:
+                    return entry
+
+            raise ValueError(
+                f"Could not convert {value} to DataStorageFormat"
+            )
+
+    @staticmethod
+    def from_value(value):
+
+        if isinstance(value, str):
+            return DataStorageFormat.from_string(value)
+
+        if isinstance(value, DataStorageFormat):
+
+            for entry in DataStorageFormat:
+
+                if value == entry:
+                    return entry
+
+        raise ValueError(
+            f"Could not convert {value} to DataStorageFormat"
+        )
+
+    @staticmethod
+    def from_file_name(file_name: str):
+        """
+        Returns the storage format of a file based on its extension,
+        or None if the extension is not a supported storage format.
+        """
+
+        for entry in DataStorageFormat:
+
+            if file_name.lower().endswith(entry.file_extension):
+                return entry
+
+        return None
+
+    @property
+    def file_extension(self) -> str:
+
+        if self == DataStorageFormat.PARQUET:
+            return ".parquet"
+
+        if self == DataStorageFormat.ARROW:
+            return ".arrow"
+
+        return ".csv"
+
+    def equals(self, other):
+
+        if isinstance(other, Enum):
+            return self.value == other.value
+        else:
+            return DataStorageFormat.from_string(other) == self
@@ -7,6 +7,11 @@ from .polars import convert_polars_to_pandas
 from .dates import is_timezone_aware, sync_timezones, get_timezone
 from .jupyter_notebook_detection import is_jupyter_notebook
 from .custom_tqdm import tqdm
+from .sliding_window_index import SlidingWindowIndex
+from .price_index import PriceIndex
+from .data_completeness import get_missing_data_gaps, \
+    create_missing_data_gaps, clip_missing_data_gaps, \
+    expand_missing_data_gaps, count_data_points
 
 __all__ = [
     'synchronized',
@@ -23,5 +28,12 @@ __all__ = [
     'sync_timezones',
     'get_timezone',
     'is_jupyter_notebook',
-    'tqdm'
+    'tqdm',
+    'SlidingWindowIndex',
+    'PriceIndex',
+    'get_missing_data_gaps',
+    'create_missing_data_gaps',
+    'clip_missing_data_gaps',
+    'expand_missing_data_gaps',
+    'count_data_points',
 ]
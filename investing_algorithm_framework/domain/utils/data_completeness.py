@@ -0,0 +1,178 @@
+from datetime import datetime
+from typing import List
+
+import polars as pl
+
+MISSING_DATA_GAPS_SCHEMA = {
+    "start": pl.Datetime(time_unit="ms", time_zone="UTC"),
+    "end": pl.Datetime(time_unit="ms", time_zone="UTC"),
+    "length": pl.Int64,
+}
+
+
+def _encode_missing_data_gaps(
+    dates: pl.Series, interval: str
+) -> pl.DataFrame:
+    """
+    Run length encode sorted missing dates into gaps. Two missing
+    dates belong to the same gap when the second date is exactly one
+    interval after the first one.
+    """
+    frame = dates.alias("date").sort().to_frame()
+    return frame.with_columns(
+        pl.col("date").shift(1).dt.offset_by(interval)
+        .ne_missing(pl.col("date")).cum_sum().alias("gap")
+    ).group_by("gap", maintain_order=True).agg(
+        pl.col("date").first().alias("start"),
+        pl.col("date").last().alias("end"),
+        pl.len().cast(pl.Int64).alias("length"),
+    ).drop("gap").cast(MISSING_DATA_GAPS_SCHEMA)
+
+
+def get_missing_data_gaps(
+    data: pl.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    interval: str,
+    datetime_column: str = "Datetime"
+) -> pl.DataFrame:
+    """
+    Get the gaps in the data between the start date and end date
+    (inclusive). The expected dates are a datetime range with the given
+    interval, the dates that are not in the data are run length encoded
+    into gaps.
+
+    Args:
+        data (pl.DataFrame): The data to check.
+        start_date (datetime): The first expected date.
+        end_date (datetime): The last expected date.
+        interval (str): The polars interval between two expected dates,
+            e.g. "1m", "2h" or "1mo".
+        datetime_column (str): The name of the datetime column.
+
+    Returns:
+        pl.DataFrame: A DataFrame with a row for every gap and the
+            columns start, end and length (the number of missing dates).
+    """
+    expected_dates = pl.datetime_range(
+        start=start_date, end=end_date, interval=interval, eager=True
+    ).alias(datetime_column).cast(MISSING_DATA_GAPS_SCHEMA["start"])
+
+    if data is None or len(data) == 0:
+        return _encode_missing_data_gaps(expected_dates, interval)
+
+    actual_dates = data.select(
+        pl.col(datetime_column).cast(MISSING_DATA_GAPS_SCHEMA["start"])
+    )
+    missing_dates = expected_dates.to_frame().join(
+        actual_dates, on=datetime_column, how="anti"
+    )[datetime_column]
+    return _encode_missing_data_gaps(missing_dates, interval)
+
+
+def create_missing_data_gaps(
+    dates: List[datetime], interval: str
+) -> pl.DataFrame:
+    """
+    Create the gaps of a list of missing dates.
+
+    Args:
+        dates (List[datetime]): The missing dates.
+        interval (str): The polars interval between two dates.
+
+    Returns:
+        pl.DataFrame: A DataFrame with a row for every gap and the
+            columns start, end and length.
+    """
+    return _encode_missing_data_gaps(
+        pl.Series(dates, dtype=MISSING_DATA_GAPS_SCHEMA["start"]), interval
+    )
+
+
+def clip_missing_data_gaps(
+    gaps: pl.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    interval: str
+) -> pl.DataFrame:
+    """
+    Clip gaps to the start date and end date (inclusive). Only the
+    gaps that cross the start date or end date are split into dates.
+
+    Args:
+        gaps (pl.DataFrame): The gaps to clip.
+        start_date (datetime): The start date.
+        end_date (datetime): The end date.
+        interval (str): The polars interval between two dates.
+
+    Returns:
+        pl.DataFrame: The gaps between the start date and end date.
+    """
+    gaps = gaps.filter(
+        (pl.col("end") >= start_date) & (pl.col("start") <= end_date)
+    )
+    inside = (pl.col("start") >= start_date) & (pl.col("end") <= end_date)
+    crossing_gaps = gaps.filter(~inside)
+
+    if len(crossing_gaps) == 0:
+        return gaps
+
+    dates = expand_missing_data_gaps(crossing_gaps, interval, as_list=False)
+    dates = dates.filter((dates >= start_date) & (dates <= end_date))
+    return pl.concat(
+        [gaps.filter(inside), _encode_missing_data_gaps(dates, interval)]
+    ).sort("start")
+
+
+def expand_missing_data_gaps(
+    gaps: pl.DataFrame, interval: str, as_list: bool = True
+):
+    """
+    Expand gaps into the missing dates.
+
+    Args:
+        gaps (pl.DataFrame): The gaps to expand.
+        interval (str): The polars interval between two dates.
+        as_list (bool): Whether to return a list of datetimes
+            instead of a polars Series.
+
+    Returns:
+        Union[List[datetime], pl.Series]: The missing dates.
+    """
+    dates = gaps.select(
+        pl.datetime_ranges("start", "end", interval).explode().alias("date")
+    )["date"].drop_nulls().cast(MISSING_DATA_GAPS_SCHEMA["start"])
+
+    if as_list:
+        return dates.to_list()
+
+    return dates
+
+
+def count_data_points(
+    data: pl.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    datetime_column: str = "Datetime"
+) -> int:
+    """
+    Count the rows of sorted data with a datetime between the start
+    date and end date (inclusive) with a binary search.
+
+    Args:
+        data (pl.DataFrame): The data, sorted on the datetime column.
+        start_date (datetime): The start date.
+        end_date (datetime): The end date.
+        datetime_column (str): The name of the datetime column.
+
+    Returns:
+        int: The number of rows between the start date and end date.
+    """
+
+    if data is None or len(data) == 0:
+        return 0
+
+    dates = data[datetime_column]
+    start = dates.search_sorted(start_date, side="left")
+    end = dates.search_sorted(end_date, side="right")
+    return max(int(end) - int(start), 0)
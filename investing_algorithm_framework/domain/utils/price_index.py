@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Union
+
+import numpy as np
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class PriceIndex:
+    """
+    As-of lookup of prices by timestamp.
+
+    The index consists of a sorted int64 array of lookup timestamps
+    (microseconds since the unix epoch) and one float64 array per price
+    column. A lookup is a binary search over the timestamps followed by
+    an array access, no DataFrame is created.
+
+    Attributes:
+        keys (np.ndarray): The sorted lookup timestamps.
+        dates (np.ndarray): The timestamp of the price row of every key.
+        prices (Dict[str, np.ndarray]): The price columns, keyed by
+            column name.
+        valid (np.ndarray): Whether a key has a price row.
+    """
+
+    def __init__(
+        self,
+        keys: np.ndarray,
+        dates: np.ndarray,
+        prices: Dict[str, np.ndarray],
+        valid: np.ndarray = None,
+        time_zone=timezone.utc
+    ):
+        self.keys = keys
+        self.dates = dates
+        self.prices = prices
+
+        if valid is None:
+            valid = np.ones(len(keys), dtype=bool)
+
+        self.valid = valid
+        self._time_zone = time_zone
+
+    def get_as_of(
+        self, date: datetime, direction: str = "next"
+    ) -> Union[Dict[str, Union[datetime, float]], None]:
+        """
+        Get the prices for a given date with as-of semantics, see
+        SlidingWindowIndex.get_as_of.
+
+        Args:
+            date (datetime): The date to get the prices for.
+            direction (str): "next" to select the first timestamp that is
+                equal or after the date, "previous" to select the last
+                timestamp that is equal or before the date.
+
+        Returns:
+            Union[Dict[str, Union[datetime, float]], None]: The datetime
+                of the price row and a price per column, or None if there
+                is no timestamp in the given direction.
+        """
+
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+
+        key = (date - EPOCH) // timedelta(microseconds=1)
+
+        if direction == "next":
+            position = int(np.searchsorted(self.keys, key, side="left"))
+        elif direction == "previous":
+            position = int(np.searchsorted(self.keys, key, side="right")) - 1
+        else:
+            raise ValueError(
+                f"Unknown as-of direction {direction}, "
+                "expected 'previous' or 'next'"
+            )
+
+        if position < 0 or position >= len(self.keys) \
+                or not self.valid[position]:
+            return None
+
+        row_date = EPOCH + timedelta(microseconds=int(self.dates[position]))
+
+        if self._time_zone is None:
+            row_date = row_date.replace(tzinfo=None)
+
+        entry = {"datetime": row_date}
+
+        for column, values in self.prices.items():
+            entry[column] = float(values[position])
+
+        return entry
+
+    def __len__(self) -> int:
+        return len(self.keys)
@@ -0,0 +1,339 @@
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Union
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from .polars import convert_polars_to_pandas
+from .price_index import PriceIndex
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_epoch_microseconds(date: datetime) -> int:
+    """
+    Function to convert a datetime to microseconds since the unix epoch.
+    Naive datetimes are interpreted as UTC.
+
+    Args:
+        date (datetime): The datetime to convert.
+
+    Returns:
+        int: The number of microseconds since the unix epoch.
+    """
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return (date - EPOCH) // timedelta(microseconds=1)
+
+
+class SlidingWindowIndex(Mapping):
+    """
+    Index of sliding windows over a single polars DataFrame.
+
+    Instead of materializing a filtered DataFrame for every timestamp,
+    only the start and end row offsets of each window are stored. A
+    window is returned as a zero-copy DataFrame.slice() view over the
+    loaded data. The index behaves like a read only dictionary that is
+    keyed by the last timestamp of each window.
+
+    Windows can also be returned as pandas DataFrames. The data is then
+    converted to pandas once, and every window is a positional iloc
+    slice of the converted data.
+
+    Attributes:
+        data (pl.DataFrame): The data the windows are sliced from. The
+            data is sorted on the datetime column.
+        datetime_column (str): The name of the datetime column.
+        pandas_data (pd.DataFrame): The data converted to pandas, with
+            the datetime column as index. None until the first pandas
+            window is requested or to_pandas is called.
+    """
+
+    def __init__(
+        self, data: pl.DataFrame = None, datetime_column: str = "Datetime"
+    ):
+        self.data = data
+        self.datetime_column = datetime_column
+        self._keys = np.empty(0, dtype=np.int64)
+        self._starts = np.empty(0, dtype=np.int64)
+        self._ends = np.empty(0, dtype=np.int64)
+        self._time_zone = timezone.utc
+        self.pandas_data = None
+        self._has_duplicate_dates = False
+        self._price_index = None
+
+        if data is not None:
+            data_type = data.schema[datetime_column]
+
+            if getattr(data_type, "time_zone", None) is None:
+                self._time_zone = None
+
+    @staticmethod
+    def from_data(
+        data: pl.DataFrame,
+        window_duration: timedelta,
+        start_date: datetime,
+        end_date: datetime,
+        datetime_column: str = "Datetime"
+    ) -> "SlidingWindowIndex":
+        """
+        Create a sliding window index for every timestamp in the data
+        between the start date and end date (inclusive). The window of a
+        timestamp contains all rows with a datetime between
+        timestamp - window_duration and the timestamp (inclusive).
+
+        Args:
+            data (pl.DataFrame): The data to create the windows over.
+            window_duration (timedelta): The duration of each window.
+            start_date (datetime): The first timestamp to create a
+                window for.
+            end_date (datetime): The last timestamp to create a
+                window for.
+            datetime_column (str): The name of the datetime column.
+
+        Returns:
+            SlidingWindowIndex: The sliding window index.
+        """
+
+        if not data[datetime_column].is_sorted():
+            data = data.sort(datetime_column)
+
+        index = SlidingWindowIndex(data, datetime_column)
+        dates = data[datetime_column].dt.epoch("us").to_numpy()
+        start = to_epoch_microseconds(start_date)
+        end = to_epoch_microseconds(end_date)
+        keys = np.unique(dates[(dates >= start) & (dates <= end)])
+        duration = window_duration // timedelta(microseconds=1)
+        index._keys = keys
+        index._starts = np.searchsorted(dates, keys - duration, side="left")
+        index._ends = np.searchsorted(dates, keys, side="right")
+        return index
+
+    def add(self, date: datetime, start: int, end: int) -> None:
+        """
+        Add a window to the index for a given timestamp.
+
+        Args:
+            date (datetime): The timestamp to register the window for.
+            start (int): The first row offset of the window.
+            end (int): The row offset after the last row of the window.
+
+        Returns:
+            None
+        """
+        key = to_epoch_microseconds(date)
+        position = int(np.searchsorted(self._keys, key, side="left"))
+        self._price_index = None
+
+        if position < len(self._keys) and self._keys[position] == key:
+            self._starts[position] = start
+            self._ends[position] = end
+            return
+
+        self._keys = np.insert(self._keys, position, key)
+        self._starts = np.insert(self._starts, position, start)
+        self._ends = np.insert(self._ends, position, end)
+
+    def _find(self, date: datetime) -> int:
+        key = to_epoch_microseconds(date)
+        position = int(np.searchsorted(self._keys, key, side="left"))
+
+        if position < len(self._keys) and self._keys[position] == key:
+            return position
+
+        return -1
+
+    def _find_as_of(self, date: datetime, direction: str) -> int:
+        key = to_epoch_microseconds(date)
+
+        if direction == "next":
+            position = int(np.searchsorted(self._keys, key, side="left"))
+
+            if position < len(self._keys):
+                return position
+
+            return -1
+
+        if direction == "previous":
+            return int(np.searchsorted(self._keys, key, side="right")) - 1
+
+        raise ValueError(
+            f"Unknown as-of direction {direction}, "
+            "expected 'previous' or 'next'"
+        )
+
+    def get_as_of(
+        self, date: datetime, direction: str = "next", pandas: bool = False
+    ) -> Union[pl.DataFrame, pd.DataFrame, None]:
+        """
+        Get the window for a given date with as-of semantics. If the date
+        is not an exact key of the index, the window of the closest
+        timestamp in the given direction is returned. The lookup is a
+        binary search over the sorted timestamps.
+
+        Args:
+            date (datetime): The date to get the window for.
+            direction (str): "next" to select the first timestamp that is
+                equal or after the date, "previous" to select the last
+                timestamp that is equal or before the date.
+            pandas (bool): Whether to return the window as a pandas
+                DataFrame with the datetime column as index.
+
+        Returns:
+            Union[pl.DataFrame, pd.DataFrame, None]: The window, or None
+                if there is no timestamp in the given direction.
+        """
+        position = self._find_as_of(date, direction)
+
+        if position < 0:
+            return None
+
+        if pandas:
+            return self._pandas_window(position)
+
+        return self._window(position)
+
+    def get_as_of_key(
+        self, date: datetime, direction: str = "next"
+    ) -> Union[datetime, None]:
+        """
+        Get the timestamp of the index that is selected for a given date
+        with as-of semantics, see get_as_of.
+
+        Args:
+            date (datetime): The date to resolve.
+            direction (str): Either "next" or "previous".
+
+        Returns:
+            Union[datetime, None]: The resolved timestamp, or None if
+                there is no timestamp in the given direction.
+        """
+        position = self._find_as_of(date, direction)
+
+        if position < 0:
+            return None
+
+        return self._to_datetime(self._keys[position])
+
+    def _window(self, position: int) -> pl.DataFrame:
+        start = int(self._starts[position])
+        end = int(self._ends[position])
+        return self.data.slice(start, end - start)
+
+    def get_price_index(
+        self, columns=("Open", "High", "Low", "Close", "Volume")
+    ) -> PriceIndex:
+        """
+        Get a price index over the last row of every window. Looking up
+        a date in the price index returns the same prices as the last
+        row of get_as_of for that date, without creating a DataFrame.
+        The price index is created once and cached.
+
+        Args:
+            columns (Tuple[str]): The price columns to add to the index.
+                Columns that are not in the data are skipped.
+
+        Returns:
+            PriceIndex: The price index.
+        """
+
+        if self._price_index is None:
+
+            if self.data is None or len(self.data) == 0:
+                self._price_index = PriceIndex(
+                    keys=self._keys,
+                    dates=np.zeros(len(self._keys), dtype=np.int64),
+                    prices={},
+                    valid=np.zeros(len(self._keys), dtype=bool),
+                    time_zone=self._time_zone
+                )
+                return self._price_index
+
+            # Windows without rows have no price
+            valid = self._ends > self._starts
+            rows = np.where(valid, self._ends - 1, 0)
+            dates = self.data[self.datetime_column].dt.epoch("us").to_numpy()
+            self._price_index = PriceIndex(
+                keys=self._keys,
+                dates=dates[rows],
+                prices={
+                    column.lower(): self.data[column]
+                    .cast(pl.Float64).to_numpy()[rows]
+                    for column in columns if column in self.data.columns
+                },
+                valid=valid,
+                time_zone=self._time_zone
+            )
+
+        return self._price_index
+
+    def _pandas_window(self, position: int) -> pd.DataFrame:
+
+        if self.pandas_data is None:
+            self.to_pandas()
+
+        start = int(self._starts[position])
+        end = int(self._ends[position])
+        # Copy the window, so strategies that add columns to the window
+        # do not change the shared converted data.
+        window = self.pandas_data.iloc[start:end].copy()
+
+        if self._has_duplicate_dates:
+            window = window[~window.index.duplicated(keep="first")]
+
+        return window
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Convert the data of the index to pandas. The conversion is done
+        once, pandas windows are positional slices of the converted data.
+
+        Returns:
+            pd.DataFrame: The converted data with the datetime column
+                as index.
+        """
+
+        if self.pandas_data is None and self.data is not None:
+            # Duplicates are kept, so the row offsets of the windows
+            # stay valid. They are removed per window instead.
+            self._has_duplicate_dates = \
+                self.data[self.datetime_column].is_duplicated().any()
+            self.pandas_data = convert_polars_to_pandas(
+                self.data,
+                remove_duplicates=False,
+                datetime_column_name=self.datetime_column
+            )
+
+        return self.pandas_data
+
+    def _to_datetime(self, key) -> datetime:
+        date = EPOCH + timedelta(microseconds=int(key))
+
+        if self._time_zone is None:
+            return date.replace(tzinfo=None)
+
+        return date
+
+    def __getitem__(self, date: datetime) -> pl.DataFrame:
+        position = self._find(date)
+
+        if position < 0:
+            raise KeyError(date)
+
+        return self._window(position)
+
+    def __contains__(self, date) -> bool:
+        if not isinstance(date, datetime):
+            return False
+
+        return self._find(date) >= 0
+
+    def __iter__(self) -> Iterator[datetime]:
+        for key in self._keys:
+            yield self._to_datetime(key)
+
+    def __len__(self) -> int:
+        return len(self._keys)
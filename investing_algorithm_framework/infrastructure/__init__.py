@@ -1,5 +1,5 @@
 from .database import setup_sqlalchemy, Session, \
-    create_all_tables, clear_db
+    create_all_tables, clear_db, unit_of_work
 from .models import SQLPortfolio, SQLOrder, SQLPosition, \
     SQLPortfolioSnapshot, SQLPositionSnapshot, SQLTrade, \
     SQLTradeTakeProfit, SQLTradeStopLoss
@@ -7,11 +7,18 @@ from .repositories import SQLOrderRepository, SQLPositionRepository, \
     SQLPortfolioRepository, SQLTradeRepository, \
     SQLPortfolioSnapshotRepository, SQLPositionSnapshotRepository, \
     SQLTradeTakeProfitRepository, SQLTradeStopLossRepository, \
-    SQLOrderMetadataRepository
-from .services import AzureBlobStorageStateHandler, AWSS3StorageStateHandler
+    SQLOrderMetadataRepository, InMemoryStore, InMemoryOrderRepository, \
+    InMemoryOrderMetadataRepository, InMemoryPortfolioRepository, \
+    InMemoryPortfolioSnapshotRepository, InMemoryPositionRepository, \
+    InMemoryPositionSnapshotRepository, InMemoryTradeRepository, \
+    InMemoryTradeStopLossRepository, InMemoryTradeTakeProfitRepository
+from .services import AzureBlobStorageStateHandler, \
+    AWSS3StorageStateHandler, CCXTExchangePool
 from .data_providers import CSVOHLCVDataProvider, get_default_data_providers, \
     get_default_ohlcv_data_providers, CCXTOHLCVDataProvider, \
-    PandasOHLCVDataProvider
+    PandasOHLCVDataProvider, read_ohlcv_file, write_ohlcv_file, \
+    scan_ohlcv_file, convert_ohlcv_files, OHLCVStorageCatalog, \
+    MarketRateLimiter
 from .order_executors import CCXTOrderExecutor, BacktestOrderExecutor
 from .portfolio_providers import CCXTPortfolioProvider
 
@@ -25,6 +32,7 @@ __all__ = [
     "SQLPositionSnapshotRepository",
     "setup_sqlalchemy",
     "Session",
+    "unit_of_work",
     "SQLPortfolio",
     "SQLTrade",
     "SQLOrder",
@@ -47,4 +55,21 @@ __all__ = [
     "CCXTOHLCVDataProvider",
     "BacktestOrderExecutor",
     "PandasOHLCVDataProvider",
+    "read_ohlcv_file",
+    "write_ohlcv_file",
+    "scan_ohlcv_file",
+    "convert_ohlcv_files",
+    "OHLCVStorageCatalog",
+    "MarketRateLimiter",
+    "CCXTExchangePool",
+    "InMemoryStore",
+    "InMemoryOrderRepository",
+    "InMemoryOrderMetadataRepository",
+    "InMemoryPortfolioRepository",
+    "InMemoryPortfolioSnapshotRepository",
+    "InMemoryPositionRepository",
+    "InMemoryPositionSnapshotRepository",
+    "InMemoryTradeRepository",
+    "InMemoryTradeStopLossRepository",
+    "InMemoryTradeTakeProfitRepository",
 ]
@@ -1,6 +1,10 @@
 from .ccxt import CCXTOHLCVDataProvider
 from .csv import CSVOHLCVDataProvider
 from .pandas import PandasOHLCVDataProvider
+from .ohlcv_storage import read_ohlcv_file, write_ohlcv_file, \
+    scan_ohlcv_file, convert_ohlcv_files
+from .ohlcv_catalog import OHLCVStorageCatalog
+from .market_rate_limiter import MarketRateLimiter
 
 
 def get_default_data_providers():
@@ -33,4 +37,10 @@ __all__ = [
     'get_default_data_providers',
     'get_default_ohlcv_data_providers',
     'PandasOHLCVDataProvider',
+    'read_ohlcv_file',
+    'write_ohlcv_file',
+    'scan_ohlcv_file',
+    'convert_ohlcv_files',
+    'OHLCVStorageCatalog',
+    'MarketRateLimiter',
 ]
@@ -1,21 +1,33 @@
+import asyncio
 import logging
 import os.path
+import threading
 from datetime import datetime, timedelta, timezone
-from time import sleep
 from typing import Union, List
 
 import ccxt
+import ccxt.async_support as ccxt_async
+import numpy as np
 import pandas as pd
 import polars as pl
-from dateutil import parser
 
 from investing_algorithm_framework.domain import OperationalException, \
-    DATETIME_FORMAT, DataProvider, convert_polars_to_pandas, \
+    DataProvider, convert_polars_to_pandas, \
     NetworkError, TimeFrame, MarketCredential, DataType, DataSource, \
-    RESOURCE_DIRECTORY, CCXT_DATETIME_FORMAT, DATA_DIRECTORY, \
-    DATETIME_FORMAT_FILE_NAME
+    RESOURCE_DIRECTORY, DATA_DIRECTORY, \
+    DATETIME_FORMAT_FILE_NAME, SlidingWindowIndex, DataStorageFormat, \
+    DATA_STORAGE_FORMAT, DATA_FETCH_TIMEOUT, CCXT_MARKETS_TTL, \
+    CCXT_MARKETS_CACHE_TTL, \
+    get_missing_data_gaps, create_missing_data_gaps, \
+    clip_missing_data_gaps, expand_missing_data_gaps, count_data_points
+from .ohlcv_storage import read_ohlcv_file, write_ohlcv_file
+from .ohlcv_catalog import OHLCVStorageCatalog, parse_ohlcv_file_name
+from .market_rate_limiter import MarketRateLimiter
+from ..services import CCXTExchangePool
 
 logger = logging.getLogger("investing_algorithm_framework")
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+CCXT_MARKETS_CACHE_FILE_NAME = ".ccxt_markets_cache.json"
 
 
 class CCXTOHLCVDataProvider(DataProvider):
@@ -26,14 +38,24 @@ class CCXTOHLCVDataProvider(DataProvider):
     If in backtest mode, and the data is already
     available in the storage path, it will be loaded from there. If the
     data is not available in the storage path, it will be fetched from the
-    CCXT library and saved to the storage path in csv format.
+    CCXT library and saved to the storage path in the configured
+    storage format (csv, parquet or arrow).
 
     If the get_data method is called with a start and end date, the
     data provider will look if the data is already available in the
     storage directory. If this is the case, it will read the data
-    from the csv file and return it.
+    from the stored file and return it. Csv files are always readable,
+    regardless of the configured storage format.
 
-    The CSV file should contain the following
+    If a stored file only partially covers the requested date range,
+    only the missing ranges are downloaded and merged into the stored file.
+
+    In live mode, get_data calls with a date keep the last window_size
+    candles in a rolling buffer (live_data). Each call only fetches the
+    candles from the last buffered candle on, where the last buffered
+    candle is replaced because it may still have been forming.
+
+    The stored file should contain the following
     columns: Datetime, Open, High, Low, Close, Volume.
     The Datetime column should be in UTC timezone and in milliseconds.
     The data will be loaded into a Polars DataFrame and will be kept in memory.
@@ -53,6 +75,10 @@ class CCXTOHLCVDataProvider(DataProvider):
     data_type = DataType.OHLCV
     data_provider_identifier = "ccxt_ohlcv_data_provider"
     storage_directory = None
+    _storage_locks = {}
+    _storage_locks_lock = threading.Lock()
+    _async_exchanges = {}
+    _async_exchanges_lock = threading.Lock()
 
     def __init__(
         self,
@@ -63,7 +89,8 @@ class CCXTOHLCVDataProvider(DataProvider):
         data_provider_identifier: str = None,
         storage_directory=None,
         pandas: bool = False,
-        config=None
+        config=None,
+        storage_format=None,
     ):
         """
         Initialize the CCXT OHLCV Data Provider.
@@ -80,6 +107,9 @@ class CCXTOHLCVDataProvider(DataProvider):
                 as a pandas DataFrame instead of a Polars DataFrame.
             storage_directory: (str, optional): the storage directory where
                 the OHLCV data need to be stored.
+            storage_format (Union[str, DataStorageFormat], optional): The
+                file format used to store downloaded data. Defaults to
+                the DATA_STORAGE_FORMAT configuration value or csv.
         """
         if data_provider_identifier is None:
             data_provider_identifier = self.data_provider_identifier
@@ -97,11 +127,16 @@ class CCXTOHLCVDataProvider(DataProvider):
         self._end_date_data_source = None
         self._columns = ["Datetime", "Open", "High", "Low", "Close", "Volume"]
         self.pandas = pandas
-        self.window_cache = {}
+        self.window_cache = SlidingWindowIndex()
         self.data = None
         self.total_number_of_data_points = 0
-        self.missing_data_point_dates = []
+        self.missing_data_gaps = None
         self.data_file_path = None
+        self.storage_format = None
+        self.live_data = None
+
+        if storage_format is not None:
+            self.storage_format = DataStorageFormat.from_value(storage_format)
 
     def has_data(
         self,
@@ -140,29 +175,50 @@ class CCXTOHLCVDataProvider(DataProvider):
             return False
 
         if start_date is not None and end_date is not None:
-            # Check if the data is available in the storage path
-            data = self._get_data_from_storage(
-                symbol=symbol,
-                market=market,
-                time_frame=data_source.time_frame,
-                storage_path=data_source.storage_path,
-                start_date=start_date,
-                end_date=end_date
-            )
+            # Check if the data is available in the storage path, the
+            # catalog answers this without reading the data files.
+            storage_path = data_source.storage_path
+
+            if storage_path is not None and os.path.isdir(storage_path):
+                file_paths = OHLCVStorageCatalog.for_directory(storage_path)\
+                    .find_all(
+                        symbol=symbol,
+                        market=market,
+                        time_frame=data_source.time_frame,
+                        start_date=start_date,
+                        end_date=end_date
+                    )
 
-            if data is not None:
-                return True
+                if len(file_paths) > 0:
+                    return True
 
         if market is None:
             market = "binance"
 
-        # Check if ccxt has an exchange for the given market
+        # Check if ccxt has an exchange for the given market, the
+        # markets are loaded once per exchange in the exchange pool,
+        # and the symbols can be cached on disk across runs.
         try:
-            market = market.lower()
-            exchange_class = getattr(ccxt, market)
-            exchange = exchange_class()
-            symbols = exchange.load_markets()
-            symbols = list(symbols.keys())
+            markets_ttl = None
+            cache_ttl = None
+            cache_file_path = None
+
+            if self.config is not None:
+                markets_ttl = self.config.get(CCXT_MARKETS_TTL)
+                cache_ttl = self.config.get(CCXT_MARKETS_CACHE_TTL)
+                resource_directory = self.config.get(RESOURCE_DIRECTORY)
+
+                if resource_directory is not None:
+                    cache_file_path = os.path.join(
+                        resource_directory, CCXT_MARKETS_CACHE_FILE_NAME
+                    )
+
+            symbols = CCXTExchangePool.get_instance().get_symbols(
+                market,
+                ttl=markets_ttl,
+                cache_file_path=cache_file_path,
+                cache_ttl=cache_ttl
+            )
             return symbol in symbols
 
         except ccxt.NetworkError:
@@ -208,32 +264,38 @@ class CCXTOHLCVDataProvider(DataProvider):
 
         storage_directory_path = self.get_storage_directory()
 
-        # Check if the data source is already available in the storage path
-        data = self._get_data_from_storage(
-            symbol=self.symbol,
-            market=self.market,
-            time_frame=self.time_frame,
-            storage_path=storage_directory_path,
-            start_date=required_start_date,
-            end_date=backtest_end_date
-        )
-
-        if data is None:
+        # Data providers for the same symbol, market and time frame
+        # share their stored files, so they must not download and
+        # merge the same files concurrently.
+        with self._get_storage_lock(storage_directory_path):
 
-            # Disable pandas if it is set to True, because logic
-            # depends on polars DataFrame
-            has_pandas_flag = self.pandas
-            self.pandas = False
-
-            # If the data is not available in the storage path,
-            # retrieve it from the CCXT data provider
-            data = self.get_data(
+            # Check if the data source is already available in the
+            # storage path
+            data = self._get_data_from_storage(
+                symbol=self.symbol,
+                market=self.market,
+                time_frame=self.time_frame,
+                storage_path=storage_directory_path,
                 start_date=required_start_date,
-                end_date=backtest_end_date,
-                save=True,
+                end_date=backtest_end_date
             )
 
-            self.pandas = has_pandas_flag
+            if data is None:
+
+                # Disable pandas if it is set to True, because logic
+                # depends on polars DataFrame
+                has_pandas_flag = self.pandas
+                self.pandas = False
+
+                # If the data is not available in the storage path,
+                # retrieve it from the CCXT data provider
+                data = self.get_data(
+                    start_date=required_start_date,
+                    end_date=backtest_end_date,
+                    save=True,
+                )
+
+                self.pandas = has_pandas_flag
 
         self.data = data
         self._start_date_data_source = self.data["Datetime"].min()
@@ -258,19 +320,8 @@ class CCXTOHLCVDataProvider(DataProvider):
             )
 
         n_min = TimeFrame.from_value(self.time_frame).amount_of_minutes
-        # Assume self.data is a Polars DataFrame with a "Datetime" column
-        expected_dates = pl.datetime_range(
-            start=required_start_date,
-            end=backtest_end_date,
-            interval=f"{n_min}m",
-            eager=True
-        ).to_list()
-
-        actual_dates = self.data["Datetime"].to_list()
-
-        # Find missing dates
-        self.missing_data_point_dates = sorted(
-            set(expected_dates) - set(actual_dates)
+        self.missing_data_gaps = get_missing_data_gaps(
+            self.data, required_start_date, backtest_end_date, f"{n_min}m"
         )
 
     def get_data(
@@ -298,6 +349,225 @@ class CCXTOHLCVDataProvider(DataProvider):
             DataFrame: The data for the given symbol and market.
         """
 
+        start_date, end_date = self._get_date_range(
+            date=date, start_date=start_date, end_date=end_date
+        )
+
+        if self._use_live_data(date, end_date, save):
+            data = self.get_ohlcv(
+                symbol=self.symbol,
+                time_frame=self.time_frame,
+                from_timestamp=self._get_live_data_fetch_date(start_date),
+                market=self.market,
+                to_timestamp=end_date
+            )
+            data = self._update_live_data(data, start_date, end_date)
+
+            if self.pandas:
+                data = convert_polars_to_pandas(data)
+
+            return data
+
+        data = self._get_data_from_storage(
+            symbol=self.symbol,
+            market=self.market,
+            time_frame=self.time_frame,
+            storage_path=self.get_storage_directory(),
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        if data is None:
+            storage_directory = self.get_storage_directory()
+
+            if save and storage_directory is None:
+                raise OperationalException(
+                    "Storage directory is not set for "
+                    "the CCXTOHLCVDataProvider. Make sure to set the "
+                    "storage directory in the configuration or "
+                    "in the constructor."
+                )
+
+            data = self.get_missing_ohlcv(
+                symbol=self.symbol,
+                market=self.market,
+                time_frame=self.time_frame,
+                start_date=start_date,
+                end_date=end_date,
+                storage_directory_path=storage_directory,
+                save=save
+            )
+
+        if self.pandas:
+            data = convert_polars_to_pandas(data)
+
+        return data
+
+    async def get_data_async(
+        self,
+        date: datetime = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        save: bool = False,
+    ) -> Union[pl.DataFrame, pd.DataFrame]:
+        """
+        Asynchronous version of get_data. Data that is not available in
+        the storage directory is downloaded with the ccxt async_support
+        exchange of the market, which is reused between calls on the
+        same event loop. If the data needs to be saved, the download is
+        done with get_data in a worker thread, so that the stored data
+        files are merged in the same way.
+
+        Args:
+            date (datetime, optional): The date for which to retrieve the data.
+            start_date (datetime): The start date for the data.
+            end_date (datetime): The end date for the data.
+            save (bool): If True, the data will be saved to the storage path
+                if it is not already available. Defaults to False.
+
+        Returns:
+            DataFrame: The data for the given symbol and market.
+        """
+
+        if save:
+            return await asyncio.to_thread(
+                self.get_data,
+                date=date,
+                start_date=start_date,
+                end_date=end_date,
+                save=save
+            )
+
+        start_date, end_date = self._get_date_range(
+            date=date, start_date=start_date, end_date=end_date
+        )
+
+        if self._use_live_data(date, end_date, save):
+            data = await self.get_ohlcv_async(
+                symbol=self.symbol,
+                time_frame=self.time_frame,
+                from_timestamp=self._get_live_data_fetch_date(start_date),
+                market=self.market,
+                to_timestamp=end_date
+            )
+            data = self._update_live_data(data, start_date, end_date)
+
+            if self.pandas:
+                data = convert_polars_to_pandas(data)
+
+            return data
+
+        data = self._get_data_from_storage(
+            symbol=self.symbol,
+            market=self.market,
+            time_frame=self.time_frame,
+            storage_path=self.get_storage_directory(),
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        if data is None:
+            data = await self.get_ohlcv_async(
+                symbol=self.symbol,
+                time_frame=self.time_frame,
+                from_timestamp=start_date,
+                market=self.market,
+                to_timestamp=end_date
+            )
+
+        if self.pandas:
+            data = convert_polars_to_pandas(data)
+
+        return data
+
+    def _use_live_data(self, date, end_date, save) -> bool:
+        """
+        Function to check if a get_data call can be served from the
+        rolling live data buffer. This is the case for calls with a
+        date and a window size that do not go back in time and
+        do not need to be saved.
+        """
+
+        if date is None or self.window_size is None or save:
+            return False
+
+        if self.live_data is None or len(self.live_data) == 0:
+            return True
+
+        return self.live_data["Datetime"][-1] <= end_date
+
+    def _get_live_data_fetch_date(self, start_date: datetime) -> datetime:
+        """
+        Function to get the date from which candles need to be fetched
+        to update the live data buffer. The last candle in the buffer is
+        fetched again, because it can still have been forming when it
+        was fetched. If the buffer does not overlap with the window,
+        the full window is fetched.
+        """
+
+        if self.live_data is None or len(self.live_data) == 0:
+            return start_date
+
+        last_date = self.live_data["Datetime"][-1]
+
+        if last_date < start_date:
+            return start_date
+
+        return last_date
+
+    def _update_live_data(
+        self, data: pl.DataFrame, start_date: datetime, end_date: datetime
+    ) -> pl.DataFrame:
+        """
+        Function to merge newly fetched candles into the live data buffer.
+        Fetched candles replace the candles in the buffer from their first
+        date on, candles outside the window are dropped.
+
+        Args:
+            data (pl.DataFrame): The newly fetched candles.
+            start_date (datetime): The start date of the window.
+            end_date (datetime): The end date of the window.
+
+        Returns:
+            pl.DataFrame: The window with the last window_size candles.
+        """
+
+        if self.live_data is not None and len(self.live_data) > 0:
+
+            if len(data) > 0:
+                data = pl.concat(
+                    [
+                        self.live_data.filter(
+                            pl.col("Datetime") < data["Datetime"][0]
+                        ),
+                        data
+                    ],
+                    how="vertical_relaxed"
+                )
+            else:
+                data = self.live_data
+
+        self.live_data = data.filter(
+            (pl.col("Datetime") >= start_date)
+            & (pl.col("Datetime") <= end_date)
+        )
+        return self.live_data
+
+    def _get_date_range(
+        self,
+        date: datetime = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+    ):
+        """
+        Function to determine the date range of a get_data call based on
+        the given date, start date, end date and the window size of
+        the data provider.
+
+        Returns:
+            Tuple[datetime, datetime]: The start and end date.
+        """
+
         if self.market is None:
             raise OperationalException(
                 "Market is not set. Please set the market "
@@ -365,49 +635,8 @@ class CCXTOHLCVDataProvider(DataProvider):
                 time_frame=self.time_frame,
                 window_size=self.window_size
             )
-        data = self._get_data_from_storage(
-            symbol=self.symbol,
-            market=self.market,
-            time_frame=self.time_frame,
-            storage_path=self.get_storage_directory(),
-            start_date=start_date,
-            end_date=end_date
-        )
-
-        if data is None:
-            data = self.get_ohlcv(
-                symbol=self.symbol,
-                time_frame=self.time_frame,
-                from_timestamp=start_date,
-                market=self.market,
-                to_timestamp=end_date
-            )
-
-            if save:
-                storage_directory = self.get_storage_directory()
 
-                if storage_directory is None:
-                    raise OperationalException(
-                        "Storage directory is not set for "
-                        "the CCXTOHLCVDataProvider. Make sure to set the "
-                        "storage directory in the configuration or "
-                        "in the constructor."
-                    )
-
-                self.save_data_to_storage(
-                    symbol=self.symbol,
-                    market=self.market,
-                    time_frame=self.time_frame,
-                    start_date=start_date,
-                    end_date=end_date,
-                    data=data,
-                    storage_directory_path=storage_directory
-                )
-
-        if self.pandas:
-            data = convert_polars_to_pandas(data)
-
-        return data
+        return start_date, end_date
 
     def get_backtest_data(
         self,
@@ -489,36 +718,30 @@ class CCXTOHLCVDataProvider(DataProvider):
                 (pl.col("Datetime") <= backtest_end_date)
             )
         else:
-            try:
-                data = self.window_cache[backtest_index_date]
-            except KeyError:
-
-                try:
-                    # Return the key in the cache that is closest to the
-                    # backtest_index_date but not after it.
-                    closest_key = min(
-                        [k for k in self.window_cache.keys()
-                         if k >= backtest_index_date]
-                    )
-                    data = self.window_cache[closest_key]
-                except ValueError:
+            # Select the window of the first timestamp in the cache
+            # that is equal or after the backtest_index_date.
+            data = self.window_cache.get_as_of(
+                backtest_index_date, direction="next", pandas=self.pandas
+            )
 
-                    if data_source is not None:
-                        raise OperationalException(
-                            "No OHLCV data available for the "
-                            f"date: {backtest_index_date} "
-                            f"within the prepared backtest data "
-                            f"for data source {data_source.identifier}. "
-                        )
+            if data is None:
 
+                if data_source is not None:
                     raise OperationalException(
                         "No OHLCV data available for the "
                         f"date: {backtest_index_date} "
                         f"within the prepared backtest data "
-                        f"for symbol {self.symbol}. "
+                        f"for data source {data_source.identifier}. "
                     )
 
-        if self.pandas:
+                raise OperationalException(
+                    "No OHLCV data available for the "
+                    f"date: {backtest_index_date} "
+                    f"within the prepared backtest data "
+                    f"for symbol {self.symbol}. "
+                )
+
+        if self.pandas and isinstance(data, pl.DataFrame):
             data = convert_polars_to_pandas(data)
 
         return data
@@ -545,64 +768,118 @@ class CCXTOHLCVDataProvider(DataProvider):
         exchange = self.initialize_exchange(market, market_credential)
         time_frame = time_frame.value
 
-        if from_timestamp > to_timestamp:
+        if to_timestamp is not None and from_timestamp > to_timestamp:
             raise OperationalException(
                 "OHLCV data start date must be before end date"
             )
 
-        if self.config is not None and DATETIME_FORMAT in self.config:
-            datetime_format = self.config[DATETIME_FORMAT]
-        else:
-            datetime_format = CCXT_DATETIME_FORMAT
-
         if not exchange.has['fetchOHLCV']:
             raise OperationalException(
                 f"Market service {market} does not support "
                 f"functionality get_ohclvs"
             )
 
-        from_timestamp = exchange.parse8601(
-            from_timestamp.strftime(datetime_format)
-        )
+        from_timestamp = self._to_milliseconds(from_timestamp)
 
         if to_timestamp is None:
             to_timestamp = exchange.milliseconds()
         else:
-            to_timestamp = exchange.parse8601(
-                to_timestamp.strftime(datetime_format)
-            )
+            to_timestamp = self._to_milliseconds(to_timestamp)
         data = []
+        rate_limiter = MarketRateLimiter.get_instance()
 
         try:
             while from_timestamp < to_timestamp:
+                # Requests to the same market share one rate limit
+                # budget, also when data is downloaded concurrently.
+                rate_limiter.acquire(market, exchange.rateLimit / 1000)
                 ohlcv = exchange.fetch_ohlcv(
                     symbol, time_frame, from_timestamp
                 )
 
                 if len(ohlcv) > 0:
+                    # Keep the raw page, candles are decoded at once
+                    # after all pages are downloaded.
+                    data.append(np.asarray(ohlcv, dtype=np.float64))
                     from_timestamp = \
                         ohlcv[-1][0] + \
                         exchange.parse_timeframe(time_frame) * 1000
                 else:
                     from_timestamp = to_timestamp
+        except ccxt.NetworkError as e:
+            logger.error(
+                f"Network error occurred while fetching OHLCV data for "
+                f"{symbol} on {market} with time frame {time_frame}: {e}"
+            )
+            raise NetworkError(
+                "Network error occurred, make sure you have an active "
+                "internet connection"
+            )
 
-                for candle in ohlcv:
-                    datetime_stamp = parser.parse(exchange.iso8601(candle[0]))
+        return self._create_ohlcv_frame(data, to_timestamp)
 
-                    to_timestamp_datetime = parser.parse(
-                        exchange.iso8601(to_timestamp),
-                    )
+    async def get_ohlcv_async(
+        self, symbol, time_frame, from_timestamp, market, to_timestamp=None
+    ) -> pl.DataFrame:
+        """
+        Asynchronous version of get_ohlcv that uses the ccxt async_support
+        exchange of the market. Requests to the same market share the
+        rate limit budget of the synchronous downloads.
+
+        Args:
+            symbol (str): The symbol to retrieve ohlcv data for
+            time_frame: The time frame to retrieve ohlcv data for
+            from_timestamp: The start date to retrieve ohlcv data from
+            market: The market to retrieve ohlcv data from
+            to_timestamp: The end date to retrieve ohlcv data to
+
+        Returns:
+            DataFrame: The ohlcv data for the symbol, time frame and market
+                in polars DataFrame format
+        """
+        symbol = symbol.upper()
+        exchange = self.get_async_exchange(market)
+        time_frame = TimeFrame.from_value(time_frame).value
+
+        if to_timestamp is not None and from_timestamp > to_timestamp:
+            raise OperationalException(
+                "OHLCV data start date must be before end date"
+            )
 
-                    if datetime_stamp <= to_timestamp_datetime:
-                        datetime_stamp = datetime_stamp \
-                            .strftime(datetime_format)
+        if not exchange.has['fetchOHLCV']:
+            raise OperationalException(
+                f"Market service {market} does not support "
+                f"functionality get_ohclvs"
+            )
 
-                        data.append(
-                            [datetime_stamp] +
-                            [float(value) for value in candle[1:]]
-                        )
+        from_timestamp = self._to_milliseconds(from_timestamp)
 
-                sleep(exchange.rateLimit / 1000)
+        if to_timestamp is None:
+            to_timestamp = exchange.milliseconds()
+        else:
+            to_timestamp = self._to_milliseconds(to_timestamp)
+
+        data = []
+        rate_limiter = MarketRateLimiter.get_instance()
+
+        try:
+            while from_timestamp < to_timestamp:
+                await asyncio.sleep(
+                    rate_limiter.reserve(market, exchange.rateLimit / 1000)
+                )
+                ohlcv = await exchange.fetch_ohlcv(
+                    symbol, time_frame, from_timestamp
+                )
+
+                if len(ohlcv) > 0:
+                    # Keep the raw page, candles are decoded at once
+                    # after all pages are downloaded.
+                    data.append(np.asarray(ohlcv, dtype=np.float64))
+                    from_timestamp = \
+                        ohlcv[-1][0] + \
+                        exchange.parse_timeframe(time_frame) * 1000
+                else:
+                    from_timestamp = to_timestamp
         except ccxt.NetworkError as e:
             logger.error(
                 f"Network error occurred while fetching OHLCV data for "
@@ -613,14 +890,221 @@ class CCXTOHLCVDataProvider(DataProvider):
                 "internet connection"
             )
 
-        # Predefined column names
-        col_names = ["Datetime", "Open", "High", "Low", "Close", "Volume"]
+        return self._create_ohlcv_frame(data, to_timestamp)
+
+    @staticmethod
+    def _to_milliseconds(date: datetime) -> int:
+        """
+        Function to convert a datetime to a ccxt millisecond timestamp,
+        naive datetimes are interpreted as UTC.
+        """
+
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+
+        return (date - EPOCH) // timedelta(milliseconds=1)
+
+    @staticmethod
+    def _create_ohlcv_frame(pages, to_timestamp: int) -> pl.DataFrame:
+        """
+        Function to decode the downloaded pages of ccxt candles into a
+        polars DataFrame in one vectorized step. Candles after
+        to_timestamp are filtered out.
+
+        Args:
+            pages (List[np.ndarray]): The downloaded pages, each an array
+                with rows of [timestamp, open, high, low, close, volume].
+            to_timestamp (int): The end timestamp in milliseconds.
 
-        # Combine the Series into a DataFrame with given column names
-        df = pl.DataFrame(data, schema=col_names, orient="row").with_columns(
-            pl.col("Datetime").str.to_datetime(time_unit="ms", time_zone="UTC")
+        Returns:
+            DataFrame: The ohlcv data with a Datetime column in
+                milliseconds in UTC.
+        """
+
+        if len(pages) > 0:
+            candles = np.concatenate(pages)
+        else:
+            candles = np.empty((0, 6), dtype=np.float64)
+
+        timestamps = candles[:, 0].astype(np.int64)
+        return pl.DataFrame(
+            {
+                "Datetime": timestamps,
+                "Open": candles[:, 1],
+                "High": candles[:, 2],
+                "Low": candles[:, 3],
+                "Close": candles[:, 4],
+                "Volume": candles[:, 5],
+            }
+        ).filter(
+            pl.col("Datetime") <= to_timestamp
+        ).with_columns(
+            pl.col("Datetime").cast(
+                pl.Datetime(time_unit="ms", time_zone="UTC")
+            )
         )
-        return df
+
+    def get_missing_ohlcv(
+        self,
+        symbol: str,
+        market: str,
+        time_frame: TimeFrame,
+        start_date: datetime,
+        end_date: datetime,
+        storage_directory_path: str = None,
+        save: bool = False,
+    ) -> pl.DataFrame:
+        """
+        Function to retrieve ohlcv data for a date range that is not
+        fully covered by a stored data file.
+
+        If a stored data file partially covers the date range, only the
+        missing head and/or tail ranges are downloaded. The downloaded
+        data is merged with the stored data and deduplicated on the
+        Datetime column, where downloaded candles replace stored ones.
+        If save is True, the merged data replaces the stored data file.
+
+        If no stored data file overlaps with the date range, the full
+        date range is downloaded.
+
+        Args:
+            symbol (str): The symbol to retrieve ohlcv data for
+            market (str): The market to retrieve ohlcv data from
+            time_frame (TimeFrame): The time frame of the ohlcv data
+            start_date (datetime): The start date of the date range
+            end_date (datetime): The end date of the date range
+            storage_directory_path (str, optional): The storage directory
+                with the stored data files.
+            save (bool): If True, the data is saved to the storage directory.
+
+        Returns:
+            DataFrame: The ohlcv data for the date range
+                in polars DataFrame format
+        """
+        stored_entry = self._get_overlapping_storage_entry(
+            storage_directory_path=storage_directory_path,
+            symbol=symbol,
+            market=market,
+            time_frame=time_frame,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        if stored_entry is None:
+            data = self.get_ohlcv(
+                symbol=symbol,
+                time_frame=time_frame,
+                from_timestamp=start_date,
+                market=market,
+                to_timestamp=end_date
+            )
+
+            if save:
+                self.save_data_to_storage(
+                    symbol=symbol,
+                    market=market,
+                    time_frame=time_frame,
+                    start_date=start_date,
+                    end_date=end_date,
+                    data=data,
+                    storage_directory_path=storage_directory_path
+                )
+
+            return data
+
+        stored_file_path = stored_entry["file_path"]
+        stored_start_date = stored_entry["start_date"]
+        stored_end_date = stored_entry["end_date"]
+        frames = [read_ohlcv_file(stored_file_path)]
+
+        if start_date < stored_start_date:
+            frames.append(
+                self.get_ohlcv(
+                    symbol=symbol,
+                    time_frame=time_frame,
+                    from_timestamp=start_date,
+                    market=market,
+                    to_timestamp=stored_start_date
+                )
+            )
+
+        if end_date > stored_end_date:
+            frames.append(
+                self.get_ohlcv(
+                    symbol=symbol,
+                    time_frame=time_frame,
+                    from_timestamp=stored_end_date,
+                    market=market,
+                    to_timestamp=end_date
+                )
+            )
+
+        data = pl.concat(frames, how="vertical_relaxed")\
+            .unique(subset=["Datetime"], keep="last")\
+            .sort("Datetime")
+
+        if save:
+            file_path = self.save_data_to_storage(
+                symbol=symbol,
+                market=market,
+                time_frame=time_frame,
+                start_date=min(start_date, stored_start_date),
+                end_date=max(end_date, stored_end_date),
+                data=data,
+                storage_directory_path=storage_directory_path
+            )
+
+            # The merged file supersedes the stored file
+            if os.path.abspath(file_path) != \
+                    os.path.abspath(stored_file_path):
+                os.remove(stored_file_path)
+                OHLCVStorageCatalog.for_directory(storage_directory_path)\
+                    .remove(stored_file_path)
+
+        return data.filter(
+            (pl.col("Datetime") >= start_date) &
+            (pl.col("Datetime") <= end_date)
+        )
+
+    def _get_overlapping_storage_entry(
+        self,
+        storage_directory_path,
+        symbol: str,
+        market: str,
+        time_frame: TimeFrame,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Union[dict, None]:
+        """
+        Helper function to find the stored data file that has the largest
+        overlap with the given date range.
+
+        Returns:
+            Union[dict, None]: The catalog entry with the start_date,
+                end_date and file_path of the stored data file, or None
+                if no stored data file overlaps with the date range.
+        """
+
+        if storage_directory_path is None \
+                or not os.path.isdir(storage_directory_path):
+            return None
+
+        catalog = OHLCVStorageCatalog.for_directory(storage_directory_path)
+        best_entry = None
+        best_overlap = None
+
+        for entry in catalog.get_entries(symbol, market, time_frame):
+            overlap = min(entry["end_date"], end_date) \
+                - max(entry["start_date"], start_date)
+
+            if overlap.total_seconds() < 0:
+                continue
+
+            if best_overlap is None or overlap > best_overlap:
+                best_entry = entry
+                best_overlap = overlap
+
+        return best_entry
 
     def create_start_date(self, end_date, time_frame, window_size):
         minutes = TimeFrame.from_value(time_frame).amount_of_minutes
@@ -633,7 +1117,8 @@ class CCXTOHLCVDataProvider(DataProvider):
     @staticmethod
     def initialize_exchange(market, market_credential):
         """
-        Function to initialize the exchange for the market.
+        Function to get the exchange for the market. Exchanges are
+        shared through the CCXTExchangePool.
 
         Args:
             market (str): The market to initialize the exchange for
@@ -643,31 +1128,108 @@ class CCXTOHLCVDataProvider(DataProvider):
         Returns:
             Exchange: CCXT exchange client
         """
+        return CCXTExchangePool.get_instance().get_exchange(
+            market,
+            market_credential,
+            check_credentials=CCXTOHLCVDataProvider.check_credentials
+        )
+
+    @staticmethod
+    def initialize_async_exchange(
+        market, market_credential, timeout: float = None
+    ):
+        """
+        Function to initialize the ccxt async_support exchange for
+        the market.
+
+        Args:
+            market (str): The market to initialize the exchange for
+            market_credential (MarketCredential): The market credential to use
+                for the exchange
+            timeout (float, optional): The request timeout in seconds.
+
+        Returns:
+            Exchange: CCXT async exchange client
+        """
         market = market.lower()
+        exchange_class = getattr(ccxt_async, market, None)
 
-        if not hasattr(ccxt, market):
+        if exchange_class is None:
             raise OperationalException(
                 f"No ccxt exchange for market id {market}"
             )
 
-        exchange_class = getattr(ccxt, market)
+        config = {}
 
-        if exchange_class is None:
-            raise OperationalException(
-                f"No market service found for market id {market}"
-            )
+        if timeout is not None:
+            config["timeout"] = int(timeout * 1000)
 
         if market_credential is not None:
-            # Check the credentials for the exchange
             CCXTOHLCVDataProvider\
                 .check_credentials(exchange_class, market_credential)
-            exchange = exchange_class({
-                'apiKey': market_credential.api_key,
-                'secret': market_credential.secret_key,
-            })
-        else:
-            exchange = exchange_class({})
-        return exchange
+            config["apiKey"] = market_credential.api_key
+            config["secret"] = market_credential.secret_key
+
+        return exchange_class(config)
+
+    def get_async_exchange(self, market):
+        """
+        Function to get the ccxt async_support exchange for the market.
+        Exchanges are shared per event loop, market and api key, so
+        that their http sessions are reused between requests. Must be
+        called from a running event loop.
+
+        Args:
+            market (str): The market to get the exchange for
+
+        Returns:
+            Exchange: CCXT async exchange client
+        """
+        market_credential = self.get_credential(market)
+        key = (
+            id(asyncio.get_running_loop()),
+            market.upper(),
+            market_credential.api_key
+            if market_credential is not None else None
+        )
+
+        with CCXTOHLCVDataProvider._async_exchanges_lock:
+
+            if key not in CCXTOHLCVDataProvider._async_exchanges:
+                timeout = None
+
+                if self.config is not None:
+                    timeout = self.config.get(DATA_FETCH_TIMEOUT)
+
+                CCXTOHLCVDataProvider._async_exchanges[key] = \
+                    self.initialize_async_exchange(
+                        market, market_credential, timeout=timeout
+                    )
+
+            return CCXTOHLCVDataProvider._async_exchanges[key]
+
+    async def close_async(self) -> None:
+        """
+        Function to close the ccxt async_support exchanges that were
+        created on the running event loop.
+
+        Returns:
+            None
+        """
+        loop_id = id(asyncio.get_running_loop())
+
+        with CCXTOHLCVDataProvider._async_exchanges_lock:
+            keys = [
+                key for key in CCXTOHLCVDataProvider._async_exchanges
+                if key[0] == loop_id
+            ]
+            exchanges = [
+                CCXTOHLCVDataProvider._async_exchanges.pop(key)
+                for key in keys
+            ]
+
+        for exchange in exchanges:
+            await exchange.close()
 
     @staticmethod
     def check_credentials(
@@ -721,7 +1283,8 @@ class CCXTOHLCVDataProvider(DataProvider):
         storage_directory_path: str,
     ):
         """
-        Function to save data to the storage path.
+        Function to save data to the storage path. The file is written
+        in the storage format of the data provider.
 
         Args:
             symbol (str): The symbol for which the data is saved.
@@ -733,7 +1296,7 @@ class CCXTOHLCVDataProvider(DataProvider):
             end_date (datetime): The end date for the data.
 
         Returns:
-            None
+            str: The path of the saved data file.
         """
         if storage_directory_path is None:
             raise OperationalException(
@@ -749,18 +1312,17 @@ class CCXTOHLCVDataProvider(DataProvider):
             market=market,
             time_frame=time_frame.value,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            storage_format=self.get_storage_format()
         )
         storage_path = os.path.join(storage_directory_path, filename)
         if os.path.exists(storage_path):
             os.remove(storage_path)
 
-        # Create the file
-        if not os.path.exists(storage_path):
-            with open(storage_path, 'w'):
-                pass
-
-        data.write_csv(storage_path)
+        write_ohlcv_file(data, storage_path)
+        OHLCVStorageCatalog.for_directory(storage_directory_path)\
+            .add(storage_path)
+        return storage_path
 
     def _create_filename(
         self,
@@ -768,7 +1330,8 @@ class CCXTOHLCVDataProvider(DataProvider):
         market: str,
         time_frame: str,
         start_date: datetime,
-        end_date: datetime
+        end_date: datetime,
+        storage_format: DataStorageFormat = DataStorageFormat.CSV
     ) -> str:
         """
         Creates a filename for the data file based on the parameters.
@@ -780,6 +1343,8 @@ class CCXTOHLCVDataProvider(DataProvider):
             time_frame (str): The time frame of the data.
             start_date (datetime): The start date of the data.
             end_date (datetime): The end date of the data.
+            storage_format (DataStorageFormat): The storage format
+                that determines the file extension.
 
         Returns:
             str: The generated filename.
@@ -790,7 +1355,7 @@ class CCXTOHLCVDataProvider(DataProvider):
         end_date_str = end_date.strftime(datetime_format)
         filename = (
             f"OHLCV_{symbol}_{market.upper()}_{time_frame}_{start_date_str}_"
-            f"{end_date_str}.csv"
+            f"{end_date_str}{storage_format.file_extension}"
         )
         return filename
 
@@ -805,7 +1370,9 @@ class CCXTOHLCVDataProvider(DataProvider):
     ) -> Union[pl.DataFrame, None]:
         """
         Helper function to retrieve the data from the storage path if
-        it exists. If the data does not exist, it returns None.
+        it exists. If the data does not exist, it returns None. Covering
+        data files are looked up in the OHLCVStorageCatalog of the
+        storage directory.
 
         Args:
             storage_path (str): The path to the storage.
@@ -823,7 +1390,6 @@ class CCXTOHLCVDataProvider(DataProvider):
         if storage_path is None:
             return None
 
-        # Loop through all files in the data storage path
         if not os.path.isdir(storage_path):
             logger.error(
                 f"Storage path {storage_path} does not exist or is not a "
@@ -831,50 +1397,32 @@ class CCXTOHLCVDataProvider(DataProvider):
             )
             return None
 
-        for file_name in os.listdir(storage_path):
-            if file_name.startswith("OHLCV_") and file_name.endswith(".csv"):
-
-                try:
-                    data_source_spec = self.\
-                        _get_data_source_specification_from_file_name(
-                            file_name
-                        )
-
-                    if data_source_spec is None:
-                        continue
-
-                    if data_source_spec.symbol.upper() == symbol.upper() and \
-                        data_source_spec.market.upper() == market.upper() and \
-                            data_source_spec.time_frame.equals(time_frame):
-                        # Check if the data source specification matches
-                        # the start and end date if its specified
-                        if data_source_spec.start_date is not None and \
-                            data_source_spec.end_date is not None and \
-                                (data_source_spec.start_date <= start_date
-                                 and data_source_spec.end_date >= end_date):
-                            # If the data source specification matches,
-                            # read the file
-                            file_path = os.path.join(storage_path, file_name)
-                            self.data_file_path = file_path
-                            data = pl.read_csv(
-                                file_path,
-                                schema_overrides={"Datetime": pl.Datetime},
-                                low_memory=True
-                            ).with_columns(
-                                pl.col("Datetime").cast(
-                                    pl.Datetime(
-                                        time_unit="ms", time_zone="UTC"
-                                    )
-                                )
-                            )
-                            data = data.filter(
-                                (pl.col("Datetime") >= start_date) &
-                                (pl.col("Datetime") <= end_date)
-                            )
-                            return data
-                except Exception as e:
-                    logger.warning(e)
-                    continue
+        # The catalog returns the covering files ordered by preference,
+        # binary storage formats first and the smallest range first.
+        catalog = OHLCVStorageCatalog.for_directory(storage_path)
+        file_paths = catalog.find_all(
+            symbol=symbol,
+            market=market,
+            time_frame=time_frame,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        for file_path in file_paths:
+
+            try:
+                data = read_ohlcv_file(
+                    file_path,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+                self.data_file_path = file_path
+                return data
+            except Exception as e:
+                logger.warning(e)
+                continue
+
+        return None
 
     def _get_data_source_specification_from_file_name(
         self, file_name: str
@@ -883,7 +1431,8 @@ class CCXTOHLCVDataProvider(DataProvider):
         Extracts the data source specification from the OHLCV data filename.
         Given that the file name is in the format:
 
-        "OHLCV_<SYMBOL>_<MARKET>_<TIME_FRAME>_<START_DATE>_<END_DATE>.csv",
+        "OHLCV_<SYMBOL>_<MARKET>_<TIME_FRAME>_<START_DATE>_<END_DATE>.<EXT>",
+        where <EXT> is the extension of a supported storage format,
         this function extracts all attributes and returns a DataSource object.
         This object can then later be used to compare it to the datasource
         object that is passed to the get_data method.
@@ -895,39 +1444,26 @@ class CCXTOHLCVDataProvider(DataProvider):
             DataSource: The extracted data source specification.
         """
 
-        try:
-            parts = file_name.split('_')
-
-            if len(parts) < 3:
-                return None
-
-            data_type = parts[0].upper()
-            symbol = parts[1].upper().replace('-', '/')
-            market = parts[2].upper()
-            time_frame_str = parts[3]
-            start_date_str = parts[4]
-            end_date_str = parts[5].replace('.csv', '')
-            return DataSource(
-                data_type=DataType.from_string(data_type),
-                symbol=symbol,
-                market=market,
-                time_frame=TimeFrame.from_string(time_frame_str),
-                start_date=parser.parse(
-                    start_date_str
-                ).replace(tzinfo=timezone.utc),
-                end_date=parser.parse(
-                    end_date_str
-                ).replace(tzinfo=timezone.utc)
-            )
-        except ValueError:
+        attributes = parse_ohlcv_file_name(file_name)
+
+        if attributes is None:
             logger.info(
                 f"Could not extract data source attributes from "
                 f"file name: {file_name}. "
                 f"Expected format 'OHLCV_<SYMBOL>_<MARKET>_<TIME_FRAME>_"
-                f"<START_DATE>_<END_DATE>.csv."
+                f"<START_DATE>_<END_DATE>.<EXT>'."
             )
             return None
 
+        return DataSource(
+            data_type=DataType.OHLCV,
+            symbol=attributes["symbol"],
+            market=attributes["market"],
+            time_frame=TimeFrame.from_string(attributes["time_frame"]),
+            start_date=attributes["start_date"],
+            end_date=attributes["end_date"]
+        )
+
     def _precompute_sliding_windows(
         self,
         data,
@@ -949,6 +1485,9 @@ class CCXTOHLCVDataProvider(DataProvider):
         2 to 201, and so on until the last window which will be
         the last 200 rows of the data.
 
+        Only the start and end row offsets of each window are stored,
+        windows are returned as zero-copy slices of the loaded data.
+
         Args:
             data (pl.DataFrame): The data to precompute the sliding
                 windows for.
@@ -961,28 +1500,75 @@ class CCXTOHLCVDataProvider(DataProvider):
         Returns:
             None
         """
-        self.window_cache = {}
-        timestamps = data["Datetime"].to_list()
-        # Only select the entries after the start date
-        timestamps = [
-            ts for ts in timestamps if start_date <= ts <= end_date
-        ]
+        self.window_cache = SlidingWindowIndex.from_data(
+            data=data,
+            window_duration=timedelta(
+                minutes=time_frame.amount_of_minutes * window_size
+            ),
+            start_date=start_date,
+            end_date=end_date
+        )
 
-        # Create sliding windows of size <window_size> for each timestamp
-        # in the data with the given the time frame and window size
-        for timestamp in timestamps:
-            # Use timestamp as key
-            self.window_cache[timestamp] = data.filter(
-                (data["Datetime"] <= timestamp) &
-                (data["Datetime"] >= timestamp - timedelta(
-                    minutes=time_frame.amount_of_minutes * window_size
-                ))
-            )
+        # Convert the data to pandas once, pandas windows are slices of it
+        if self.pandas:
+            self.window_cache.to_pandas()
 
         # Make sure the end datetime of the backtest is included in the
         # sliding windows cache
         if end_date not in self.window_cache:
-            self.window_cache[end_date] = data[-window_size:]
+            number_of_rows = len(self.window_cache.data)
+            self.window_cache.add(
+                end_date,
+                start=max(number_of_rows - window_size, 0),
+                end=number_of_rows
+            )
+
+    def _get_storage_lock(self, storage_directory_path) -> threading.Lock:
+        """
+        Get the lock that guards the stored files of the symbol, market
+        and time frame of this data provider.
+
+        Args:
+            storage_directory_path (str): The storage directory.
+
+        Returns:
+            threading.Lock: The lock of the stored files.
+        """
+        key = (
+            os.path.abspath(storage_directory_path)
+            if storage_directory_path is not None else None,
+            self.symbol.upper(),
+            self.market.upper(),
+            TimeFrame.from_value(self.time_frame).value
+        )
+
+        with CCXTOHLCVDataProvider._storage_locks_lock:
+
+            if key not in CCXTOHLCVDataProvider._storage_locks:
+                CCXTOHLCVDataProvider._storage_locks[key] = threading.Lock()
+
+            return CCXTOHLCVDataProvider._storage_locks[key]
+
+    def get_storage_format(self) -> DataStorageFormat:
+        """
+        Get the storage format that is used to save downloaded data.
+
+        Returns:
+            DataStorageFormat: The storage format of the data provider, the
+                DATA_STORAGE_FORMAT configuration value or csv if
+                neither is set.
+        """
+
+        if self.storage_format is not None:
+            return self.storage_format
+
+        if self.config is not None \
+                and self.config.get(DATA_STORAGE_FORMAT) is not None:
+            return DataStorageFormat.from_value(
+                self.config.get(DATA_STORAGE_FORMAT)
+            )
+
+        return DataStorageFormat.CSV
 
     def get_storage_directory(self) -> Union[str, None]:
         """
@@ -1060,6 +1646,7 @@ class CCXTOHLCVDataProvider(DataProvider):
             storage_directory=storage_path,
             config=self.config,
             pandas=data_source.pandas,
+            storage_format=self.storage_format,
         )
 
     def get_number_of_data_points(
@@ -1080,11 +1667,7 @@ class CCXTOHLCVDataProvider(DataProvider):
             int: The number of available data points between the given
                 start and end dates.
         """
-        available_dates = [
-            date for date in self.data["Datetime"].to_list()
-            if start_date <= date <= end_date
-        ]
-        return len(available_dates)
+        return count_data_points(self.data, start_date, end_date)
 
     def get_missing_data_dates(
         self,
@@ -1103,11 +1686,39 @@ class CCXTOHLCVDataProvider(DataProvider):
             List[datetime]: A list of dates for which data is missing
                 between the given start and end dates.
         """
-        missing_dates = [
-            date for date in self.missing_data_point_dates
-            if start_date < date < end_date
+        n_min = TimeFrame.from_value(self.time_frame).amount_of_minutes
+        missing_dates = expand_missing_data_gaps(
+            self.get_missing_data_gaps(start_date, end_date), f"{n_min}m"
+        )
+        return [
+            date for date in missing_dates if start_date < date < end_date
         ]
-        return missing_dates
+
+    def get_missing_data_gaps(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> pl.DataFrame:
+        """
+        Returns the gaps in the data between the given start and end
+        dates (inclusive).
+
+        Args:
+            start_date (datetime): The start date for checking missing data.
+            end_date (datetime): The end date for checking missing data.
+
+        Returns:
+            pl.DataFrame: A DataFrame with a row for every gap and the
+                columns start, end and length.
+        """
+        n_min = TimeFrame.from_value(self.time_frame).amount_of_minutes
+
+        if self.missing_data_gaps is None:
+            return create_missing_data_gaps([], f"{n_min}m")
+
+        return clip_missing_data_gaps(
+            self.missing_data_gaps, start_date, end_date, f"{n_min}m"
+        )
 
     def get_data_source_file_path(self) -> Union[str, None]:
         """
@@ -5,7 +5,10 @@ import polars as pl
 
 from investing_algorithm_framework.domain import DataProvider, \
     OperationalException, DataSource, DataType, TimeFrame, \
-    convert_polars_to_pandas
+    convert_polars_to_pandas, SlidingWindowIndex, get_missing_data_gaps, \
+    create_missing_data_gaps, clip_missing_data_gaps, \
+    expand_missing_data_gaps, count_data_points, DataStorageFormat
+from .ohlcv_storage import scan_ohlcv_file, read_ohlcv_file_columns
 
 
 class CSVOHLCVDataProvider(DataProvider):
@@ -14,7 +17,13 @@ class CSVOHLCVDataProvider(DataProvider):
     will be loaded from a CSV file. The CSV file should contain
     the following columns: Datetime, Open, High, Low, Close, Volume.
     The Datetime column should be in UTC timezone and in milliseconds.
-    The data will be loaded into a Polars DataFrame and will be kept in memory.
+    Parquet and Arrow IPC files with the same columns are supported as well.
+
+    The file is scanned lazily. On initialization only the header and
+    the Datetime column are read. When preparing backtest data, only
+    the rows within the backtest date range, including the warm-up
+    window, and the selected columns are loaded into a Polars DataFrame
+    and kept in memory.
 
     Attributes:
         data_type (DataType): The type of data provided by this provider,
@@ -26,6 +35,8 @@ class CSVOHLCVDataProvider(DataProvider):
         _end_date_data_source (datetime): The end date of the data
             source, determined from the last row of the data.
         data (polars.DataFrame): The OHLCV data loaded from the CSV file.
+            The full file is loaded on first access if no backtest
+            data has been prepared.
     """
     data_type = DataType.OHLCV
     data_provider_identifier = "csv_ohlcv_data_provider"
@@ -39,6 +50,7 @@ class CSVOHLCVDataProvider(DataProvider):
         window_size=None,
         data_provider_identifier: str = None,
         pandas: bool = False,
+        columns: List[str] = None,
     ):
         """
         Initialize the CSV Data Provider.
@@ -50,6 +62,9 @@ class CSVOHLCVDataProvider(DataProvider):
             market (str, optional): The market for the data. Defaults to None.
             window_size (int, optional): The window size for the data.
                 Defaults to None.
+            columns (List[str], optional): The columns to load. The
+                Datetime column is always loaded. Defaults to all
+                OHLCV columns.
         """
         if data_provider_identifier is None:
             data_provider_identifier = self.data_provider_identifier
@@ -65,11 +80,15 @@ class CSVOHLCVDataProvider(DataProvider):
         self._start_date_data_source = None
         self._end_date_data_source = None
         self._columns = ["Datetime", "Open", "High", "Low", "Close", "Volume"]
-        self.window_cache = {}
+        self.columns = columns
+        self.window_cache = SlidingWindowIndex()
+        self._data = None
+        self._loaded_start_date = None
+        self._loaded_end_date = None
         self._load_data(self.storage_path)
         self.pandas = pandas
         self.number_of_missing_data_points = 0
-        self.missing_data_point_dates: List[datetime] = []
+        self.missing_data_gaps = None
 
     def has_data(
         self,
@@ -161,11 +180,7 @@ class CSVOHLCVDataProvider(DataProvider):
                     self.time_frame
                 ).amount_of_minutes * windows_size
             )
-            df = self.data
-            df = df.filter(
-                (df['Datetime'] >= start_date) & (df['Datetime'] <= end_date)
-            )
-            return df
+            return self._get_data_in_range(start_date, end_date)
 
         if start_date is not None:
             end_date = start_date + timedelta(
@@ -179,11 +194,7 @@ class CSVOHLCVDataProvider(DataProvider):
             if start_date > self._end_date_data_source:
                 return pl.DataFrame()
 
-            df = self.data
-            df = df.filter(
-                (df['Datetime'] >= start_date) & (df['Datetime'] <= end_date)
-            )
-            return df
+            return self._get_data_in_range(start_date, end_date)
 
         if end_date is not None:
             start_date = end_date - timedelta(
@@ -198,11 +209,7 @@ class CSVOHLCVDataProvider(DataProvider):
             if end_date > self._end_date_data_source:
                 return pl.DataFrame()
 
-            df = self.data
-            df = df.filter(
-                (df['Datetime'] >= start_date) & (df['Datetime'] <= end_date)
-            )
-            return df
+            return self._get_data_in_range(start_date, end_date)
 
         return self.data
 
@@ -249,6 +256,13 @@ class CSVOHLCVDataProvider(DataProvider):
                 .amount_of_minutes * self.window_size
             )
 
+        # Only load the rows that are needed for the backtest
+        self._load_data(
+            self.storage_path,
+            start_date=required_start_date,
+            end_date=backtest_end_date
+        )
+
         # Create cache with sliding windows
         self._precompute_sliding_windows(
             window_size=self.window_size,
@@ -264,20 +278,8 @@ class CSVOHLCVDataProvider(DataProvider):
             )
 
         n_min = TimeFrame.from_value(self.time_frame).amount_of_minutes
-
-        # Assume self.data is a Polars DataFrame with a "Datetime" column
-        expected_dates = pl.datetime_range(
-            start=required_start_date,
-            end=backtest_end_date,
-            interval=f"{n_min}m",
-            eager=True
-        ).to_list()
-
-        actual_dates = self.data["Datetime"].to_list()
-
-        # Find missing dates
-        self.missing_data_point_dates = sorted(
-            set(expected_dates) - set(actual_dates)
+        self.missing_data_gaps = get_missing_data_gaps(
+            self.data, required_start_date, backtest_end_date, f"{n_min}m"
         )
 
     def get_backtest_data(
@@ -350,45 +352,58 @@ class CSVOHLCVDataProvider(DataProvider):
                     f"- {self._end_date_data_source}."
                 )
 
-            data = self.data.filter(
-                (pl.col("Datetime") >= backtest_start_date) &
-                (pl.col("Datetime") <= backtest_end_date)
+            data = self._get_data_in_range(
+                backtest_start_date, backtest_end_date
             )
         else:
-            try:
-                data = self.window_cache[backtest_index_date]
-            except KeyError:
-
-                try:
-                    # Return the key in the cache that is closest to the
-                    # backtest_index_date but not after it.
-                    closest_key = min(
-                        [k for k in self.window_cache.keys()
-                         if k >= backtest_index_date]
-                    )
-                    data = self.window_cache[closest_key]
-                except ValueError:
+            # Select the window of the first timestamp in the cache
+            # that is equal or after the backtest_index_date.
+            data = self.window_cache.get_as_of(
+                backtest_index_date, direction="next", pandas=self.pandas
+            )
 
-                    if data_source is not None:
-                        raise OperationalException(
-                            "No data available for the "
-                            f"date: {backtest_index_date} "
-                            "within the prepared backtest data "
-                            f"for data source {data_source.identifier}."
-                        )
+            if data is None:
 
+                if data_source is not None:
                     raise OperationalException(
                         "No data available for the "
                         f"date: {backtest_index_date} "
-                        "within the prepared backtest data."
+                        "within the prepared backtest data "
+                        f"for data source {data_source.identifier}."
                     )
 
-        if self.pandas:
+                raise OperationalException(
+                    "No data available for the "
+                    f"date: {backtest_index_date} "
+                    "within the prepared backtest data."
+                )
+
+        if self.pandas and isinstance(data, pl.DataFrame):
             data = convert_polars_to_pandas(data)
 
         return data
 
-    def _load_data(self, storage_path):
+    @property
+    def data(self) -> pl.DataFrame:
+
+        if self._data is None:
+            self._load_data(self.storage_path, load_all=True)
+
+        return self._data
+
+    @data.setter
+    def data(self, value: pl.DataFrame):
+        self._data = value
+        self._loaded_start_date = None
+        self._loaded_end_date = None
+
+    def _load_data(
+        self,
+        storage_path,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        load_all: bool = False,
+    ):
         """
         Load OHLCV data from a CSV file into a Polars DataFrame.
         The CSV file should contain the following columns:
@@ -397,8 +412,17 @@ class CSVOHLCVDataProvider(DataProvider):
 
         The Datetime column should be in UTC timezone and in milliseconds.
 
+        The file is scanned lazily. Without a date range, only the header
+        is validated and the date range of the data source is determined
+        from the Datetime column. With a date range, the rows in that range
+        are loaded, the date filters and the column projection are pushed
+        down into the scan.
+
         Args:
             storage_path (str): The path to the CSV file containing OHLCV data.
+            start_date (datetime, optional): The first date to load.
+            end_date (datetime, optional): The last date to load.
+            load_all (bool): Load all rows of the file.
 
         Raises:
             OperationalException: If the CSV file does not contain all
@@ -407,33 +431,77 @@ class CSVOHLCVDataProvider(DataProvider):
         Returns:
             None
         """
-        df = pl.read_csv(storage_path)
 
-        # Check if all column names are in the csv file
-        if not all(column in df.columns for column in self._columns):
-            # Identify missing columns
-            missing_columns = [column for column in self._columns if
-                               column not in df.columns]
-            raise OperationalException(
-                f"Csv file {storage_path} does not contain "
-                f"all required ohlcv columns. "
-                f"Missing columns: {missing_columns}"
+        if start_date is None and end_date is None and not load_all:
+            file_columns = read_ohlcv_file_columns(
+                storage_path, default_storage_format=DataStorageFormat.CSV
             )
 
-        self.data = pl.read_csv(
+            # Check if all column names are in the csv file
+            if not all(column in file_columns for column in self._columns):
+                # Identify missing columns
+                missing_columns = [column for column in self._columns if
+                                   column not in file_columns]
+                raise OperationalException(
+                    f"Csv file {storage_path} does not contain "
+                    f"all required ohlcv columns. "
+                    f"Missing columns: {missing_columns}"
+                )
+
+            date_range = scan_ohlcv_file(
+                storage_path,
+                columns=[],
+                default_storage_format=DataStorageFormat.CSV
+            ).select(
+                pl.col("Datetime").first().alias("start"),
+                pl.col("Datetime").last().alias("end"),
+            ).collect()
+            self._start_date_data_source = date_range["start"][0]
+            self._end_date_data_source = date_range["end"][0]
+            return
+
+        self._data = scan_ohlcv_file(
             storage_path,
-            schema_overrides={"Datetime": pl.Datetime},
-            low_memory=True
-        ).with_columns(
-            pl.col("Datetime").cast(
-                pl.Datetime(time_unit="ms", time_zone="UTC")
+            start_date=start_date,
+            end_date=end_date,
+            columns=self.columns,
+            default_storage_format=DataStorageFormat.CSV
+        ).collect()
+        self._loaded_start_date = start_date
+        self._loaded_end_date = end_date
+
+    def _is_loaded(self, start_date: datetime, end_date: datetime) -> bool:
+        """
+        Check if the loaded data covers the date range.
+        """
+        return self._data is not None \
+            and (self._loaded_start_date is None
+                 or self._loaded_start_date <= start_date) \
+            and (self._loaded_end_date is None
+                 or self._loaded_end_date >= end_date)
+
+    def _get_data_in_range(
+        self, start_date: datetime, end_date: datetime
+    ) -> pl.DataFrame:
+        """
+        Get the rows between the start and end date. The rows are taken
+        from the loaded data if the loaded date range covers the
+        requested range, otherwise they are scanned from the file.
+        """
+
+        if self._is_loaded(start_date, end_date):
+            return self._data.filter(
+                (pl.col("Datetime") >= start_date) &
+                (pl.col("Datetime") <= end_date)
             )
-        )
 
-        first_row = self.data.head(1)
-        last_row = self.data.tail(1)
-        self._start_date_data_source = first_row["Datetime"][0]
-        self._end_date_data_source = last_row["Datetime"][0]
+        return scan_ohlcv_file(
+            self.storage_path,
+            start_date=start_date,
+            end_date=end_date,
+            columns=self.columns,
+            default_storage_format=DataStorageFormat.CSV
+        ).collect()
 
     def _precompute_sliding_windows(
         self,
@@ -454,6 +522,9 @@ class CSVOHLCVDataProvider(DataProvider):
         2 to 201, and so on until the last window which will be
         the last 200 rows of the data.
 
+        Only the start and end row offsets of each window are stored,
+        windows are returned as zero-copy slices of the loaded data.
+
         Args:
             window_size (int): The size of the sliding window to precompute.
             start_date (datetime, optional): The start date for the sliding
@@ -464,25 +535,18 @@ class CSVOHLCVDataProvider(DataProvider):
         Returns:
             None
         """
-        self.window_cache = {}
-        timestamps = self.data["Datetime"].to_list()
-
-        # Only select the entries after the start date
-        timestamps = [
-            ts for ts in timestamps
-            if start_date <= ts <= end_date
-        ]
+        self.window_cache = SlidingWindowIndex.from_data(
+            data=self.data,
+            window_duration=timedelta(
+                minutes=self.time_frame.amount_of_minutes * window_size
+            ),
+            start_date=start_date,
+            end_date=end_date
+        )
 
-        # Create sliding windows of size <window_size> for each timestamp
-        # in the data with the given the time frame and window size
-        for timestamp in timestamps:
-            # Use timestamp as key
-            self.window_cache[timestamp] = self.data.filter(
-                (self.data["Datetime"] <= timestamp) &
-                (self.data["Datetime"] >= timestamp - timedelta(
-                    minutes=self.time_frame.amount_of_minutes * window_size
-                ))
-            )
+        # Convert the data to pandas once, pandas windows are slices of it
+        if self.pandas:
+            self.window_cache.to_pandas()
 
     def copy(self, data_source: DataSource) -> "DataProvider":
         """
@@ -507,7 +571,8 @@ class CSVOHLCVDataProvider(DataProvider):
             time_frame=data_source.time_frame,
             market=data_source.market,
             window_size=data_source.window_size,
-            data_provider_identifier=self.data_provider_identifier
+            data_provider_identifier=self.data_provider_identifier,
+            columns=self.columns
         )
 
     def get_number_of_data_points(
@@ -528,11 +593,17 @@ class CSVOHLCVDataProvider(DataProvider):
             int: The number of available data points between the given
                 start and end dates.
         """
-        available_dates = [
-            date for date in self.data["Datetime"].to_list()
-            if start_date <= date <= end_date
-        ]
-        return len(available_dates)
+
+        if self._is_loaded(start_date, end_date):
+            return count_data_points(self._data, start_date, end_date)
+
+        return scan_ohlcv_file(
+            self.storage_path,
+            start_date=start_date,
+            end_date=end_date,
+            columns=[],
+            default_storage_format=DataStorageFormat.CSV
+        ).select(pl.len()).collect().item()
 
     def get_missing_data_dates(
         self,
@@ -551,11 +622,39 @@ class CSVOHLCVDataProvider(DataProvider):
             List[datetime]: A list of dates for which data is missing
                 between the given start and end dates.
         """
-        missing_dates = [
-            date for date in self.missing_data_point_dates
-            if start_date < date < end_date
+        n_min = TimeFrame.from_value(self.time_frame).amount_of_minutes
+        missing_dates = expand_missing_data_gaps(
+            self.get_missing_data_gaps(start_date, end_date), f"{n_min}m"
+        )
+        return [
+            date for date in missing_dates if start_date < date < end_date
         ]
-        return missing_dates
+
+    def get_missing_data_gaps(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> pl.DataFrame:
+        """
+        Returns the gaps in the data between the given start and end
+        dates (inclusive).
+
+        Args:
+            start_date (datetime): The start date for checking missing data.
+            end_date (datetime): The end date for checking missing data.
+
+        Returns:
+            pl.DataFrame: A DataFrame with a row for every gap and the
+                columns start, end and length.
+        """
+        n_min = TimeFrame.from_value(self.time_frame).amount_of_minutes
+
+        if self.missing_data_gaps is None:
+            return create_missing_data_gaps([], f"{n_min}m")
+
+        return clip_missing_data_gaps(
+            self.missing_data_gaps, start_date, end_date, f"{n_min}m"
+        )
 
     def get_data_source_file_path(self) -> Union[str, None]:
         """
@@ -0,0 +1,95 @@
+import threading
+from time import monotonic, sleep
+from typing import Dict
+
+
+class MarketRateLimiter:
+    """
+    Process wide rate limit budget for requests to a market.
+
+    Every market has one shared budget, so requests from all threads
+    to the same market are spaced by at least the minimum interval,
+    while requests to different markets do not wait for each other.
+    This keeps concurrent data downloads within the rate limit of
+    each exchange.
+
+    Use MarketRateLimiter.get_instance to get the shared limiter.
+    """
+    _instance: "MarketRateLimiter" = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._next_request_times: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_instance() -> "MarketRateLimiter":
+        """
+        Get the shared rate limiter of the process.
+
+        Returns:
+            MarketRateLimiter: The shared rate limiter.
+        """
+
+        with MarketRateLimiter._instance_lock:
+
+            if MarketRateLimiter._instance is None:
+                MarketRateLimiter._instance = MarketRateLimiter()
+
+            return MarketRateLimiter._instance
+
+    def reserve(self, market: str, interval: float) -> float:
+        """
+        Reserve the next request slot for a market without waiting.
+        This is used by asynchronous requests, that wait for the slot
+        with asyncio.sleep.
+
+        Args:
+            market (str): The market the request is made to.
+            interval (float): The minimum number of seconds between
+                two requests to the market.
+
+        Returns:
+            float: The number of seconds until the reserved slot.
+        """
+        market = market.upper()
+
+        with self._lock:
+            now = monotonic()
+            request_time = max(
+                now, self._next_request_times.get(market, now)
+            )
+            self._next_request_times[market] = request_time + interval
+
+        return request_time - now
+
+    def acquire(self, market: str, interval: float) -> float:
+        """
+        Reserve the next request slot for a market and wait until
+        the slot is reached.
+
+        Args:
+            market (str): The market the request is made to.
+            interval (float): The minimum number of seconds between
+                two requests to the market.
+
+        Returns:
+            float: The number of seconds that was waited.
+        """
+        wait_time = self.reserve(market, interval)
+
+        if wait_time > 0:
+            sleep(wait_time)
+
+        return wait_time
+
+    def reset(self):
+        """
+        Function to reset the rate limit budgets of all markets.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._next_request_times = {}
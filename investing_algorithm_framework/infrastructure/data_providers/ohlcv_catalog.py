@@ -0,0 +1,439 @@
+import json
+import logging
+import os
+import threading
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Dict, List, Union
+
+from dateutil import parser
+
+from investing_algorithm_framework.domain import DataStorageFormat, \
+    TimeFrame
+
+logger = logging.getLogger("investing_algorithm_framework")
+CATALOG_FILE_NAME = ".ohlcv_catalog.json"
+FILE_NAME_DATETIME_FORMAT = "%Y-%m-%d-%H-%M"
+
+
+def parse_ohlcv_file_name(file_name: str) -> Union[Dict, None]:
+    """
+    Function to extract the data source attributes from an OHLCV data
+    file name. The file name should have the format:
+
+    "OHLCV_<SYMBOL>_<MARKET>_<TIME_FRAME>_<START_DATE>_<END_DATE>.<EXT>"
+
+    Dates in the default file name format are parsed with strptime,
+    other date formats fall back to dateutil.
+
+    Args:
+        file_name (str): The file name to parse.
+
+    Returns:
+        Union[Dict, None]: A dictionary with the symbol, market, time_frame,
+            start_date and end_date, or None if the file name does not
+            have the expected format.
+    """
+
+    if not file_name.startswith("OHLCV_") \
+            or DataStorageFormat.from_file_name(file_name) is None:
+        return None
+
+    parts = os.path.splitext(file_name)[0].split('_')
+
+    if len(parts) < 6:
+        return None
+
+    try:
+        return {
+            "symbol": parts[1].upper().replace('-', '/'),
+            "market": parts[2].upper(),
+            "time_frame": TimeFrame.from_string(parts[3]).value,
+            "start_date": _parse_file_name_date(parts[4]),
+            "end_date": _parse_file_name_date(parts[5]),
+        }
+    except (ValueError, OverflowError):
+        return None
+
+
+def _parse_file_name_date(value: str) -> datetime:
+
+    try:
+        date = datetime.strptime(value, FILE_NAME_DATETIME_FORMAT)
+    except ValueError:
+        date = parser.parse(value)
+
+    return date.replace(tzinfo=timezone.utc)
+
+
+def _to_utc(date: datetime) -> datetime:
+
+    if date.tzinfo is None:
+        return date.replace(tzinfo=timezone.utc)
+
+    return date.astimezone(timezone.utc)
+
+
+class OHLCVStorageCatalog:
+    """
+    Persistent catalog of the OHLCV data files in a storage directory.
+
+    The catalog maps the symbol, market and time frame of each file to
+    its date range and file name, so that data files can be found
+    without listing the directory and parsing every file name. The
+    catalog is stored as a json file in the storage directory. It is
+    refreshed when the modification time of the directory changes, in
+    which case only new file names are parsed.
+
+    Use OHLCVStorageCatalog.for_directory to get the shared catalog
+    instance of a storage directory.
+
+    Attributes:
+        storage_directory (str): The directory with the OHLCV data files.
+    """
+    _catalogs: Dict[str, "OHLCVStorageCatalog"] = {}
+    _catalogs_lock = threading.Lock()
+
+    def __init__(self, storage_directory: str):
+        self.storage_directory = storage_directory
+        self._entries: Dict[str, Dict] = {}
+        self._index: Dict[tuple, List] = {}
+        self._start_dates: Dict[tuple, List[datetime]] = {}
+        self._directory_mtime = None
+        self._lock = threading.RLock()
+        self._load()
+
+    @staticmethod
+    def for_directory(storage_directory: str) -> "OHLCVStorageCatalog":
+        """
+        Get the shared catalog of a storage directory.
+
+        Args:
+            storage_directory (str): The storage directory.
+
+        Returns:
+            OHLCVStorageCatalog: The catalog of the storage directory.
+        """
+        key = os.path.abspath(storage_directory)
+
+        with OHLCVStorageCatalog._catalogs_lock:
+
+            if key not in OHLCVStorageCatalog._catalogs:
+                OHLCVStorageCatalog._catalogs[key] = \
+                    OHLCVStorageCatalog(key)
+
+            return OHLCVStorageCatalog._catalogs[key]
+
+    @property
+    def catalog_file_path(self) -> str:
+        return os.path.join(self.storage_directory, CATALOG_FILE_NAME)
+
+    def _load(self):
+
+        if not os.path.isfile(self.catalog_file_path):
+            return
+
+        try:
+            with open(self.catalog_file_path, "r") as f:
+                catalog = json.load(f)
+
+            for file_name, entry in catalog.get("files", {}).items():
+                self._entries[file_name] = {
+                    "symbol": entry["symbol"],
+                    "market": entry["market"],
+                    "time_frame": entry["time_frame"],
+                    "start_date": datetime.fromisoformat(entry["start_date"]),
+                    "end_date": datetime.fromisoformat(entry["end_date"]),
+                    "mtime": entry.get("mtime"),
+                }
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.warning(
+                f"Could not load OHLCV catalog {self.catalog_file_path}: {e}"
+            )
+            self._entries = {}
+
+        self._rebuild_index()
+
+    def _save(self):
+
+        if not os.path.isdir(self.storage_directory):
+            return
+
+        catalog = {
+            "files": {
+                file_name: {
+                    "symbol": entry["symbol"],
+                    "market": entry["market"],
+                    "time_frame": entry["time_frame"],
+                    "start_date": entry["start_date"].isoformat(),
+                    "end_date": entry["end_date"].isoformat(),
+                    "mtime": entry["mtime"],
+                }
+                for file_name, entry in self._entries.items()
+            }
+        }
+        # Every save uses its own temporary file, because the catalog
+        # can be saved by multiple processes at the same time.
+        temporary_path = f"{self.catalog_file_path}." \
+            f"{os.getpid()}-{threading.get_ident()}.tmp"
+
+        try:
+            with open(temporary_path, "w") as f:
+                json.dump(catalog, f)
+
+            os.replace(temporary_path, self.catalog_file_path)
+        except OSError as e:
+            logger.warning(
+                f"Could not save OHLCV catalog {self.catalog_file_path}: {e}"
+            )
+
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def _rebuild_index(self):
+        index = {}
+
+        for file_name, entry in self._entries.items():
+            key = (entry["symbol"], entry["market"], entry["time_frame"])
+            index.setdefault(key, []).append(
+                (entry["start_date"], entry["end_date"], file_name)
+            )
+
+        for entries in index.values():
+            entries.sort()
+
+        self._index = index
+        self._start_dates = {
+            key: [entry[0] for entry in entries]
+            for key, entries in index.items()
+        }
+
+    def _get_mtime(self, path) -> Union[int, None]:
+
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Synchronize the catalog with the files in the storage directory.
+        The directory is only listed when its modification time changed
+        since the last refresh, or when force is True. Only file names
+        that are not yet in the catalog are parsed.
+
+        Args:
+            force (bool): Refresh even if the directory did not change.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            directory_mtime = self._get_mtime(self.storage_directory)
+
+            if directory_mtime is None:
+                self._entries = {}
+                self._index = {}
+                self._start_dates = {}
+                return
+
+            if not force and directory_mtime == self._directory_mtime:
+                return
+
+            file_names = set(os.listdir(self.storage_directory))
+            changed = False
+
+            for file_name in list(self._entries.keys()):
+
+                if file_name not in file_names:
+                    del self._entries[file_name]
+                    changed = True
+
+            for file_name in file_names:
+                file_path = os.path.join(self.storage_directory, file_name)
+                entry = self._entries.get(file_name)
+
+                if entry is not None:
+                    mtime = self._get_mtime(file_path)
+
+                    if entry["mtime"] != mtime:
+                        entry["mtime"] = mtime
+                        changed = True
+
+                    continue
+
+                attributes = parse_ohlcv_file_name(file_name)
+
+                if attributes is None:
+                    continue
+
+                attributes["mtime"] = self._get_mtime(file_path)
+                self._entries[file_name] = attributes
+                changed = True
+
+            if changed:
+                self._rebuild_index()
+                self._save()
+
+            # Saving the catalog file changes the directory mtime,
+            # so it is read after saving.
+            self._directory_mtime = self._get_mtime(self.storage_directory)
+
+    def add(self, file_path: str) -> None:
+        """
+        Add or update a data file in the catalog, this should be called
+        after a data file has been saved to the storage directory.
+
+        Args:
+            file_path (str): The path of the saved data file.
+
+        Returns:
+            None
+        """
+        file_name = os.path.basename(file_path)
+        attributes = parse_ohlcv_file_name(file_name)
+
+        if attributes is None:
+            return
+
+        with self._lock:
+            self.refresh()
+            attributes["mtime"] = self._get_mtime(file_path)
+            self._entries[file_name] = attributes
+            self._rebuild_index()
+            self._save()
+            self._directory_mtime = self._get_mtime(self.storage_directory)
+
+    def remove(self, file_path: str) -> None:
+        """
+        Remove a data file from the catalog.
+
+        Args:
+            file_path (str): The path of the data file.
+
+        Returns:
+            None
+        """
+        file_name = os.path.basename(file_path)
+
+        with self._lock:
+
+            if self._entries.pop(file_name, None) is not None:
+                self._rebuild_index()
+                self._save()
+                self._directory_mtime = \
+                    self._get_mtime(self.storage_directory)
+
+    def get_entries(
+        self, symbol: str, market: str, time_frame
+    ) -> List[Dict]:
+        """
+        Get all catalog entries for a symbol, market and time frame,
+        sorted by start date.
+
+        Returns:
+            List[Dict]: The entries, each with a start_date, end_date
+                and file_path.
+        """
+        self.refresh()
+        key = (
+            symbol.upper(),
+            market.upper(),
+            TimeFrame.from_value(time_frame).value
+        )
+
+        with self._lock:
+            return [
+                {
+                    "start_date": start,
+                    "end_date": end,
+                    "file_path": os.path.join(
+                        self.storage_directory, file_name
+                    ),
+                }
+                for start, end, file_name in self._index.get(key, [])
+            ]
+
+    def find_all(
+        self,
+        symbol: str,
+        market: str,
+        time_frame,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[str]:
+        """
+        Find all data files that cover the given date range. The files
+        are ordered by preference: binary storage formats before csv,
+        then the smallest covering date range first.
+
+        Args:
+            symbol (str): The symbol of the data.
+            market (str): The market of the data.
+            time_frame (Union[str, TimeFrame]): The time frame of the data.
+            start_date (datetime): The start of the required date range.
+            end_date (datetime): The end of the required date range.
+
+        Returns:
+            List[str]: The paths of the covering data files.
+        """
+        self.refresh()
+        key = (
+            symbol.upper(),
+            market.upper(),
+            TimeFrame.from_value(time_frame).value
+        )
+        start_date = _to_utc(start_date)
+        end_date = _to_utc(end_date)
+
+        with self._lock:
+            entries = self._index.get(key, [])
+
+            # Only entries that start on or before the start date can
+            # cover the range, entries are sorted on start date.
+            position = bisect_right(
+                self._start_dates.get(key, []), start_date
+            )
+            matches = [
+                entry for entry in entries[:position]
+                if entry[1] >= end_date
+            ]
+
+        matches.sort(
+            key=lambda entry: (
+                DataStorageFormat.CSV.equals(
+                    DataStorageFormat.from_file_name(entry[2])
+                ),
+                entry[1] - entry[0]
+            )
+        )
+        return [
+            os.path.join(self.storage_directory, entry[2])
+            for entry in matches
+        ]
+
+    def find(
+        self,
+        symbol: str,
+        market: str,
+        time_frame,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Union[str, None]:
+        """
+        Find the best data file that covers the given date range,
+        see find_all.
+
+        Returns:
+            Union[str, None]: The path of the best covering data file,
+                or None if no file covers the date range.
+        """
+        matches = self.find_all(
+            symbol, market, time_frame, start_date, end_date
+        )
+
+        if len(matches) == 0:
+            return None
+
+        return matches[0]
@@ -0,0 +1,222 @@
+import logging
+import os
+from datetime import datetime
+from typing import List, Union
+
+import polars as pl
+
+from investing_algorithm_framework.domain import OperationalException, \
+    DataStorageFormat
+
+logger = logging.getLogger("investing_algorithm_framework")
+OHLCV_COLUMNS = ["Datetime", "Open", "High", "Low", "Close", "Volume"]
+
+
+def scan_ohlcv_file(
+    file_path: str,
+    start_date: datetime = None,
+    end_date: datetime = None,
+    columns: List[str] = None,
+    default_storage_format: DataStorageFormat = None,
+) -> pl.LazyFrame:
+    """
+    Function to lazily scan an OHLCV data file. The storage format is
+    determined by the file extension, or is the default storage format
+    if the extension is not a supported storage format. Date range
+    filters and the column projection are pushed down into the scan, so
+    that only the requested rows and columns are materialized. Arrow IPC
+    files are memory mapped.
+
+    Args:
+        file_path (str): The path to the OHLCV data file.
+        start_date (datetime, optional): Only select rows with a
+            Datetime equal or after this date.
+        end_date (datetime, optional): Only select rows with a
+            Datetime equal or before this date.
+        columns (List[str], optional): The columns to select. The
+            Datetime column is always selected.
+        default_storage_format (DataStorageFormat, optional): The
+            storage format of files without a supported extension.
+
+    Raises:
+        OperationalException: If the file extension is not a
+            supported storage format and no default storage format
+            is given.
+
+    Returns:
+        pl.LazyFrame: The lazy frame with the Datetime column cast to
+            milliseconds in UTC.
+    """
+    lazy_frame = _scan_file(file_path, default_storage_format).with_columns(
+        pl.col("Datetime").cast(
+            pl.Datetime(time_unit="ms", time_zone="UTC")
+        )
+    )
+
+    if start_date is not None:
+        lazy_frame = lazy_frame.filter(pl.col("Datetime") >= start_date)
+
+    if end_date is not None:
+        lazy_frame = lazy_frame.filter(pl.col("Datetime") <= end_date)
+
+    if columns is not None:
+        lazy_frame = lazy_frame.select(
+            ["Datetime"] + [column for column in columns
+                            if column != "Datetime"]
+        )
+
+    return lazy_frame
+
+
+def _scan_file(
+    file_path: str, default_storage_format: DataStorageFormat = None
+) -> pl.LazyFrame:
+    storage_format = DataStorageFormat.from_file_name(file_path)
+
+    if storage_format is None:
+        storage_format = default_storage_format
+
+    if storage_format is None:
+        raise OperationalException(
+            f"File {file_path} is not a supported OHLCV storage format. "
+            f"Supported extensions are: "
+            f"{[entry.file_extension for entry in DataStorageFormat]}"
+        )
+
+    if DataStorageFormat.PARQUET.equals(storage_format):
+        return pl.scan_parquet(file_path)
+
+    if DataStorageFormat.ARROW.equals(storage_format):
+        return pl.scan_ipc(file_path, memory_map=True)
+
+    return pl.scan_csv(
+        file_path,
+        schema_overrides={"Datetime": pl.Datetime},
+        low_memory=True
+    )
+
+
+def read_ohlcv_file_columns(
+    file_path: str, default_storage_format: DataStorageFormat = None
+) -> List[str]:
+    """
+    Function to read the column names of an OHLCV data file. Only the
+    header (csv) or the schema (parquet, arrow) of the file is read.
+
+    Args:
+        file_path (str): The path to the OHLCV data file.
+        default_storage_format (DataStorageFormat, optional): The
+            storage format of files without a supported extension.
+
+    Returns:
+        List[str]: The column names of the file.
+    """
+    return _scan_file(file_path, default_storage_format) \
+        .collect_schema().names()
+
+
+def read_ohlcv_file(
+    file_path: str,
+    start_date: datetime = None,
+    end_date: datetime = None,
+    columns: List[str] = None,
+) -> pl.DataFrame:
+    """
+    Function to read an OHLCV data file into a polars DataFrame. See
+    scan_ohlcv_file for the supported storage formats and arguments.
+
+    Returns:
+        pl.DataFrame: The OHLCV data.
+    """
+    return scan_ohlcv_file(
+        file_path,
+        start_date=start_date,
+        end_date=end_date,
+        columns=columns,
+    ).collect()
+
+
+def write_ohlcv_file(data: pl.DataFrame, file_path: str) -> None:
+    """
+    Function to write OHLCV data to a file. The storage format is
+    determined by the file extension. Parquet files are zstd compressed,
+    Arrow IPC files are written uncompressed so that they can be
+    memory mapped when read.
+
+    Args:
+        data (pl.DataFrame): The OHLCV data to write.
+        file_path (str): The path of the file to write to.
+
+    Raises:
+        OperationalException: If the file extension is not a
+            supported storage format.
+
+    Returns:
+        None
+    """
+    storage_format = DataStorageFormat.from_file_name(file_path)
+
+    if storage_format is None:
+        raise OperationalException(
+            f"File {file_path} is not a supported OHLCV storage format."
+        )
+
+    if DataStorageFormat.PARQUET.equals(storage_format):
+        data.write_parquet(file_path, compression="zstd")
+    elif DataStorageFormat.ARROW.equals(storage_format):
+        data.write_ipc(file_path, compression="uncompressed")
+    else:
+        data.write_csv(file_path)
+
+
+def convert_ohlcv_files(
+    storage_directory: str,
+    storage_format: Union[str, DataStorageFormat],
+    remove_source_files: bool = False,
+) -> List[str]:
+    """
+    Function to migrate all OHLCV_*.csv files in a storage directory to
+    another storage format. The converted files keep the same name with
+    the extension of the new storage format.
+
+    Args:
+        storage_directory (str): The directory with the OHLCV csv files.
+        storage_format (Union[str, DataStorageFormat]): The storage
+            format to convert the files to.
+        remove_source_files (bool): If True, the csv files are removed
+            after they have been converted.
+
+    Returns:
+        List[str]: The paths of the converted files.
+    """
+    storage_format = DataStorageFormat.from_value(storage_format)
+
+    if not os.path.isdir(storage_directory):
+        raise OperationalException(
+            f"Storage directory {storage_directory} does not exist"
+        )
+
+    converted_files = []
+
+    if DataStorageFormat.CSV.equals(storage_format):
+        return converted_files
+
+    for file_name in sorted(os.listdir(storage_directory)):
+
+        if not file_name.startswith("OHLCV_") \
+                or not file_name.endswith(".csv"):
+            continue
+
+        source_path = os.path.join(storage_directory, file_name)
+        target_path = os.path.join(
+            storage_directory,
+            file_name[:-len(".csv")] + storage_format.file_extension
+        )
+        write_ohlcv_file(read_ohlcv_file(source_path), target_path)
+        converted_files.append(target_path)
+        logger.info(f"Converted {source_path} to {target_path}")
+
+        if remove_source_files:
+            os.remove(source_path)
+
+    return converted_files
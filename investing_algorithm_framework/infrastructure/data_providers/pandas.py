@@ -6,7 +6,9 @@ import polars as pl
 
 from investing_algorithm_framework.domain import DataProvider, \
     OperationalException, DataSource, DataType, TimeFrame, \
-    convert_polars_to_pandas
+    convert_polars_to_pandas, SlidingWindowIndex, get_missing_data_gaps, \
+    create_missing_data_gaps, clip_missing_data_gaps, \
+    expand_missing_data_gaps, count_data_points
 
 
 class PandasOHLCVDataProvider(DataProvider):
@@ -64,11 +66,11 @@ class PandasOHLCVDataProvider(DataProvider):
         self._start_date_data_source = None
         self._end_date_data_source = None
         self._columns = ["Datetime", "Open", "High", "Low", "Close", "Volume"]
-        self.window_cache = {}
+        self.window_cache = SlidingWindowIndex()
         self._load_data(dataframe)
         self.pandas = pandas
         self.total_number_of_data_points = 0
-        self.missing_data_point_dates = []
+        self.missing_data_gaps = None
 
     def has_data(
         self,
@@ -295,19 +297,8 @@ class PandasOHLCVDataProvider(DataProvider):
         )
 
         n_min = TimeFrame.from_value(self.time_frame).amount_of_minutes
-        # Assume self.data is a Polars DataFrame with a "Datetime" column
-        expected_dates = pl.datetime_range(
-            start=required_start_date,
-            end=backtest_end_date,
-            interval=f"{n_min}m",
-            eager=True
-        ).to_list()
-
-        actual_dates = self.data["Datetime"].to_list()
-
-        # Find missing dates
-        self.missing_data_point_dates = sorted(
-            set(expected_dates) - set(actual_dates)
+        self.missing_data_gaps = get_missing_data_gaps(
+            self.data, required_start_date, backtest_end_date, f"{n_min}m"
         )
 
     def get_backtest_data(
@@ -382,35 +373,29 @@ class PandasOHLCVDataProvider(DataProvider):
                 (pl.col("Datetime") <= backtest_end_date)
             )
         else:
-            try:
-                data = self.window_cache[backtest_index_date]
-            except KeyError:
-
-                try:
-                    # Return the key in the cache that is closest to the
-                    # backtest_index_date but not after it.
-                    closest_key = min(
-                        [k for k in self.window_cache.keys()
-                         if k >= backtest_index_date]
-                    )
-                    data = self.window_cache[closest_key]
-                except ValueError:
+            # Select the window of the first timestamp in the cache
+            # that is equal or after the backtest_index_date.
+            data = self.window_cache.get_as_of(
+                backtest_index_date, direction="next", pandas=self.pandas
+            )
 
-                    if data_source is not None:
-                        raise OperationalException(
-                            "No data available for the "
-                            f"date: {backtest_index_date} "
-                            "within the prepared backtest data "
-                            f"for data source {data_source.identifier}."
-                        )
+            if data is None:
 
+                if data_source is not None:
                     raise OperationalException(
                         "No data available for the "
                         f"date: {backtest_index_date} "
-                        "within the prepared backtest data."
+                        "within the prepared backtest data "
+                        f"for data source {data_source.identifier}."
                     )
 
-        if self.pandas:
+                raise OperationalException(
+                    "No data available for the "
+                    f"date: {backtest_index_date} "
+                    "within the prepared backtest data."
+                )
+
+        if self.pandas and isinstance(data, pl.DataFrame):
             data = convert_polars_to_pandas(data)
 
         return data
@@ -490,6 +475,9 @@ class PandasOHLCVDataProvider(DataProvider):
         2 to 201, and so on until the last window which will be
         the last 200 rows of the data.
 
+        Only the start and end row offsets of each window are stored,
+        windows are returned as zero-copy slices of the loaded data.
+
         Args:
             window_size (int): The size of the sliding window to precompute.
             start_date (datetime, optional): The start date for the sliding
@@ -500,25 +488,18 @@ class PandasOHLCVDataProvider(DataProvider):
         Returns:
             None
         """
-        self.window_cache = {}
-        timestamps = self.data["Datetime"].to_list()
-
-        # Only select the entries after the start date
-        timestamps = [
-            ts for ts in timestamps
-            if start_date <= ts <= end_date
-        ]
+        self.window_cache = SlidingWindowIndex.from_data(
+            data=self.data,
+            window_duration=timedelta(
+                minutes=self.time_frame.amount_of_minutes * window_size
+            ),
+            start_date=start_date,
+            end_date=end_date
+        )
 
-        # Create sliding windows of size <window_size> for each timestamp
-        # in the data with the given the time frame and window size
-        for timestamp in timestamps:
-            # Use timestamp as key
-            self.window_cache[timestamp] = self.data.filter(
-                (self.data["Datetime"] <= timestamp) &
-                (self.data["Datetime"] >= timestamp - timedelta(
-                    minutes=self.time_frame.amount_of_minutes * window_size
-                ))
-            )
+        # Convert the data to pandas once, pandas windows are slices of it
+        if self.pandas:
+            self.window_cache.to_pandas()
 
     def copy(self, data_source: DataSource) -> "DataProvider":
         """
@@ -559,11 +540,7 @@ class PandasOHLCVDataProvider(DataProvider):
             int: The number of available data points between the given
                 start and end dates.
         """
-        available_dates = [
-            date for date in self.data["Datetime"].to_list()
-            if start_date <= date <= end_date
-        ]
-        return len(available_dates)
+        return count_data_points(self.data, start_date, end_date)
 
     def get_missing_data_dates(
         self,
@@ -582,11 +559,39 @@ class PandasOHLCVDataProvider(DataProvider):
             List[datetime]: A list of dates for which data is missing
                 between the given start and end dates.
         """
-        missing_dates = [
-            date for date in self.missing_data_point_dates
-            if start_date < date < end_date
+        n_min = TimeFrame.from_value(self.time_frame).amount_of_minutes
+        missing_dates = expand_missing_data_gaps(
+            self.get_missing_data_gaps(start_date, end_date), f"{n_min}m"
+        )
+        return [
+            date for date in missing_dates if start_date < date < end_date
         ]
-        return missing_dates
+
+    def get_missing_data_gaps(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> pl.DataFrame:
+        """
+        Returns the gaps in the data between the given start and end
+        dates (inclusive).
+
+        Args:
+            start_date (datetime): The start date for checking missing data.
+            end_date (datetime): The end date for checking missing data.
+
+        Returns:
+            pl.DataFrame: A DataFrame with a row for every gap and the
+                columns start, end and length.
+        """
+        n_min = TimeFrame.from_value(self.time_frame).amount_of_minutes
+
+        if self.missing_data_gaps is None:
+            return create_missing_data_gaps([], f"{n_min}m")
+
+        return clip_missing_data_gaps(
+            self.missing_data_gaps, start_date, end_date, f"{n_min}m"
+        )
 
     def get_data_source_file_path(self) -> Union[str, None]:
         """
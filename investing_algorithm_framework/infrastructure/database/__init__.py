@@ -1,10 +1,17 @@
 from .sql_alchemy import Session, setup_sqlalchemy, SQLBaseModel, \
-    create_all_tables, clear_db
+    create_all_tables, clear_db, unit_of_work, session_scope, commit, \
+    rollback, get_unit_of_work_session, commit_unit_of_work
 
 __all__ = [
     "Session",
     "setup_sqlalchemy",
     "SQLBaseModel",
     "create_all_tables",
-    "clear_db"
+    "clear_db",
+    "unit_of_work",
+    "session_scope",
+    "commit",
+    "rollback",
+    "get_unit_of_work_session",
+    "commit_unit_of_work",
 ]
@@ -1,4 +1,6 @@
 import logging
+from contextlib import contextmanager
+from threading import local
 
 from sqlalchemy import create_engine, StaticPool
 from sqlalchemy import inspect
@@ -9,6 +11,7 @@ from investing_algorithm_framework.domain import SQLALCHEMY_DATABASE_URI, \
 
 Session = sessionmaker()
 logger = logging.getLogger("investing_algorithm_framework")
+_unit_of_work = local()
 
 
 class SQLAlchemyAdapter:
@@ -39,6 +42,178 @@ def setup_sqlalchemy(app, throw_exception_if_not_set=True):
     return app
 
 
+def get_unit_of_work_session():
+    """
+    Get the session of the unit of work that is active in the current
+    thread.
+
+    Returns:
+        Session: The session of the active unit of work, or None if
+            no unit of work is active.
+    """
+    return getattr(_unit_of_work, "session", None)
+
+
+@contextmanager
+def unit_of_work():
+    """
+    Context manager that groups all repository operations within its
+    scope into a single database transaction. Repositories share the
+    session of the unit of work and only flush their changes, the
+    transaction is committed once when the scope is left. If an
+    exception is raised within the scope, the transaction is rolled back.
+
+    Each repository operation runs in a savepoint of the transaction,
+    so a failing operation only rolls back its own changes. Use
+    commit_unit_of_work to commit the changes made so far, e.g. after
+    an order has been placed on an exchange.
+
+    Nested units of work join the outermost unit of work. Without a
+    database, e.g. when the app uses the in-memory repositories, the
+    unit of work does nothing.
+
+    Yields:
+        Session: The session of the unit of work, or None if no
+            database is set up.
+    """
+    session = get_unit_of_work_session()
+
+    if session is not None:
+        yield session
+        return
+
+    if Session.kw.get("bind") is None:
+        yield None
+        return
+
+    session = Session()
+    _unit_of_work.session = session
+
+    try:
+        _begin_transaction(session)
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        _unit_of_work.session = None
+        session.close()
+
+
+def commit_unit_of_work():
+    """
+    Commit the changes of the active unit of work that have been made so
+    far. The unit of work continues in a new transaction, so a later
+    exception only rolls back the changes made after this commit. Does
+    nothing if no unit of work is active.
+
+    Returns:
+        None
+    """
+    session = get_unit_of_work_session()
+
+    if session is not None:
+        session.commit()
+        _begin_transaction(session)
+
+
+def _begin_transaction(session):
+    # The sqlite driver only begins a transaction before a data
+    # modifying statement. Without it, the first savepoint would begin
+    # the transaction and releasing that savepoint would commit it.
+    connection = session.connection()
+
+    if connection.dialect.name == "sqlite" \
+            and not connection.connection.dbapi_connection.in_transaction:
+        connection.exec_driver_sql("BEGIN")
+
+
+@contextmanager
+def session_scope():
+    """
+    Context manager that provides the session for a single repository
+    operation. Outside a unit of work a new session is created and closed
+    afterwards. Within a unit of work the session of the unit of work is
+    used, and the operation runs in a savepoint of its transaction. The
+    savepoint is released when the scope is left, or rolled back if an
+    exception is raised. All objects are expunged when the scope is
+    left, so that the returned objects are detached in the same way as
+    objects of a closed session.
+
+    Yields:
+        Session: The session for the repository operation.
+    """
+    session = get_unit_of_work_session()
+
+    if session is None:
+        with Session() as db:
+            yield db
+        return
+
+    savepoint = session.begin_nested()
+
+    try:
+        yield session
+    except Exception:
+        _rollback_savepoint(session, savepoint)
+        session.expunge_all()
+        raise
+
+    if savepoint.is_active:
+        savepoint.commit()
+    else:
+        _rollback_savepoint(session, savepoint)
+
+    session.expunge_all()
+
+
+def _rollback_savepoint(session, savepoint):
+    # A failed flush deactivates the savepoint, which then still has to
+    # be rolled back. A savepoint that has already been rolled back is
+    # no longer the nested transaction of the session.
+    if savepoint is not None \
+            and session.get_nested_transaction() is savepoint:
+        savepoint.rollback()
+
+
+def commit(session):
+    """
+    Commit the changes of a session. Within a unit of work the changes
+    are only flushed, and committed when the unit of work is left.
+
+    Args:
+        session: The session to commit.
+
+    Returns:
+        None
+    """
+
+    if session is get_unit_of_work_session():
+        session.flush()
+        session.expunge_all()
+    else:
+        session.commit()
+
+
+def rollback(session):
+    """
+    Roll back the changes of a session. Within a unit of work only the
+    savepoint of the current repository operation is rolled back, the
+    changes of earlier operations are kept.
+
+    Args:
+        session: The session to roll back.
+
+    Returns:
+        None
+    """
+
+    if session is get_unit_of_work_session():
+        _rollback_savepoint(session, session.get_nested_transaction())
+    else:
+        session.rollback()
+
 
 class SQLBaseModel(DeclarativeBase):
     pass
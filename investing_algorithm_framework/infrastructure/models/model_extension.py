@@ -1,6 +1,54 @@
+from copy import deepcopy
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+
 class SQLAlchemyModelExtension:
 
     def update(self, data):
 
         for attr, value in data.items():
             setattr(self, attr, value)
+
+    def __deepcopy__(self, memo):
+        """
+        Create a detached copy of the object, with copies of its loaded
+        related objects. Changes to the copy do not affect the object,
+        and the copy can be saved in the same way as the object.
+
+        Args:
+            memo (dict): The objects that have already been copied.
+
+        Returns:
+            The copied object.
+        """
+        state = inspect(self)
+        mapper = state.mapper
+        copied = mapper.class_manager.new_instance()
+        memo[id(self)] = copied
+
+        for key, value in state.dict.items():
+
+            if key == "_sa_instance_state":
+                continue
+
+            if key in mapper.relationships:
+                relationship = mapper.relationships[key]
+
+                if relationship.uselist:
+                    value = [deepcopy(item, memo) for item in value]
+                elif value is not None:
+                    value = deepcopy(value, memo)
+
+                set_committed_value(copied, key, value)
+            elif key in mapper.column_attrs:
+                set_committed_value(copied, key, value)
+            else:
+                copied.__dict__[key] = deepcopy(value, memo)
+
+        if state.key is not None:
+            make_transient_to_detached(copied)
+
+        return copied
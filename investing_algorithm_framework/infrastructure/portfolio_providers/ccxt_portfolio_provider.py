@@ -4,6 +4,8 @@ from typing import Union
 
 from investing_algorithm_framework.domain import PortfolioProvider, \
     OperationalException, Order, Position, MarketCredential
+from investing_algorithm_framework.infrastructure.services import \
+    CCXTExchangePool
 
 
 logger = getLogger("investing_algorithm_framework")
@@ -111,38 +113,31 @@ class CCXTPortfolioProvider(PortfolioProvider):
     @staticmethod
     def initialize_exchange(market, market_credential):
         """
-        Function to initialize the exchange for the market.
+        Function to get the exchange for the market. Exchanges are
+        shared through the CCXTExchangePool.
 
         Args:
             market (str): The market to initialize the exchange for
             market_credential (MarketCredential): The market credential to use
                 for the exchange
 
+        Raises:
+            OperationalException: If no market credential is given
+
         Returns:
 
         """
-        market = market.lower()
 
-        if not hasattr(ccxt, market):
+        if market_credential is None:
             raise OperationalException(
-                f"No ccxt exchange for market id {market}"
+                f"No market credential for market {market}"
             )
 
-        exchange_class = getattr(ccxt, market)
-
-        if exchange_class is None:
-            raise OperationalException(
-                f"No market service found for market id {market}"
-            )
-
-        # Check the credentials for the exchange
-        (CCXTPortfolioProvider
-         .check_credentials(exchange_class, market_credential))
-        exchange = exchange_class({
-            'apiKey': market_credential.api_key,
-            'secret': market_credential.secret_key,
-        })
-        return exchange
+        return CCXTExchangePool.get_instance().get_exchange(
+            market,
+            market_credential,
+            check_credentials=CCXTPortfolioProvider.check_credentials
+        )
 
     @staticmethod
     def check_credentials(
@@ -7,6 +7,11 @@ from .position_snapshot_repository import SQLPositionSnapshotRepository
 from .trade_repository import SQLTradeRepository
 from .trade_stop_loss_repository import SQLTradeStopLossRepository
 from .trade_take_profit_repository import SQLTradeTakeProfitRepository
+from .in_memory import InMemoryStore, InMemoryOrderRepository, \
+    InMemoryOrderMetadataRepository, InMemoryPortfolioRepository, \
+    InMemoryPortfolioSnapshotRepository, InMemoryPositionRepository, \
+    InMemoryPositionSnapshotRepository, InMemoryTradeRepository, \
+    InMemoryTradeStopLossRepository, InMemoryTradeTakeProfitRepository
 
 __all__ = [
     "SQLOrderRepository",
@@ -17,5 +22,15 @@ __all__ = [
     "SQLTradeRepository",
     "SQLTradeTakeProfitRepository",
     "SQLTradeStopLossRepository",
-    "SQLOrderMetadataRepository"
+    "SQLOrderMetadataRepository",
+    "InMemoryStore",
+    "InMemoryOrderRepository",
+    "InMemoryOrderMetadataRepository",
+    "InMemoryPortfolioRepository",
+    "InMemoryPortfolioSnapshotRepository",
+    "InMemoryPositionRepository",
+    "InMemoryPositionSnapshotRepository",
+    "InMemoryTradeRepository",
+    "InMemoryTradeStopLossRepository",
+    "InMemoryTradeTakeProfitRepository",
 ]
@@ -0,0 +1,26 @@
+from .repository import InMemoryStore, InMemoryQuery, InMemoryRepository
+from .order_repository import InMemoryOrderRepository
+from .order_metadata_repository import InMemoryOrderMetadataRepository
+from .portfolio_repository import InMemoryPortfolioRepository
+from .portfolio_snapshot_repository import \
+    InMemoryPortfolioSnapshotRepository
+from .position_repository import InMemoryPositionRepository
+from .position_snapshot_repository import InMemoryPositionSnapshotRepository
+from .trade_repository import InMemoryTradeRepository
+from .trade_stop_loss_repository import InMemoryTradeStopLossRepository
+from .trade_take_profit_repository import InMemoryTradeTakeProfitRepository
+
+__all__ = [
+    "InMemoryStore",
+    "InMemoryQuery",
+    "InMemoryRepository",
+    "InMemoryOrderRepository",
+    "InMemoryOrderMetadataRepository",
+    "InMemoryPortfolioRepository",
+    "InMemoryPortfolioSnapshotRepository",
+    "InMemoryPositionRepository",
+    "InMemoryPositionSnapshotRepository",
+    "InMemoryTradeRepository",
+    "InMemoryTradeStopLossRepository",
+    "InMemoryTradeTakeProfitRepository",
+]
@@ -0,0 +1,16 @@
+from investing_algorithm_framework.infrastructure.models import \
+    SQLOrderMetadata
+from .repository import InMemoryRepository
+
+
+class InMemoryOrderMetadataRepository(InMemoryRepository):
+    base_class = SQLOrderMetadata
+    indexes = ("order_id",)
+    DEFAULT_NOT_FOUND_MESSAGE = "The requested order metadata was not found"
+
+    def _apply_query_params(self, db, query, query_params):
+
+        if "order_id" in query_params:
+            query = query.filter_by(order_id=query_params["order_id"])
+
+        return query
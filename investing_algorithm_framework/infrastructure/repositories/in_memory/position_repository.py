@@ -0,0 +1,69 @@
+import operator
+
+from investing_algorithm_framework.infrastructure.models import SQLPosition, \
+    SQLOrder
+from .repository import InMemoryRepository
+
+
+class InMemoryPositionRepository(InMemoryRepository):
+    base_class = SQLPosition
+    indexes = ("symbol", "portfolio_id")
+    DEFAULT_NOT_FOUND_MESSAGE = "Position not found"
+
+    def _apply_query_params(self, db, query, query_params):
+        id_query_param = self.get_query_param("id", query_params)
+        amount_query_param = self.get_query_param("amount", query_params)
+        symbol_query_param = self.get_query_param("symbol", query_params)
+        portfolio_query_param = self.get_query_param("portfolio", query_params)
+        amount_gt_query_param = self.get_query_param("amount_gt", query_params)
+        amount_gte_query_param = self.get_query_param(
+            "amount_gte", query_params
+        )
+        amount_lt_query_param = self.get_query_param("amount_lt", query_params)
+        amount_lte_query_param = self.get_query_param(
+            "amount_lte", query_params
+        )
+        order_id_query_param = self.get_query_param("order_id", query_params)
+
+        if id_query_param:
+            query = query.filter_by(id=id_query_param)
+
+        if amount_query_param:
+            query = query.filter_by(amount=amount_query_param)
+
+        if symbol_query_param:
+            query = query.filter_by(symbol=symbol_query_param)
+
+        if portfolio_query_param is not None:
+            query = query.filter_by(portfolio_id=portfolio_query_param)
+
+        if amount_gt_query_param is not None:
+            query = query.filter(
+                "amount", operator.gt, amount_gt_query_param
+            )
+
+        if amount_gte_query_param is not None:
+            query = query.filter(
+                "amount", operator.ge, amount_gte_query_param
+            )
+
+        if amount_lt_query_param is not None:
+            query = query.filter(
+                "amount", operator.lt, amount_lt_query_param
+            )
+
+        if amount_lte_query_param:
+            query = query.filter(
+                "amount", operator.le, amount_lte_query_param
+            )
+
+        if order_id_query_param:
+            order = db.query(SQLOrder).filter_by(id=order_id_query_param)\
+                .first()
+
+            if order is None:
+                query = query.filter_none()
+            else:
+                query = query.filter_by(id=order["position_id"])
+
+        return query
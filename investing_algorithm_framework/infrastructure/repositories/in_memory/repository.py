@@ -0,0 +1,854 @@
+import logging
+from datetime import datetime
+from threading import RLock
+
+from sqlalchemy import Boolean, DateTime, Float, Integer, String, inspect
+from sqlalchemy.orm import RelationshipDirection
+from sqlalchemy.orm.attributes import set_committed_value
+
+from investing_algorithm_framework.domain import OperationalException
+from investing_algorithm_framework.infrastructure.database.sql_alchemy \
+    import attach_utc_timezone_on_load
+from ..repository import Repository
+
+logger = logging.getLogger("investing_algorithm_framework")
+
+EAGER_LOADING_STRATEGIES = ("joined", "selectin", "subquery", "immediate")
+
+
+def coerce_value(column, value):
+    """
+    Coerce a value to the type of a column in the same way as the
+    SQLite database of the SQL repositories does. Datetimes are stored
+    without their timezone, numbers are stored as the numeric type of
+    the column and other values in a string column are stored as string.
+
+    Args:
+        column: The SQLAlchemy column of the value.
+        value: The value to coerce.
+
+    Returns:
+        The coerced value.
+    """
+
+    if value is None:
+        return None
+
+    column_type = column.type
+
+    if isinstance(column_type, DateTime):
+
+        if isinstance(value, datetime):
+            return value.replace(tzinfo=None)
+
+        return value
+
+    if isinstance(column_type, Boolean):
+        return bool(value)
+
+    try:
+        if isinstance(column_type, Integer) \
+                and isinstance(value, (str, float)):
+            return int(value)
+
+        if isinstance(column_type, Float) and not isinstance(value, float):
+            return float(value)
+    except (TypeError, ValueError):
+        return value
+
+    if isinstance(column_type, String) and not isinstance(value, str):
+        return str(value)
+
+    return value
+
+
+def _get_column_default(default):
+
+    if default is None:
+        return None
+
+    if default.is_callable:
+        return default.arg(None)
+
+    if default.is_scalar:
+        return default.arg
+
+    return None
+
+
+def _get_sort_key(column):
+
+    def sort_key(row):
+        value = row[column]
+        # Null values come first, as in SQLite
+        return value is not None, value
+
+    return sort_key
+
+
+class InMemoryStore:
+    """
+    Dict based storage of the in-memory repositories.
+
+    A table is a dict of rows keyed by primary key, where a row is a dict
+    of column values. Secondary indexes map a column value to the
+    primary keys of the rows with that value. Many-to-many relationships
+    are stored as association rows in insertion order.
+
+    The store maps SQLAlchemy model instances to rows in the same way as
+    a database session does. Loaded instances are new objects that are
+    not shared between callers, a save only writes the columns and
+    relationships that changed since the instance was loaded or saved,
+    and the eagerly loaded relationships of a model are loaded with it.
+
+    Attributes:
+        tables (dict): The rows of every table, keyed by table name.
+        indexes (dict): The secondary indexes of every table, keyed by
+            table name and column name.
+        associations (dict): The rows of every association table, keyed
+            by table name.
+    """
+
+    def __init__(self):
+        self.lock = RLock()
+        self.tables = {}
+        self.indexes = {}
+        self.associations = {}
+        self._sequences = {}
+
+    def clear(self):
+        """
+        Remove all rows from the store. The secondary index definitions
+        are kept.
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.tables = {}
+            self.associations = {}
+            self._sequences = {}
+            self.indexes = {
+                table: {column: {} for column in columns}
+                for table, columns in self.indexes.items()
+            }
+
+    def create_index(self, table, *columns):
+        """
+        Create secondary indexes on columns of a table. Existing rows
+        are indexed, existing indexes are left untouched.
+
+        Args:
+            table (str): The name of the table.
+            *columns (str): The names of the columns to index.
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            table_indexes = self.indexes.setdefault(table, {})
+
+            for column in columns:
+
+                if column in table_indexes:
+                    continue
+
+                index = {}
+
+                for key, row in self.tables.get(table, {}).items():
+                    index.setdefault(row.get(column), set()).add(key)
+
+                table_indexes[column] = index
+
+    def lookup(self, table, column, value):
+        """
+        Look up the primary keys of the rows with a value in a column.
+
+        Args:
+            table (str): The name of the table.
+            column (str): The name of the column.
+            value: The value to look up.
+
+        Returns:
+            Union[set, None]: The primary keys of the matching rows, or
+                None if the column is not indexed.
+        """
+
+        if column == "id":
+            return {value} if value in self.tables.get(table, {}) else set()
+
+        index = self.indexes.get(table, {}).get(column)
+
+        if index is None:
+            return None
+
+        return index.get(value, set())
+
+    def get_row(self, table, key):
+        return self.tables.get(table, {}).get(key)
+
+    def get_keys(self, table):
+        return self.tables.get(table, {}).keys()
+
+    def insert(self, table, row):
+        """
+        Insert a row into a table. A primary key is assigned to the row
+        if it has none.
+
+        Args:
+            table (str): The name of the table.
+            row (dict): The column values of the row.
+
+        Returns:
+            The primary key of the row.
+        """
+
+        with self.lock:
+            rows = self.tables.setdefault(table, {})
+
+            if row.get("id") is None:
+                row["id"] = self._sequences.get(table, 0) + 1
+            elif row["id"] in rows:
+                raise OperationalException("Error creating object")
+
+            if isinstance(row["id"], int):
+                self._sequences[table] = max(
+                    self._sequences.get(table, 0), row["id"]
+                )
+
+            rows[row["id"]] = dict(row)
+
+            for column, index in self.indexes.get(table, {}).items():
+                index.setdefault(row.get(column), set()).add(row["id"])
+
+            return row["id"]
+
+    def update(self, table, key, values):
+        """
+        Update columns of a row.
+
+        Args:
+            table (str): The name of the table.
+            key: The primary key of the row.
+            values (dict): The new column values.
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            row = self.get_row(table, key)
+
+            if row is None:
+                raise OperationalException("Error updating object")
+
+            for column, index in self.indexes.get(table, {}).items():
+
+                if column in values and values[column] != row.get(column):
+                    index[row.get(column)].discard(key)
+                    index.setdefault(values[column], set()).add(key)
+
+            row.update(values)
+
+    def delete(self, table, key):
+        """
+        Delete a row from a table.
+
+        Args:
+            table (str): The name of the table.
+            key: The primary key of the row.
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            row = self.tables.get(table, {}).pop(key, None)
+
+            if row is None:
+                return
+
+            for column, index in self.indexes.get(table, {}).items():
+                index[row.get(column)].discard(key)
+
+    def add_association(self, table, row):
+        rows = self.associations.setdefault(table, {})
+        rows[tuple(sorted(row.items()))] = None
+
+    def remove_association(self, table, row):
+        rows = self.associations.get(table, {})
+        rows.pop(tuple(sorted(row.items())), None)
+
+    def get_associated(self, table, column, value, other_column):
+        """
+        Get the values of a column of the association rows that have a
+        value in another column, in insertion order.
+
+        Args:
+            table (str): The name of the association table.
+            column (str): The column to match the value on.
+            value: The value to match.
+            other_column (str): The column to return the values of.
+
+        Returns:
+            list: The matching values.
+        """
+        associated = []
+
+        for key in self.associations.get(table, {}):
+            row = dict(key)
+
+            if row[column] == value:
+                associated.append(row[other_column])
+
+        return associated
+
+    def query(self, model):
+        return InMemoryQuery(self, model)
+
+    def load(self, model, row):
+        """
+        Create a model instance from a row. The eagerly loaded
+        relationships of the model are loaded with it, the lazily
+        loaded relationships are left unloaded.
+
+        Args:
+            model: The SQLAlchemy model class.
+            row (dict): The row to load.
+
+        Returns:
+            The model instance.
+        """
+        mapper = inspect(model)
+        instance = mapper.class_manager.new_instance()
+
+        for key, value in row.items():
+            set_committed_value(instance, key, value)
+
+        collections = {}
+
+        for relationship in mapper.relationships:
+
+            if relationship.lazy not in EAGER_LOADING_STRATEGIES:
+                continue
+
+            target = relationship.mapper.class_
+            target_table = relationship.mapper.local_table.name
+            keys = self._get_related_keys(relationship, row)
+            rows = [self.get_row(target_table, key) for key in keys]
+            related = [
+                self.load(target, related_row) for related_row in rows
+                if related_row is not None
+            ]
+
+            if relationship.uselist:
+                set_committed_value(instance, relationship.key, related)
+                collections[relationship.key] = set(keys)
+            else:
+                set_committed_value(
+                    instance,
+                    relationship.key,
+                    related[0] if len(related) > 0 else None
+                )
+
+        attach_utc_timezone_on_load(instance, None)
+        instance._in_memory_state = {
+            "columns": dict(row), "collections": collections
+        }
+        return instance
+
+    def _get_related_keys(self, relationship, row):
+
+        if relationship.secondary is not None:
+            local_column = relationship.synchronize_pairs[0][1].name
+            remote_column = \
+                relationship.secondary_synchronize_pairs[0][1].name
+            return self.get_associated(
+                relationship.secondary.name,
+                local_column,
+                row[relationship.synchronize_pairs[0][0].key],
+                remote_column
+            )
+
+        local, remote = relationship.local_remote_pairs[0]
+        target_table = relationship.mapper.local_table.name
+
+        if relationship.direction is RelationshipDirection.MANYTOONE:
+            value = row.get(local.key)
+            return [] if value is None else [value]
+
+        self.create_index(target_table, remote.key)
+        return sorted(self.lookup(target_table, remote.key, row[local.key]))
+
+    def save(self, instance, saved=None):
+        """
+        Save a model instance and, as with the save-update cascade of a
+        database session, the related instances in its loaded
+        relationships.
+
+        Args:
+            instance: The model instance to save.
+            saved (set): The ids of the instances that are already saved
+                in this operation.
+
+        Returns:
+            None
+        """
+
+        if saved is None:
+            saved = set()
+
+        if id(instance) in saved:
+            return
+
+        saved.add(id(instance))
+
+        with self.lock:
+            mapper = inspect(type(instance))
+            loaded = inspect(instance).dict
+
+            for relationship in mapper.relationships:
+
+                if relationship.direction \
+                        is not RelationshipDirection.MANYTOONE:
+                    continue
+
+                parent = loaded.get(relationship.key)
+
+                if parent is None:
+                    continue
+
+                self.save(parent, saved)
+
+                for local, remote in relationship.local_remote_pairs:
+                    setattr(instance, local.key, getattr(parent, remote.key))
+
+            self._save_columns(mapper, instance, loaded)
+            collections = {}
+
+            for relationship in mapper.relationships:
+
+                if relationship.direction \
+                        is RelationshipDirection.MANYTOONE \
+                        or relationship.lazy == "dynamic" \
+                        or relationship.key not in loaded:
+                    continue
+
+                collections[relationship.key] = self._save_collection(
+                    relationship, instance, loaded[relationship.key], saved
+                )
+
+            instance._in_memory_state["collections"] = collections
+
+    def _save_columns(self, mapper, instance, loaded):
+        table = mapper.local_table.name
+        state = getattr(instance, "_in_memory_state", None)
+        row = {}
+
+        for column_property in mapper.column_attrs:
+            column = column_property.columns[0]
+            value = coerce_value(column, loaded.get(column_property.key))
+
+            if value is None and state is None:
+                value = _get_column_default(column.default)
+
+                if value is not None:
+                    setattr(instance, column_property.key, value)
+                    value = coerce_value(column, value)
+
+            row[column_property.key] = value
+
+        if state is None:
+            key = self.insert(table, row)
+
+            if instance.id is None:
+                instance.id = key
+        else:
+            changes = {
+                column: value for column, value in row.items()
+                if value != state["columns"].get(column)
+            }
+
+            if len(changes) > 0:
+
+                # Apply the onupdate defaults of the columns that
+                # are not explicitly changed, as the database would
+                for column_property in mapper.column_attrs:
+                    column = column_property.columns[0]
+
+                    if column.onupdate is None \
+                            or column_property.key in changes:
+                        continue
+
+                    value = _get_column_default(column.onupdate)
+                    setattr(instance, column_property.key, value)
+                    value = coerce_value(column, value)
+                    row[column_property.key] = value
+                    changes[column_property.key] = value
+
+                self.update(table, row["id"], changes)
+
+        instance._in_memory_state = {
+            "columns": row,
+            "collections": state["collections"] if state else {}
+        }
+
+    def _save_collection(self, relationship, instance, related, saved):
+        state = instance._in_memory_state
+        previous = state["collections"].get(relationship.key)
+
+        if not relationship.uselist:
+            related = [] if related is None else [related]
+
+        if relationship.secondary is not None:
+            table = relationship.secondary.name
+            local_column = relationship.synchronize_pairs[0][1].name
+            remote_column = \
+                relationship.secondary_synchronize_pairs[0][1].name
+
+            for item in related:
+                self.save(item, saved)
+
+            keys = [item.id for item in related]
+
+            for key in keys:
+
+                if previous is None or key not in previous:
+                    self.add_association(
+                        table, {local_column: instance.id, remote_column: key}
+                    )
+
+            for key in (previous or set()) - set(keys):
+                self.remove_association(
+                    table, {local_column: instance.id, remote_column: key}
+                )
+
+            return set(keys)
+
+        target_table = relationship.mapper.local_table.name
+
+        for item in related:
+
+            for local, remote in relationship.local_remote_pairs:
+                setattr(item, remote.key, getattr(instance, local.key))
+
+            self.save(item, saved)
+
+        keys = {item.id for item in related}
+
+        # Orphaned rows are detached from the instance
+        for key in (previous or set()) - keys:
+
+            if self.get_row(target_table, key) is not None:
+                self.update(
+                    target_table,
+                    key,
+                    {
+                        remote.key: None
+                        for _, remote in relationship.local_remote_pairs
+                    }
+                )
+
+        return keys
+
+    def delete_instance(self, model, key):
+        """
+        Delete the row of a model instance. The rows of relationships
+        with a delete cascade are deleted as well, other related rows
+        are detached.
+
+        Args:
+            model: The SQLAlchemy model class.
+            key: The primary key of the instance.
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            mapper = inspect(model)
+            row = self.get_row(mapper.local_table.name, key)
+
+            if row is None:
+                return
+
+            for relationship in mapper.relationships:
+
+                if relationship.direction \
+                        is RelationshipDirection.MANYTOONE:
+                    continue
+
+                related_keys = self._get_related_keys(relationship, row)
+
+                if relationship.secondary is not None:
+                    local_column = relationship.synchronize_pairs[0][1].name
+                    remote_column = \
+                        relationship.secondary_synchronize_pairs[0][1].name
+
+                    for related_key in related_keys:
+                        self.remove_association(
+                            relationship.secondary.name,
+                            {local_column: key, remote_column: related_key}
+                        )
+                elif relationship.cascade.delete:
+
+                    for related_key in related_keys:
+                        self.delete_instance(
+                            relationship.mapper.class_, related_key
+                        )
+                else:
+                    target_table = relationship.mapper.local_table.name
+
+                    for related_key in related_keys:
+                        self.update(
+                            target_table,
+                            related_key,
+                            {
+                                remote.key: None for _, remote
+                                in relationship.local_remote_pairs
+                            }
+                        )
+
+            self.delete(mapper.local_table.name, key)
+
+
+class InMemoryQuery:
+    """
+    Query over the rows of a table of an in-memory store. Equality
+    filters on indexed columns are resolved with the secondary indexes,
+    other filters are evaluated on the remaining rows.
+
+    Rows are returned in primary key order unless the query is ordered,
+    which is the scan order of the SQLite tables of the SQL repositories.
+    """
+
+    def __init__(self, store, model):
+        self.store = store
+        self.model = model
+        self.table = model.__tablename__
+        self._columns = model.__table__.columns
+        self._keys = None
+        self._predicates = []
+        self._order_by = None
+
+    def _restrict(self, keys):
+
+        if self._keys is None:
+            self._keys = set(keys)
+        else:
+            self._keys &= set(keys)
+
+    def filter_by(self, **kwargs):
+        """
+        Filter the rows on column values.
+        """
+
+        for column, value in kwargs.items():
+            value = coerce_value(self._columns[column], value)
+            keys = self.store.lookup(self.table, column, value)
+
+            if keys is None:
+                self._predicates.append(
+                    lambda row, c=column, v=value: row[c] == v
+                )
+            else:
+                self._restrict(keys)
+
+        return self
+
+    def filter_in(self, column, values):
+        """
+        Filter the rows on a column value that is one of the given values.
+        """
+        values = {
+            coerce_value(self._columns[column], value) for value in values
+        }
+        keys = set()
+
+        for value in values:
+            matches = self.store.lookup(self.table, column, value)
+
+            if matches is None:
+                self._predicates.append(
+                    lambda row, c=column, v=values: row[c] in v
+                )
+                return self
+
+            keys |= matches
+
+        self._restrict(keys)
+        return self
+
+    def filter(self, column, comparison, value):
+        """
+        Filter the rows on a comparison of a column value with the
+        given value, e.g. filter("amount", operator.gt, 0). As in SQL,
+        rows with a null value never match.
+        """
+        value = coerce_value(self._columns[column], value)
+        self._predicates.append(
+            lambda row: row[column] is not None
+            and value is not None
+            and comparison(row[column], value)
+        )
+        return self
+
+    def filter_none(self):
+        self._keys = set()
+        return self
+
+    def order_by(self, column, descending=False):
+        self._order_by = (column, descending)
+        return self
+
+    def _rows(self):
+
+        if self._keys is None:
+            keys = self.store.get_keys(self.table)
+        else:
+            keys = self._keys
+
+        for key in sorted(keys):
+            row = self.store.get_row(self.table, key)
+
+            if row is not None \
+                    and all(predicate(row) for predicate in self._predicates):
+                yield row
+
+    def all(self):
+        rows = list(self._rows())
+
+        if self._order_by is not None:
+            column, descending = self._order_by
+            rows.sort(key=_get_sort_key(column), reverse=descending)
+
+        return rows
+
+    def first(self):
+
+        if self._order_by is not None:
+            rows = self.all()
+            return rows[0] if len(rows) > 0 else None
+
+        return next(self._rows(), None)
+
+    def count(self):
+        return sum(1 for _ in self._rows())
+
+    def keys(self):
+        return [row["id"] for row in self._rows()]
+
+
+class InMemoryRepository(Repository):
+    """
+    Repository that stores its objects in an in-memory store instead of
+    a database. It supports the same operations and query parameters as
+    the SQL repository of the same model, the query parameters are
+    applied to an InMemoryQuery.
+
+    Attributes:
+        store (InMemoryStore): The store of the repository, shared by
+            all in-memory repositories of an app.
+        indexes (tuple): The columns of the model that are indexed.
+    """
+    indexes = ()
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+        self.store.create_index(self.base_class.__tablename__, *self.indexes)
+
+    def _load(self, row):
+        return self.store.load(self.base_class, row)
+
+    def _query(self, query_params):
+        query = self.store.query(self.base_class)
+        return self.apply_query_params(self.store, query, query_params)
+
+    def create(self, data, save=True):
+        created_object = self.base_class(**data)
+
+        if save:
+            self.store.save(created_object)
+            return self.get(created_object.id)
+
+        return created_object
+
+    def update(self, object_id, data):
+
+        with self.store.lock:
+            update_object = self.get(object_id)
+            update_object.update(data)
+            self.store.save(update_object)
+            return self.get(object_id)
+
+    def update_all(self, query_params, data):
+
+        with self.store.lock:
+
+            for item in self.get_all(query_params):
+                item.update(data)
+                self.store.save(item)
+
+    def delete(self, object_id):
+
+        with self.store.lock:
+            delete_object = self.get(object_id)
+            self.store.delete_instance(self.base_class, object_id)
+            return delete_object
+
+    def delete_all(self, query_params):
+
+        if query_params is None:
+            raise OperationalException("No parameters are required")
+
+        with self.store.lock:
+
+            for key in self._query(query_params).keys():
+                self.store.delete_instance(self.base_class, key)
+
+    def get_all(self, query_params=None):
+        return [self._load(row) for row in self._query(query_params).all()]
+
+    def get(self, object_id):
+        row = self.store.get_row(
+            self.base_class.__tablename__,
+            coerce_value(self.base_class.__table__.columns["id"], object_id)
+        )
+
+        if row is None:
+            raise OperationalException(self.DEFAULT_NOT_FOUND_MESSAGE)
+
+        return self._load(row)
+
+    def exists(self, query_params):
+        return self._query(query_params).first() is not None
+
+    def find(self, query_params):
+
+        if query_params is None or len(query_params) == 0:
+            raise OperationalException("Find requires query parameters")
+
+        row = self._query(query_params).first()
+
+        if row is None:
+            raise OperationalException(self.DEFAULT_NOT_FOUND_MESSAGE)
+
+        return self._load(row)
+
+    def count(self, query_params=None):
+        return self._query(query_params).count()
+
+    def save(self, object_to_save):
+        self.store.save(object_to_save)
+        return self.get(object_to_save.id)
+
+    def save_objects(self, objects):
+
+        with self.store.lock:
+
+            for item in objects:
+                self.store.save(item)
+
+        return objects
@@ -0,0 +1,73 @@
+from investing_algorithm_framework.domain import TradeStatus, ApiException
+from investing_algorithm_framework.infrastructure.models import SQLPosition, \
+    SQLPortfolio, SQLTrade, SQLOrder
+from investing_algorithm_framework.infrastructure.models\
+    .order_trade_association import order_trade_association
+from .repository import InMemoryRepository
+
+
+class InMemoryTradeRepository(InMemoryRepository):
+    base_class = SQLTrade
+    indexes = ("status", "target_symbol")
+    DEFAULT_NOT_FOUND_MESSAGE = "The requested trade was not found"
+
+    def _get_trade_ids(self, db, order_ids):
+        trade_ids = set()
+
+        for order_id in order_ids:
+            trade_ids.update(
+                db.get_associated(
+                    order_trade_association.name,
+                    "order_id",
+                    order_id,
+                    "trade_id"
+                )
+            )
+
+        return trade_ids
+
+    def _apply_query_params(self, db, query, query_params):
+        portfolio_query_param = self.get_query_param(
+            "portfolio_id", query_params
+        )
+        status_query_param = self.get_query_param("status", query_params)
+        target_symbol = self.get_query_param(
+            "target_symbol", query_params
+        )
+        trading_symbol = self.get_query_param("trading_symbol", query_params)
+        order_id_query_param = self.get_query_param("order_id", query_params)
+
+        if order_id_query_param:
+            query = query.filter_in(
+                "id", self._get_trade_ids(db, [order_id_query_param])
+            )
+
+        if portfolio_query_param is not None:
+
+            if not db.query(SQLPortfolio)\
+                    .filter_by(id=portfolio_query_param).first():
+                raise ApiException("Portfolio not found")
+
+            # Query trades belonging to the portfolio
+            position_ids = db.query(SQLPosition)\
+                .filter_by(portfolio_id=portfolio_query_param).keys()
+            order_ids = db.query(SQLOrder)\
+                .filter_in("position_id", position_ids).keys()
+            query = query.filter_in("id", self._get_trade_ids(db, order_ids))
+
+        if status_query_param:
+            status = TradeStatus.from_value(status_query_param)
+            query = query.filter_by(status=status.value)
+
+        if target_symbol:
+            query = query.filter_by(target_symbol=target_symbol)
+
+        if trading_symbol:
+            query = query.filter_by(trading_symbol=trading_symbol)
+
+        return query
+
+    def add_order_to_trade(self, trade, order):
+        trade.orders.append(order)
+        self.store.save(trade)
+        return trade
@@ -0,0 +1,17 @@
+from investing_algorithm_framework.infrastructure.models import \
+    SQLTradeTakeProfit
+from .repository import InMemoryRepository
+
+
+class InMemoryTradeTakeProfitRepository(InMemoryRepository):
+    base_class = SQLTradeTakeProfit
+    indexes = ("trade_id",)
+    DEFAULT_NOT_FOUND_MESSAGE = "The requested trade take profit was not found"
+
+    def _apply_query_params(self, db, query, query_params):
+        trade_query_param = self.get_query_param("trade_id", query_params)
+
+        if trade_query_param:
+            query = query.filter_by(trade_id=trade_query_param)
+
+        return query
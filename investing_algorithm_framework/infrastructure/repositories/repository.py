@@ -7,7 +7,8 @@ from werkzeug.datastructures import MultiDict
 
 from investing_algorithm_framework.domain import OperationalException, \
     DEFAULT_PAGE_VALUE, DEFAULT_PER_PAGE_VALUE
-from investing_algorithm_framework.infrastructure.database import Session
+from investing_algorithm_framework.infrastructure.database import \
+    session_scope, commit, rollback, commit_unit_of_work
 
 logger = logging.getLogger("investing_algorithm_framework")
 
@@ -21,68 +22,73 @@ class Repository(ABC):
     def create(self, data, save=True):
         created_object = self.base_class(**data)
         if save:
-            with Session() as db:
+            with session_scope() as db:
                 try:
                     db.add(created_object)
-                    db.commit()
+                    commit(db)
                     return self.get(created_object.id)
                 except SQLAlchemyError as e:
                     logger.error(e)
-                    db.rollback()
+                    rollback(db)
                     raise OperationalException("Error creating object")
 
         return created_object
 
     def update(self, object_id, data):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 update_object = self.get(object_id)
                 update_object.update(data)
                 db.add(update_object)
-                db.commit()
+                commit(db)
                 return self.get(object_id)
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback(db)
                 raise OperationalException("Error updating object")
 
     def update_all(self, query_params, data):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 selection = self.get_all(query_params)
 
+                # Each item is updated in a savepoint, so a failing item
+                # only rolls back its own changes
                 for item in selection:
+                    savepoint = db.begin_nested()
+
                     try:
                         item.update(db, data)
+                        savepoint.commit()
                     except SQLAlchemyError as e:
                         logger.error(e)
-                        db.rollback()
+                        savepoint.rollback()
 
-                db.commit()
+                commit(db)
 
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback(db)
                 raise OperationalException("Error updating object")
 
     def delete(self, object_id):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 delete_object = self.get(object_id)
                 db.delete(delete_object)
-                db.commit()
+                commit(db)
                 return delete_object
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback(db)
                 raise OperationalException("Error deleting object")
 
     def delete_all(self, query_params):
 
-        with Session() as db:
+        with session_scope() as db:
             if query_params is None:
                 raise OperationalException("No parameters are required")
 
@@ -94,17 +100,17 @@ class Repository(ABC):
 
                 for item in query_set.all():
                     item.delete(db)
-                    db.commit()
+                    commit(db)
 
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback(db)
                 raise OperationalException("Error deleting all objects")
 
     def get_all(self, query_params=None):
         query_params = MultiDict(query_params)
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 query_set = db.query(self.base_class)
                 query_set = self.apply_query_params(
@@ -117,7 +123,7 @@ class Repository(ABC):
 
     def get(self, object_id):
 
-        with Session() as db:
+        with session_scope() as db:
             match = db.query(self.base_class).filter_by(id=object_id) \
                 .first()
 
@@ -141,7 +147,7 @@ class Repository(ABC):
         return query
 
     def exists(self, query_params):
-        with Session() as db:
+        with session_scope() as db:
             try:
                 query = db.query(self.base_class)
                 query = self.apply_query_params(db, query, query_params)
@@ -155,7 +161,7 @@ class Repository(ABC):
         if query_params is None or len(query_params) == 0:
             raise OperationalException("Find requires query parameters")
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 query = db.query(self.base_class)
                 query = self.apply_query_params(db, query, query_params)
@@ -171,7 +177,7 @@ class Repository(ABC):
 
     def count(self, query_params=None):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 query = db.query(self.base_class)
                 query = self.apply_query_params(db, query, query_params)
@@ -260,25 +266,35 @@ class Repository(ABC):
         Returns:
             Object: The saved object.
         """
-        with Session() as db:
+        with session_scope() as db:
             try:
                 db.add(object_to_save)
-                db.commit()
+                commit(db)
                 return self.get(object_to_save.id)
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback(db)
                 raise OperationalException("Error saving object")
 
     def save_objects(self, objects):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 for object in objects:
                     db.add(object)
-                db.commit()
+                commit(db)
                 return objects
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback(db)
                 raise OperationalException("Error saving objects")
+
+    def commit_unit_of_work(self):
+        """
+        Commit the changes of the active unit of work that have been
+        made so far, see commit_unit_of_work of the database module.
+
+        Returns:
+            None
+        """
+        commit_unit_of_work()
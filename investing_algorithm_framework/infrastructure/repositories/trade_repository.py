@@ -4,7 +4,8 @@ from sqlalchemy.exc import SQLAlchemyError
 from investing_algorithm_framework.domain import TradeStatus, ApiException
 from investing_algorithm_framework.infrastructure.models import SQLPosition, \
     SQLPortfolio, SQLTrade, SQLOrder
-from investing_algorithm_framework.infrastructure.database import Session
+from investing_algorithm_framework.infrastructure.database import \
+    session_scope, commit, rollback
 
 from .repository import Repository
 
@@ -58,14 +59,14 @@ class SQLTradeRepository(Repository):
         return query
 
     def add_order_to_trade(self, trade, order):
-        with Session() as db:
+        with session_scope() as db:
             try:
                 db.add(order)
                 db.add(trade)
                 trade.orders.append(order)
-                db.commit()
+                commit(db)
                 return trade
             except SQLAlchemyError as e:
                 logger.error(f"Error saving trade: {e}")
-                db.rollback()
+                rollback(db)
                 raise ApiException("Error saving trade")
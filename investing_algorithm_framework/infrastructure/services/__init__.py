@@ -1,7 +1,9 @@
 from .azure import AzureBlobStorageStateHandler
 from .aws import AWSS3StorageStateHandler
+from .ccxt_exchange_pool import CCXTExchangePool
 
 __all__ = [
     "AzureBlobStorageStateHandler",
-    "AWSS3StorageStateHandler"
+    "AWSS3StorageStateHandler",
+    "CCXTExchangePool",
 ]
@@ -0,0 +1,286 @@
+import json
+import logging
+import os
+import threading
+from time import monotonic, time
+from typing import Callable, Collection, Dict
+
+import ccxt
+
+from investing_algorithm_framework.domain import OperationalException, \
+    MarketCredential
+
+logger = logging.getLogger("investing_algorithm_framework")
+
+
+class CCXTExchangePool:
+    """
+    Process wide pool of ccxt exchange instances.
+
+    Creating a ccxt exchange and loading its markets is expensive and
+    uses rate limit, so exchanges are created once per market and
+    credential and shared by the CCXT data provider, order executor
+    and portfolio provider. The markets of an exchange are loaded once,
+    and only reloaded when they are older than the given ttl.
+
+    The symbols of an exchange can also be cached in a json file, so
+    that other processes and later runs can check if a market has a
+    symbol without loading the markets over the network.
+
+    Use CCXTExchangePool.get_instance to get the shared pool.
+    """
+    _instance: "CCXTExchangePool" = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._exchanges: Dict[tuple, ccxt.Exchange] = {}
+        self._markets_loaded_at: Dict[tuple, float] = {}
+        self._key_locks: Dict[tuple, threading.Lock] = {}
+        self._symbols: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_instance() -> "CCXTExchangePool":
+        """
+        Get the shared exchange pool of the process.
+
+        Returns:
+            CCXTExchangePool: The shared exchange pool.
+        """
+
+        with CCXTExchangePool._instance_lock:
+
+            if CCXTExchangePool._instance is None:
+                CCXTExchangePool._instance = CCXTExchangePool()
+
+            return CCXTExchangePool._instance
+
+    @staticmethod
+    def _get_key(market: str, market_credential: MarketCredential):
+
+        if market_credential is None:
+            return market.lower(), None, None
+
+        return (
+            market.lower(),
+            market_credential.api_key,
+            market_credential.secret_key
+        )
+
+    def _get_key_lock(self, key) -> threading.Lock:
+
+        with self._lock:
+
+            if key not in self._key_locks:
+                self._key_locks[key] = threading.Lock()
+
+            return self._key_locks[key]
+
+    def get_exchange(
+        self,
+        market: str,
+        market_credential: MarketCredential = None,
+        check_credentials: Callable = None,
+    ):
+        """
+        Get the exchange for a market and credential, the exchange
+        is created on first use. Without a market credential an
+        anonymous exchange is returned, which can only be used for
+        public data such as the markets and OHLCV data.
+
+        Args:
+            market (str): The market to get the exchange for
+            market_credential (MarketCredential, optional): The market
+                credential to use for the exchange
+            check_credentials (Callable, optional): Function that is
+                called with the exchange class and market credential
+                before the exchange is created.
+
+        Raises:
+            OperationalException: If ccxt has no exchange for the market
+
+        Returns:
+            Exchange: CCXT exchange client
+        """
+        key = self._get_key(market, market_credential)
+        exchange = self._exchanges.get(key)
+
+        if exchange is not None:
+            return exchange
+
+        with self._get_key_lock(key):
+            exchange = self._exchanges.get(key)
+
+            if exchange is not None:
+                return exchange
+
+            exchange_class = getattr(ccxt, market.lower(), None)
+
+            if exchange_class is None:
+                raise OperationalException(
+                    f"No ccxt exchange for market id {market.lower()}"
+                )
+
+            if market_credential is not None:
+
+                if check_credentials is not None:
+                    check_credentials(exchange_class, market_credential)
+
+                exchange = exchange_class({
+                    'apiKey': market_credential.api_key,
+                    'secret': market_credential.secret_key,
+                })
+            else:
+                exchange = exchange_class({})
+
+            self._exchanges[key] = exchange
+            return exchange
+
+    def load_markets(
+        self,
+        market: str,
+        market_credential: MarketCredential = None,
+        ttl: float = None,
+        check_credentials: Callable = None,
+    ) -> Dict:
+        """
+        Get the markets of the exchange of a market and credential.
+        The markets are loaded once per exchange, and reloaded when
+        they were loaded more than ttl seconds ago.
+
+        Args:
+            market (str): The market to get the markets for
+            market_credential (MarketCredential, optional): The market
+                credential to use for the exchange
+            ttl (float, optional): The number of seconds after which the
+                markets are reloaded. If None, the markets are not reloaded.
+            check_credentials (Callable, optional): See get_exchange.
+
+        Returns:
+            Dict: The markets of the exchange, keyed by symbol.
+        """
+        exchange = self.get_exchange(
+            market, market_credential, check_credentials=check_credentials
+        )
+        key = self._get_key(market, market_credential)
+
+        with self._get_key_lock(key):
+            loaded_at = self._markets_loaded_at.get(key)
+            now = monotonic()
+
+            if loaded_at is None:
+                exchange.load_markets()
+                self._markets_loaded_at[key] = now
+            elif ttl is not None and now - loaded_at >= ttl:
+                exchange.load_markets(reload=True)
+                self._markets_loaded_at[key] = now
+
+        return exchange.markets
+
+    def get_symbols(
+        self,
+        market: str,
+        ttl: float = None,
+        cache_file_path: str = None,
+        cache_ttl: float = None,
+    ) -> Collection[str]:
+        """
+        Get the symbols of the exchange of a market.
+
+        If a cache file and cache ttl are given, the symbols are read
+        from the cache file when they were written less than cache_ttl
+        seconds ago. Otherwise the markets are loaded and the symbols
+        are written to the cache file.
+
+        Args:
+            market (str): The market to get the symbols for
+            ttl (float, optional): See load_markets.
+            cache_file_path (str, optional): The path of the json file
+                to cache the symbols in.
+            cache_ttl (float, optional): The number of seconds the cached
+                symbols are valid.
+
+        Returns:
+            Collection[str]: The symbols of the exchange.
+        """
+        market = market.lower()
+
+        if cache_file_path is None or cache_ttl is None:
+            return self.load_markets(market, ttl=ttl).keys()
+
+        cached = self._symbols.get(market)
+
+        if cached is None or time() - cached[0] >= cache_ttl:
+            cached = self._read_symbols_cache(cache_file_path, market)
+
+        if cached is None or time() - cached[0] >= cache_ttl:
+            symbols = frozenset(self.load_markets(market, ttl=ttl).keys())
+            cached = (time(), symbols)
+            self._write_symbols_cache(cache_file_path, market, cached)
+
+        self._symbols[market] = cached
+        return cached[1]
+
+    @staticmethod
+    def _read_symbols_cache(cache_file_path: str, market: str):
+
+        if not os.path.isfile(cache_file_path):
+            return None
+
+        try:
+            with open(cache_file_path, "r") as f:
+                entry = json.load(f).get(market)
+
+            if entry is None:
+                return None
+
+            return entry["loaded_at"], frozenset(entry["symbols"])
+        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(
+                f"Could not read ccxt symbols cache {cache_file_path}: {e}"
+            )
+            return None
+
+    def _write_symbols_cache(self, cache_file_path: str, market: str, cached):
+
+        with self._lock:
+            cache = {}
+
+            if os.path.isfile(cache_file_path):
+
+                try:
+                    with open(cache_file_path, "r") as f:
+                        cache = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    cache = {}
+
+            cache[market] = {
+                "loaded_at": cached[0],
+                "symbols": sorted(cached[1]),
+            }
+            temporary_path = f"{cache_file_path}.{os.getpid()}.tmp"
+
+            try:
+                with open(temporary_path, "w") as f:
+                    json.dump(cache, f)
+
+                os.replace(temporary_path, cache_file_path)
+            except OSError as e:
+                logger.warning(
+                    f"Could not write ccxt symbols cache "
+                    f"{cache_file_path}: {e}"
+                )
+
+    def clear(self):
+        """
+        Function to remove all exchanges from the pool.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._exchanges = {}
+            self._markets_loaded_at = {}
+            self._key_locks = {}
+            self._symbols = {}
@@ -1,9 +1,11 @@
-from .backtesting import BacktestService
+from .backtesting import BacktestService, VectorBacktestData, \
+    VectorPortfolio
 from .trade_order_evaluator import BacktestTradeOrderEvaluator, \
     TradeOrderEvaluator, DefaultTradeOrderEvaluator
 from .configuration_service import ConfigurationService
 from .market_credential_service import MarketCredentialService
-from .data_providers import DataProviderService
+from .data_providers import DataProviderService, OHLCVResampler, \
+    ResampledOHLCVDataProvider
 from .order_service import OrderService, OrderBacktestService, \
     OrderExecutorLookup
 from .portfolios import PortfolioService, BacktestPortfolioService, \
@@ -11,6 +13,7 @@ from .portfolios import PortfolioService, BacktestPortfolioService, \
     PortfolioSnapshotService, PortfolioProviderLookup
 from .positions import PositionService, PositionSnapshotService
 from .repository_service import RepositoryService
+from .status_cache import StatusCache
 from .trade_service import TradeService
 from .metrics import get_annual_volatility, \
     get_sortino_ratio, get_drawdown_series, get_max_drawdown, \
@@ -42,10 +45,13 @@ from .metrics import get_annual_volatility, \
 __all__ = [
     "OrderService",
     "RepositoryService",
+    "StatusCache",
     "PortfolioService",
     "PositionService",
     "PortfolioConfigurationService",
     "BacktestService",
+    "VectorBacktestData",
+    "VectorPortfolio",
     "OrderBacktestService",
     "ConfigurationService",
     "PortfolioSyncService",
@@ -55,6 +61,8 @@ __all__ = [
     "BacktestPortfolioService",
     "TradeService",
     "DataProviderService",
+    "OHLCVResampler",
+    "ResampledOHLCVDataProvider",
     "OrderExecutorLookup",
     "BacktestTradeOrderEvaluator",
     "PortfolioProviderLookup",
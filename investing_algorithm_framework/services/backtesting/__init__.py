@@ -1,5 +1,9 @@
 from .backtest_service import BacktestService
+from .vector_backtest_data import VectorBacktestData
+from .vector_portfolio import VectorPortfolio
 
 __all__ = [
     "BacktestService",
+    "VectorBacktestData",
+    "VectorPortfolio",
 ]
@@ -1,6 +1,7 @@
 import logging
 import os
 import sys
+from bisect import bisect_left
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Union
@@ -21,6 +22,8 @@ from investing_algorithm_framework.services.portfolios import \
     PortfolioConfigurationService
 from investing_algorithm_framework.services.metrics import \
     create_backtest_metrics
+from .vector_backtest_data import VectorBacktestData
+from .vector_portfolio import VectorPortfolio
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +122,7 @@ class BacktestService:
         initial_amount: float = None,
         trading_symbol: str = None,
         market: str = None,
+        vector_backtest_data: VectorBacktestData = None,
     ) -> BacktestRun:
         """
         Vectorized backtest for multiple assets using strategy
@@ -137,10 +141,18 @@ class BacktestService:
                 portfolio configuration.
             market: The market to use for the backtest. If None, the market
                 will be taken from the first portfolio configuration.
+            vector_backtest_data: The data that is shared between the
+                vector backtests of the date range. If None, the data
+                is retrieved from the data provider service.
 
         Returns:
             BacktestRun: The backtest run containing the results and metrics.
         """
+        if vector_backtest_data is not None:
+            data_provider_service = vector_backtest_data
+        else:
+            data_provider_service = self._data_provider_service
+
         portfolio_configurations = self._portfolio_configuration_service\
             .get_all()
 
@@ -180,7 +192,7 @@ class BacktestService:
         )
 
         # Load vectorized backtest data
-        data = self._data_provider_service.get_vectorized_backtest_data(
+        data = data_provider_service.get_vectorized_backtest_data(
             data_sources=strategy.data_sources,
             start_date=backtest_date_range.start_date,
             end_date=backtest_date_range.end_date
@@ -197,7 +209,7 @@ class BacktestService:
             BacktestService.get_most_granular_ohlcv_data_source(
                 strategy.data_sources
             )
-        most_granular_ohlcv_data = self._data_provider_service.get_ohlcv_data(
+        most_granular_ohlcv_data = data_provider_service.get_ohlcv_data(
                 symbol=most_granular_ohlcv_data_source.symbol,
                 start_date=backtest_date_range.start_date,
                 end_date=backtest_date_range.end_date,
@@ -217,7 +229,14 @@ class BacktestService:
         # Initialize trades and portfolio values
         trades = []
         orders = []
-        granular_ohlcv_data_order_by_symbol = {}
+        dates = BacktestService._to_utc_datetimes(index)
+        symbols = list(buy_signals.keys())
+        shape = (len(index), len(symbols))
+        buy_signal_matrix = np.zeros(shape, dtype=bool)
+        sell_signal_matrix = np.zeros(shape, dtype=bool)
+        prices = np.zeros(shape)
+        has_price = np.zeros(shape, dtype=bool)
+        capital_per_trade = np.zeros(len(symbols))
         snapshots = [
             PortfolioSnapshot(
                 trading_symbol=trading_symbol,
@@ -229,7 +248,9 @@ class BacktestService:
             )
         ]
 
-        for symbol in buy_signals.keys():
+        # Align the signals and prices of all symbols with the most
+        # granular OHLCV data, with a column for every symbol
+        for column, symbol in enumerate(symbols):
             full_symbol = f"{symbol}/{trading_symbol}"
             # find PositionSize object
             pos_size_obj = next(
@@ -237,24 +258,20 @@ class BacktestService:
                  p.symbol == symbol), None
             )
             # Load most granular OHLCV data for the symbol
-            df = self._data_provider_service.get_ohlcv_data(
+            df = data_provider_service.get_ohlcv_data(
                 symbol=full_symbol,
                 start_date=backtest_date_range.start_date,
                 end_date=backtest_date_range.end_date,
                 pandas=True
             )
-            granular_ohlcv_data_order_by_symbol[full_symbol] = df
-
-            # Align signals with most granular OHLCV data
-            close = df["Close"]
-            buy_signal = buy_signals[symbol].reindex(index, fill_value=False)
-            sell_signal = sell_signals[symbol].reindex(index, fill_value=False)
-
-            signal = pd.Series(0, index=index)
-            signal[buy_signal] = 1
-            signal[sell_signal] = -1
-            signal = signal.replace(0, np.nan).ffill().shift(1).fillna(0)
-            signal = signal.astype(float)
+            buy_signal_matrix[:, column] = buy_signals[symbol]\
+                .reindex(index, fill_value=False).to_numpy(dtype=bool)
+            sell_signal_matrix[:, column] = sell_signals[symbol]\
+                .reindex(index, fill_value=False).to_numpy(dtype=bool)
+            prices[:, column] = df["Close"]\
+                .reindex(index, method='ffill').to_numpy(dtype=float)
+            # Open trades are only valued once the symbol has a price
+            has_price[:, column] = index >= df.index[0]
 
             if pos_size_obj is None:
                 raise OperationalException(
@@ -263,7 +280,7 @@ class BacktestService:
                     f"register a PositionSize object in the strategy."
                 )
 
-            capital_for_trade = pos_size_obj.get_size(
+            capital_per_trade[column] = pos_size_obj.get_size(
                 Portfolio(
                     unallocated=initial_amount,
                     initial_balance=initial_amount,
@@ -271,144 +288,105 @@ class BacktestService:
                     net_size=0,
                     market="BACKTEST",
                     identifier="vector_backtest"
-                ) if pos_size_obj else (initial_amount / len(buy_signals)),
-                asset_price=close.iloc[0]
+                ),
+                asset_price=df["Close"].iloc[0]
             )
 
-            # Trade generation
-            last_trade = None
-
-            # Align signals with most granular OHLCV data
-            close = df["Close"].reindex(index, method='ffill')
-            buy_signal = buy_signals[symbol].reindex(index, fill_value=False)
-            sell_signal = sell_signals[symbol].reindex(index, fill_value=False)
-
-            # Loop over all timestamps in the backtest
-            for i in range(len(index)):
-
-                # 1 = buy, -1 = sell, 0 = hold
-                current_signal = signal.iloc[i]
-                current_price = float(close.iloc[i])
-                current_date = index[i]
-
-                # Convert the pd.Timestamp to an utc datetime object
-                if isinstance(current_date, pd.Timestamp):
-                    current_date = current_date.to_pydatetime()
-
-                if current_date.tzinfo is None:
-                    current_date = current_date.replace(tzinfo=timezone.utc)
-
-                # If we are not in a position, and we get a buy signal
-                if current_signal == 1 and last_trade is None:
-                    amount = float(capital_for_trade / current_price)
-                    buy_order = Order(
-                        id=uuid4(),
-                        target_symbol=symbol,
-                        trading_symbol=trading_symbol,
-                        order_type=OrderType.LIMIT,
-                        price=current_price,
-                        amount=amount,
-                        status=OrderStatus.CLOSED,
-                        created_at=current_date,
-                        updated_at=current_date,
-                        order_side=OrderSide.BUY
-                    )
-                    orders.append(buy_order)
-                    trade = Trade(
-                        id=uuid4(),
-                        orders=[buy_order],
-                        target_symbol=symbol,
-                        trading_symbol=trading_symbol,
-                        available_amount=amount,
-                        remaining=0,
-                        filled_amount=amount,
-                        open_price=current_price,
-                        opened_at=current_date,
-                        closed_at=None,
-                        amount=amount,
-                        status=TradeStatus.OPEN.value,
-                        cost=capital_for_trade
-                    )
-                    last_trade = trade
-                    trades.append(trade)
-
-                # If we are in a position, and we get a sell signal
-                if current_signal == -1 and last_trade is not None:
-                    net_gain_val = (
-                        current_price - last_trade.open_price
-                    ) * last_trade.available_amount
-                    sell_order = Order(
-                        id=uuid4(),
-                        target_symbol=symbol,
-                        trading_symbol=trading_symbol,
-                        order_type=OrderType.LIMIT,
-                        price=current_price,
-                        amount=last_trade.available_amount,
-                        status=OrderStatus.CLOSED,
-                        created_at=current_date,
-                        updated_at=current_date,
-                        order_side=OrderSide.SELL
-                    )
-                    orders.append(sell_order)
-                    trade_orders = last_trade.orders
-                    trade_orders.append(sell_order)
-                    last_trade.update(
-                        {
-                            "orders": trade_orders,
-                            "closed_at": current_date,
-                            "status": TradeStatus.CLOSED,
-                            "updated_at": current_date,
-                            "net_gain": net_gain_val
-                        }
-                    )
-                    last_trade = None
-
-        unallocated = initial_amount
-        total_net_gain = 0.0
-        open_trades = []
-
-        # Create portfolio snapshots
-        for ts in index:
-            allocated = 0
-            interval_datetime = pd.Timestamp(ts).to_pydatetime()
-            interval_datetime = interval_datetime.replace(tzinfo=timezone.utc)
-
-            for trade in trades:
-
-                if trade.opened_at == interval_datetime:
-                    # Snapshot taken at the moment a trade is opened
-                    unallocated -= trade.cost
-                    open_trades.append(trade)
-
-                if trade.closed_at == interval_datetime:
-                    # Snapshot taken at the moment a trade is closed
-                    unallocated += trade.cost + trade.net_gain
-                    total_net_gain += trade.net_gain
-                    open_trades.remove(trade)
-
-            for open_trade in open_trades:
-                ohlcv = granular_ohlcv_data_order_by_symbol[
-                    f"{open_trade.target_symbol}/{trading_symbol}"
-                ]
-                try:
-                    price = ohlcv.loc[:ts, "Close"].iloc[-1]
-                    open_trade.last_reported_price = price
-                except IndexError:
-                    continue  # skip if no price yet
-
-                allocated += open_trade.filled_amount * price
-
-            # total_value = invested_value + unallocated
-            # total_net_gain = total_value - initial_amount
-            snapshots.append(
-                PortfolioSnapshot(
-                    portfolio_id=portfolio.identifier,
-                    created_at=interval_datetime,
-                    unallocated=unallocated,
-                    total_value=unallocated + allocated,
-                    total_net_gain=total_net_gain
+        # 1 = buy, -1 = sell, 0 = no signal yet, where a signal is
+        # acted upon at the next timestamp
+        signals = np.where(
+            sell_signal_matrix,
+            -1.0,
+            np.where(buy_signal_matrix, 1.0, np.nan)
+        )
+        signals = pd.DataFrame(signals).ffill().shift(1).fillna(0)\
+            .to_numpy()
+        vector_portfolio = VectorPortfolio(
+            signals=signals,
+            prices=prices,
+            capital_per_trade=capital_per_trade,
+            initial_amount=initial_amount,
+            has_price=has_price
+        ).run()
+
+        # Only create the orders and trades once all entries and
+        # exits are known
+        for i in range(len(vector_portfolio.entry_indices)):
+            symbol = symbols[vector_portfolio.symbol_indices[i]]
+            open_price = float(vector_portfolio.entry_prices[i])
+            amount = float(vector_portfolio.amounts[i])
+            cost = float(vector_portfolio.costs[i])
+            opened_at = dates[vector_portfolio.entry_indices[i]]
+            exit_index = vector_portfolio.exit_indices[i]
+            buy_order = Order(
+                id=uuid4(),
+                target_symbol=symbol,
+                trading_symbol=trading_symbol,
+                order_type=OrderType.LIMIT,
+                price=open_price,
+                amount=amount,
+                status=OrderStatus.CLOSED,
+                created_at=opened_at,
+                updated_at=opened_at,
+                order_side=OrderSide.BUY
+            )
+            orders.append(buy_order)
+            trade = Trade(
+                id=uuid4(),
+                orders=[buy_order],
+                target_symbol=symbol,
+                trading_symbol=trading_symbol,
+                available_amount=amount,
+                remaining=0,
+                filled_amount=amount,
+                open_price=open_price,
+                opened_at=opened_at,
+                closed_at=None,
+                amount=amount,
+                status=TradeStatus.OPEN.value,
+                cost=cost,
+                last_reported_price=vector_portfolio.get_last_price(i)
+            )
+
+            if exit_index >= 0:
+                closed_at = dates[exit_index]
+                sell_order = Order(
+                    id=uuid4(),
+                    target_symbol=symbol,
+                    trading_symbol=trading_symbol,
+                    order_type=OrderType.LIMIT,
+                    price=float(vector_portfolio.exit_prices[i]),
+                    amount=amount,
+                    status=OrderStatus.CLOSED,
+                    created_at=closed_at,
+                    updated_at=closed_at,
+                    order_side=OrderSide.SELL
                 )
+                orders.append(sell_order)
+                trade.orders.append(sell_order)
+                trade.closed_at = closed_at
+                trade.updated_at = closed_at
+                trade.status = TradeStatus.CLOSED.value
+                trade.net_gain = float(vector_portfolio.net_gains[i])
+
+            trades.append(trade)
+
+        # Create portfolio snapshots from the equity curve of the portfolio
+        snapshots.extend(
+            PortfolioSnapshot(
+                portfolio_id=portfolio.identifier,
+                created_at=created_at,
+                unallocated=unallocated,
+                total_value=total_value,
+                total_net_gain=total_net_gain
+            )
+            for created_at, unallocated, total_value, total_net_gain in zip(
+                dates,
+                vector_portfolio.unallocated.tolist(),
+                vector_portfolio.total_value.tolist(),
+                vector_portfolio.total_net_gain.tolist()
             )
+        )
 
         unique_symbols = set()
         for trade in trades:
@@ -450,6 +428,102 @@ class BacktestService:
         )
         return run
 
+    @staticmethod
+    def _to_utc_datetimes(index: pd.Index) -> List[datetime]:
+        """
+        Function to convert an index of timestamps to a list of utc
+        datetime objects. Naive timestamps are interpreted as utc.
+
+        Args:
+            index (pd.Index): The index to convert.
+
+        Returns:
+            List[datetime]: The utc datetime objects.
+        """
+        return [
+            date.replace(tzinfo=timezone.utc) if date.tzinfo is None
+            else date
+            for date in pd.DatetimeIndex(index).to_pydatetime()
+        ]
+
+    def run_vector_backtest(
+        self,
+        strategy,
+        backtest_date_range: BacktestDateRange,
+        risk_free_rate: float,
+        initial_amount: float = None,
+        trading_symbol: str = None,
+        market: str = None,
+        metadata: Dict[str, str] = None,
+        continue_on_error: bool = False,
+        vector_backtest_data: VectorBacktestData = None,
+    ) -> Backtest:
+        """
+        Runs a vectorized backtest for a strategy and creates the
+        backtest report of its run.
+
+        Args:
+            strategy: The strategy to backtest.
+            backtest_date_range: The date range for the backtest.
+            risk_free_rate: The risk-free rate to use for the
+                backtest metrics.
+            initial_amount: The initial amount to use for the backtest.
+            trading_symbol: The trading symbol to use for the backtest.
+            market: The market to use for the backtest.
+            metadata: Metadata to attach to the backtest report. If None,
+                the metadata of the strategy is used.
+            continue_on_error: Whether to return an empty backtest
+                instead of raising the error if the backtest fails.
+            vector_backtest_data: The data that is shared between the
+                vector backtests of the date range.
+
+        Returns:
+            Backtest: The backtest report.
+        """
+        self.validate_strategy_for_vector_backtest(strategy)
+
+        try:
+            run = self.create_vector_backtest(
+                strategy=strategy,
+                backtest_date_range=backtest_date_range,
+                risk_free_rate=risk_free_rate,
+                market=market,
+                trading_symbol=trading_symbol,
+                initial_amount=initial_amount,
+                vector_backtest_data=vector_backtest_data
+            )
+            backtest = Backtest(
+                backtest_runs=[run],
+                risk_free_rate=risk_free_rate,
+                backtest_summary=generate_backtest_summary_metrics(
+                    [run.backtest_metrics]
+                )
+            )
+        except Exception as e:
+            logger.error(
+                f"Error occurred during vector backtest for strategy "
+                f"{strategy.strategy_id}: {str(e)}"
+            )
+            if continue_on_error:
+                backtest = Backtest(
+                    backtest_runs=[],
+                    risk_free_rate=risk_free_rate,
+                )
+            else:
+                raise e
+
+        # Add the metadata to the backtest
+        if metadata is None:
+
+            if strategy.metadata is None:
+                backtest.metadata = {}
+            else:
+                backtest.metadata = strategy.metadata
+        else:
+            backtest.metadata = metadata
+
+        return backtest
+
     def generate_schedule(
         self,
         strategies,
@@ -493,6 +567,83 @@ class BacktestService:
             for ts, data in schedule.items()
         }
 
+    def add_entry_signals_to_schedule(
+        self,
+        schedule: Dict[datetime, Dict[str, List[str]]],
+        strategies,
+        backtest_date_range: BacktestDateRange
+    ) -> Dict[datetime, Dict[str, List[str]]]:
+        """
+        Adds an entry_signal flag to every date of a schedule, so that
+        the event loop can fast forward over the dates at which no
+        strategy needs to be run.
+
+        The entry signal dates of each strategy that supports fast
+        forwarding are generated once with the data of the full backtest
+        date range. Each entry signal date
+        is mapped onto the first schedule date of the strategy at or
+        after it. A schedule date gets an entry signal if one of its
+        strategies has an entry signal at that date, or if one of its
+        strategies does not provide entry signal dates.
+
+        Args:
+            schedule: The schedule generated by generate_schedule.
+            strategies: The strategies of the schedule.
+            backtest_date_range: The date range of the backtest.
+
+        Returns:
+            Dict: The schedule with the entry_signal flags.
+        """
+        entry_dates = set()
+        fast_forward_strategy_ids = set()
+
+        for strategy in strategies:
+
+            if not strategy.supports_fast_forward:
+                continue
+
+            data = self._data_provider_service.get_vectorized_backtest_data(
+                data_sources=strategy.data_sources or [],
+                start_date=backtest_date_range.start_date,
+                end_date=backtest_date_range.end_date
+            )
+            entry_signal_dates = strategy.generate_entry_signal_dates(data)
+
+            if entry_signal_dates is None:
+                continue
+
+            strategy_id = strategy.strategy_profile.strategy_id
+            fast_forward_strategy_ids.add(strategy_id)
+            strategy_dates = sorted(
+                date for date, schedule_entry in schedule.items()
+                if strategy_id in schedule_entry["strategy_ids"]
+            )
+
+            for entry_signal_date in entry_signal_dates:
+                entry_signal_date = pd.Timestamp(entry_signal_date)
+
+                if entry_signal_date.tzinfo is None:
+                    entry_signal_date = entry_signal_date\
+                        .tz_localize(timezone.utc)
+                else:
+                    entry_signal_date = entry_signal_date\
+                        .tz_convert(timezone.utc)
+
+                position = bisect_left(
+                    strategy_dates, entry_signal_date.to_pydatetime()
+                )
+
+                if position < len(strategy_dates):
+                    entry_dates.add(strategy_dates[position])
+
+        for date, schedule_entry in schedule.items():
+            schedule_entry["entry_signal"] = date in entry_dates or any(
+                strategy_id not in fast_forward_strategy_ids
+                for strategy_id in schedule_entry["strategy_ids"]
+            )
+
+        return schedule
+
     def get_strategy_from_strategy_profiles(self, strategy_profiles, id):
 
         for strategy_profile in strategy_profiles:
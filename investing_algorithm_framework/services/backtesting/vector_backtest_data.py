@@ -0,0 +1,170 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from investing_algorithm_framework.domain import DataSource, DataType, \
+    OperationalException
+
+
+class VectorBacktestData:
+    """
+    Data of vector backtests that is loaded once and shared by all
+    strategies that are backtested over the same date range.
+
+    The data is retrieved from the data provider service on first use
+    and kept in memory, keyed on the data source (or symbol) and the
+    requested dates. It provides the data provider service methods that
+    the vector backtests use, so it can be used in place of the data
+    provider service of a BacktestService.
+
+    The loaded data can be sent to worker processes. The data provider
+    service is not sent along, so the data a worker needs must be loaded
+    with the load method first.
+
+    Attributes:
+        backtest_data (dict): The backtest data as
+            {(identifier, start_date, end_date): data}.
+        ohlcv_data (dict): The OHLCV data as
+            {(symbol, start_date, end_date, pandas): data}.
+    """
+
+    def __init__(self, data_provider_service=None):
+        self._data_provider_service = data_provider_service
+        self.backtest_data = {}
+        self.ohlcv_data = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_data_provider_service"] = None
+        return state
+
+    def load(
+        self,
+        strategies,
+        start_date: datetime,
+        end_date: datetime
+    ):
+        """
+        Function to load the data of the data sources of all strategies
+        for a date range.
+
+        Args:
+            strategies: The strategies to load the data for.
+            start_date (datetime): The start date of the backtests.
+            end_date (datetime): The end date of the backtests.
+
+        Returns:
+            None
+        """
+
+        for strategy in strategies:
+            self.get_vectorized_backtest_data(
+                data_sources=strategy.data_sources,
+                start_date=start_date,
+                end_date=end_date
+            )
+
+            for data_source in strategy.data_sources:
+
+                if DataType.OHLCV.equals(data_source.data_type):
+                    self.get_ohlcv_data(
+                        symbol=data_source.symbol,
+                        start_date=start_date,
+                        end_date=end_date,
+                        pandas=True
+                    )
+
+    def get_vectorized_backtest_data(
+        self,
+        data_sources: List[DataSource],
+        start_date: datetime = None,
+        end_date: datetime = None,
+    ) -> Dict[str, Any]:
+        """
+        Function to get the vectorized backtest data of data sources,
+        see DataProviderService.get_vectorized_backtest_data.
+
+        Args:
+            data_sources (List[DataSource]): The data sources to get
+                backtest data for.
+            start_date (datetime): The start date for the backtest data.
+            end_date (datetime): The end date for the backtest data.
+
+        Returns:
+            Dict[str, Any]: The vectorized backtest data for the
+                given data sources.
+        """
+        vectorized_data = {}
+
+        for data_source in data_sources:
+            data_start_date = data_source.create_start_date_data(start_date)
+            key = (data_source.get_identifier(), data_start_date, end_date)
+
+            if key not in self.backtest_data:
+                self.backtest_data[key] = self._get_data_provider_service()\
+                    .get_backtest_data(
+                        data_source=data_source,
+                        start_date=data_start_date,
+                        end_date=end_date,
+                    )
+
+            vectorized_data[data_source.get_identifier()] = \
+                self._copy(self.backtest_data[key])
+
+        return vectorized_data
+
+    def get_ohlcv_data(
+        self,
+        symbol: str,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        pandas: bool = False,
+    ):
+        """
+        Function to get the OHLCV data of a symbol,
+        see DataProviderService.get_ohlcv_data.
+
+        Args:
+            symbol (str): The symbol to get OHLCV data for.
+            start_date (datetime): The start date for the OHLCV data.
+            end_date (datetime): The end date for the OHLCV data.
+            pandas (bool): Whether to return the data as a
+                pandas DataFrame.
+
+        Returns:
+            DataFrame: The OHLCV data for the given symbol.
+        """
+        key = (symbol, start_date, end_date, pandas)
+
+        if key not in self.ohlcv_data:
+            self.ohlcv_data[key] = self._get_data_provider_service()\
+                .get_ohlcv_data(
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                    pandas=pandas
+                )
+
+        return self._copy(self.ohlcv_data[key])
+
+    def _get_data_provider_service(self):
+
+        if self._data_provider_service is None:
+            raise OperationalException(
+                "The requested vector backtest data is not loaded. "
+                "Make sure that the data sources of all strategies are "
+                "loaded before running the vector backtests in "
+                "worker processes."
+            )
+
+        return self._data_provider_service
+
+    @staticmethod
+    def _copy(data):
+        # Strategies often add columns to pandas data frames, so every
+        # strategy gets its own copy. Polars data frames are immutable.
+        if isinstance(data, pd.DataFrame):
+            return data.copy()
+
+        return data
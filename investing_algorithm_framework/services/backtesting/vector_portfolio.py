@@ -0,0 +1,273 @@
+import heapq
+
+import numpy as np
+
+
+class VectorPortfolio:
+    """
+    Portfolio level engine of vector backtests. The engine computes the
+    trades, positions, cash, exposure and equity of a portfolio over
+    aligned arrays of signals and prices, with a row for every timestamp
+    and a column for every symbol.
+
+    The signals are forward filled, where 1 is a buy signal, -1 a sell
+    signal and 0 no signal yet. A trade of a symbol is opened at the
+    start of each run of buy signals and closed at the sell signal right
+    after that run. All symbols share the cash of the portfolio, so
+    a trade is only opened if the unallocated cash covers its cost at
+    that moment.
+
+    Attributes (available after run):
+        symbol_indices (np.ndarray): The column of the symbol of every
+            trade. The trades are ordered by symbol and entry.
+        entry_indices (np.ndarray): The row at which every trade is
+            opened.
+        exit_indices (np.ndarray): The row at which every trade is
+            closed, or -1 if the trade is still open.
+        amounts (np.ndarray): The amount of every trade.
+        costs (np.ndarray): The cost of every trade.
+        entry_prices (np.ndarray): The open price of every trade.
+        exit_prices (np.ndarray): The close price of every trade, or
+            nan if the trade is still open.
+        net_gains (np.ndarray): The net gain of every trade, or nan if
+            the trade is still open.
+        last_price_indices (np.ndarray): The last row at which every
+            trade is open.
+        position (np.ndarray): The amount held of every symbol at
+            every row.
+        allocated (np.ndarray): The value of the open trades at every row.
+        unallocated (np.ndarray): The unallocated cash at every row.
+        total_value (np.ndarray): The total value at every row.
+        total_net_gain (np.ndarray): The realized net gain at every row.
+        exposure (np.ndarray): The allocated fraction of the total value
+            at every row.
+    """
+
+    def __init__(
+        self,
+        signals: np.ndarray,
+        prices: np.ndarray,
+        capital_per_trade: np.ndarray,
+        initial_amount: float,
+        has_price: np.ndarray = None,
+    ):
+        """
+        Args:
+            signals (np.ndarray): The forward filled signals with shape
+                (timestamps, symbols).
+            prices (np.ndarray): The prices with shape
+                (timestamps, symbols).
+            capital_per_trade (np.ndarray): The cost of a trade for every
+                symbol.
+            initial_amount (float): The initial cash of the portfolio.
+            has_price (np.ndarray): Whether a symbol has a price at a
+                timestamp. Open trades are only valued at the timestamps
+                at which their symbol has a price. If None, all symbols
+                have a price at all timestamps.
+        """
+        self.signals = np.asarray(signals, dtype=float)
+        self.prices = np.asarray(prices, dtype=float)
+        self.capital_per_trade = np.asarray(capital_per_trade, dtype=float)
+        self.initial_amount = initial_amount
+
+        if has_price is None:
+            has_price = np.ones(self.signals.shape, dtype=bool)
+
+        self.has_price = np.asarray(has_price, dtype=bool)
+
+    @staticmethod
+    def get_entry_and_exit_masks(signals: np.ndarray):
+        """
+        Function to get the timestamps at which trades are opened and
+        closed for forward filled signals.
+
+        Because the signals are forward filled, a trade of a symbol is
+        open as long as its signal stays 1. The entries are therefore the
+        starts of the runs of buy signals and the exits are the sell
+        signals directly after them.
+
+        Args:
+            signals (np.ndarray): The forward filled signals with shape
+                (timestamps, symbols).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The entry and exit masks.
+        """
+        previous_signals = np.zeros_like(signals)
+        previous_signals[1:] = signals[:-1]
+        entry_mask = (signals == 1) & (previous_signals != 1)
+        exit_mask = (signals == -1) & (previous_signals == 1)
+        return entry_mask, exit_mask
+
+    def run(self):
+        """
+        Function to compute the trades and the equity curve of the
+        portfolio.
+
+        Returns:
+            VectorPortfolio: The portfolio with its computed attributes.
+        """
+        number_of_rows = self.signals.shape[0]
+        entry_mask, exit_mask = self.get_entry_and_exit_masks(self.signals)
+
+        # Candidate trades ordered by symbol and entry, where the n-th
+        # entry of a symbol is closed by the n-th exit of that symbol
+        symbol_indices, entry_indices = np.nonzero(entry_mask.T)
+        _, exit_rows = np.nonzero(exit_mask.T)
+        entry_counts = entry_mask.sum(axis=0)
+        exit_counts = exit_mask.sum(axis=0)
+        ranks = np.arange(len(entry_indices)) \
+            - (np.cumsum(entry_counts) - entry_counts)[symbol_indices]
+        closed = ranks < exit_counts[symbol_indices]
+        exit_indices = np.full(len(entry_indices), -1)
+        exit_indices[closed] = exit_rows[
+            ((np.cumsum(exit_counts) - exit_counts)[symbol_indices]
+             + ranks)[closed]
+        ]
+
+        costs = self.capital_per_trade[symbol_indices]
+        entry_prices = self.prices[entry_indices, symbol_indices]
+        exit_prices = np.full(len(entry_indices), np.nan)
+        exit_prices[closed] = self.prices[
+            exit_indices[closed], symbol_indices[closed]
+        ]
+        amounts = costs / entry_prices
+        net_gains = (exit_prices - entry_prices) * amounts
+
+        accepted = self._get_accepted_trades(
+            entry_indices, exit_indices, costs, net_gains
+        )
+        self.symbol_indices = symbol_indices[accepted]
+        self.entry_indices = entry_indices[accepted]
+        self.exit_indices = exit_indices[accepted]
+        self.amounts = amounts[accepted]
+        self.costs = costs[accepted]
+        self.entry_prices = entry_prices[accepted]
+        self.exit_prices = exit_prices[accepted]
+        self.net_gains = net_gains[accepted]
+        closed = closed[accepted]
+        self.last_price_indices = np.where(
+            closed, self.exit_indices - 1, number_of_rows - 1
+        )
+
+        # A trade is held from its entry up to, but not including,
+        # its exit
+        position_changes = np.zeros(self.signals.shape)
+        position_changes[self.entry_indices, self.symbol_indices] += \
+            self.amounts
+        position_changes[
+            self.exit_indices[closed], self.symbol_indices[closed]
+        ] -= self.amounts[closed]
+        self.position = np.cumsum(position_changes, axis=0)
+        held = self.has_price & (self.position != 0)
+        self.allocated = np.where(
+            held, self.position * self.prices, 0.0
+        ).sum(axis=1)
+
+        cash_flows, realized_net_gains = self._get_cash_flows(
+            self.entry_indices,
+            self.exit_indices,
+            self.costs,
+            self.net_gains,
+            number_of_rows
+        )
+        self.unallocated = np.cumsum(
+            np.concatenate(([self.initial_amount], cash_flows))
+        )[1:]
+        self.total_net_gain = np.cumsum(realized_net_gains)
+        self.total_value = self.unallocated + self.allocated
+        self.exposure = np.divide(
+            self.allocated,
+            self.total_value,
+            out=np.zeros(number_of_rows),
+            where=self.total_value != 0
+        )
+        return self
+
+    def get_last_price(self, trade_index):
+        """
+        Function to get the price of a trade at the last timestamp at
+        which the trade is open.
+
+        Args:
+            trade_index (int): The index of the trade.
+
+        Returns:
+            float: The last price, or None if the symbol has no
+                price yet.
+        """
+        row = self.last_price_indices[trade_index]
+        column = self.symbol_indices[trade_index]
+
+        if not self.has_price[row, column]:
+            return None
+
+        return self.prices[row, column]
+
+    @staticmethod
+    def _get_cash_flows(
+        entry_indices, exit_indices, costs, net_gains, number_of_rows
+    ):
+        closed = exit_indices >= 0
+        cash_flows = np.zeros(number_of_rows)
+        realized_net_gains = np.zeros(number_of_rows)
+        np.add.at(cash_flows, entry_indices, -costs)
+        np.add.at(
+            cash_flows,
+            exit_indices[closed],
+            costs[closed] + net_gains[closed]
+        )
+        np.add.at(
+            realized_net_gains, exit_indices[closed], net_gains[closed]
+        )
+        return cash_flows, realized_net_gains
+
+    def _get_accepted_trades(
+        self, entry_indices, exit_indices, costs, net_gains
+    ):
+        accepted = np.ones(len(entry_indices), dtype=bool)
+        tolerance = 1e-9 * abs(self.initial_amount)
+        cash_flows, _ = self._get_cash_flows(
+            entry_indices,
+            exit_indices,
+            costs,
+            net_gains,
+            self.signals.shape[0]
+        )
+
+        # Without a shortage of cash, all candidate trades are opened
+        if len(cash_flows) == 0 or \
+                (self.initial_amount + np.cumsum(cash_flows)).min() \
+                >= -tolerance:
+            return accepted
+
+        # Otherwise, walk the candidate trades in order of entry and
+        # skip the trades whose cost exceeds the unallocated cash. Trades
+        # that are closed at the same timestamp free their cash first.
+        unallocated = self.initial_amount
+        pending_exits = []
+
+        for trade_index in np.argsort(entry_indices, kind="stable"):
+            entry_index = entry_indices[trade_index]
+
+            while pending_exits and pending_exits[0][0] <= entry_index:
+                unallocated += heapq.heappop(pending_exits)[1]
+
+            cost = costs[trade_index]
+
+            if cost > unallocated + tolerance:
+                accepted[trade_index] = False
+                continue
+
+            unallocated -= cost
+
+            if exit_indices[trade_index] >= 0:
+                heapq.heappush(
+                    pending_exits,
+                    (
+                        exit_indices[trade_index],
+                        cost + net_gains[trade_index]
+                    )
+                )
+
+        return accepted
@@ -2,7 +2,10 @@ import os
 import inspect
 from investing_algorithm_framework.domain import Environment, \
     SNAPSHOT_INTERVAL, DATA_DIRECTORY, INDEX_DATETIME, AppMode, \
-    SnapshotInterval, DATETIME_FORMAT_FILE_NAME
+    SnapshotInterval, DATETIME_FORMAT_FILE_NAME, DATA_STORAGE_FORMAT, \
+    DataStorageFormat, BACKTEST_DATA_PREPARATION_WORKERS, DATA_FETCH_TIMEOUT, \
+    CCXT_MARKETS_TTL, RESAMPLE_BACKTEST_OHLCV_DATA, CCXT_MARKETS_CACHE_TTL, \
+    IN_MEMORY_BACKTEST_STORAGE, BACKTEST_FAST_FORWARD, BACKTEST_DATABASE_NAME
 
 caller_file = inspect.stack()[-1].filename
 caller_dir = os.path.dirname(os.path.abspath(caller_file))
@@ -27,7 +30,16 @@ DEFAULT_CONFIGURATION = {
     DATA_DIRECTORY: "data",
     INDEX_DATETIME: None,
     SNAPSHOT_INTERVAL: SnapshotInterval.DAILY.value,
-    DATETIME_FORMAT_FILE_NAME: "%Y-%m-%d-%H-%M"
+    DATETIME_FORMAT_FILE_NAME: "%Y-%m-%d-%H-%M",
+    DATA_STORAGE_FORMAT: DataStorageFormat.CSV.value,
+    BACKTEST_DATA_PREPARATION_WORKERS: 1,
+    DATA_FETCH_TIMEOUT: 30,
+    CCXT_MARKETS_TTL: None,
+    CCXT_MARKETS_CACHE_TTL: None,
+    RESAMPLE_BACKTEST_OHLCV_DATA: False,
+    IN_MEMORY_BACKTEST_STORAGE: False,
+    BACKTEST_FAST_FORWARD: False,
+    BACKTEST_DATABASE_NAME: "backtest-database.sqlite3",
 }
 
 DEFAULT_FLASK_CONFIGURATION = {
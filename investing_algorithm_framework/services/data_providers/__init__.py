@@ -1,5 +1,9 @@
 from .data_provider_service import DataProviderService
+from .resampled_ohlcv_data_provider import OHLCVResampler, \
+    ResampledOHLCVDataProvider
 
 __all__ = [
-    "DataProviderService"
+    "DataProviderService",
+    "OHLCVResampler",
+    "ResampledOHLCVDataProvider",
 ]
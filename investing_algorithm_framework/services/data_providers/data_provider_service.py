@@ -1,13 +1,25 @@
+import asyncio
 import logging
+import threading
+import weakref
 import pandas as pd
 import polars as pl
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from datetime import datetime
+from math import ceil
 from typing import List, Tuple, Optional, Dict, Any
 
 from investing_algorithm_framework.domain import DataProvider, \
     OperationalException, ImproperlyConfigured, DataSource, DataType, \
-    BacktestDateRange, tqdm, convert_polars_to_pandas, TimeFrame
+    BacktestDateRange, tqdm, convert_polars_to_pandas, TimeFrame, \
+    SlidingWindowIndex, PriceIndex, \
+    BACKTEST_DATA_PREPARATION_WORKERS, DATA_FETCH_TIMEOUT, \
+    RESAMPLE_BACKTEST_OHLCV_DATA
+
+from .resampled_ohlcv_data_provider import OHLCVResampler, \
+    ResampledOHLCVDataProvider
 
 logger = logging.getLogger("investing_algorithm_framework")
 
@@ -28,6 +40,7 @@ class DataProviderIndex:
         self.ohlcv_data_providers_no_market = defaultdict()
         self.ohlcv_data_providers_with_timeframe = defaultdict()
         self.ticker_data_providers = defaultdict()
+        self._capabilities = {}
 
     def add(self, data_provider: DataProvider):
         """
@@ -41,6 +54,66 @@ class DataProviderIndex:
         """
         self.data_providers.append(data_provider)
 
+    def has_data(
+        self,
+        data_provider: DataProvider,
+        data_source: DataSource,
+        start_date: datetime = None,
+        end_date: datetime = None
+    ) -> bool:
+        """
+        Check if a data provider has data for a data source. The answers
+        are cached per data provider, data source attributes and date
+        range, so resolving the same data sources again, e.g. for every
+        date range of run_backtests, does not call has_data again. None
+        answers of a data provider are not cached.
+
+        Args:
+            data_provider (DataProvider): The data provider to check.
+            data_source (DataSource): The data source to check.
+            start_date (datetime, optional): The start date for the data.
+            end_date (datetime, optional): The end date for the data.
+
+        Returns:
+            bool: True if the data provider has data for the data source.
+        """
+        key = (
+            id(data_provider),
+            data_source.data_provider_identifier,
+            data_source.data_type,
+            data_source.market,
+            data_source.symbol,
+            data_source.time_frame,
+            data_source.window_size,
+            data_source.storage_path,
+            data_source.start_date,
+            data_source.end_date,
+            start_date,
+            end_date,
+        )
+        cached = self._capabilities.get(key)
+
+        # The data provider is referenced weakly, so an id that is reused
+        # by a new data provider does not match the cached answer.
+        if cached is not None and cached[0]() is data_provider:
+            return cached[1]
+
+        if start_date is None and end_date is None:
+            result = data_provider.has_data(data_source)
+        else:
+            result = data_provider.has_data(
+                data_source, start_date=start_date, end_date=end_date
+            )
+
+        # A data provider returns None when it could not check its data,
+        # e.g. on a network error, so the answer is asked again next time
+        if result is not None:
+            self._capabilities[key] = (
+                weakref.ref(data_provider), bool(result)
+            )
+
+        return bool(result)
+
     def register(self, data_source: DataSource) -> DataProvider:
         """
         Register a data source in the DataProvider Index.
@@ -63,7 +136,7 @@ class DataProviderIndex:
 
         for data_provider in self.data_providers:
 
-            if data_provider.has_data(data_source):
+            if self.has_data(data_provider, data_source):
                 matches.append(data_provider)
 
         if len(matches) == 0:
@@ -147,11 +220,112 @@ class DataProviderIndex:
         Returns:
             DataProvider: The registered data provider.
         """
+        best_provider = self._find_backtest_data_provider(
+            data_source, backtest_date_range
+        )
+        self._index_backtest_data_provider(data_source, best_provider)
+        return best_provider
+
+    def register_resampled_backtest_data_sources(
+        self,
+        data_sources: List[DataSource],
+        backtest_date_range: BacktestDateRange
+    ) -> List[DataSource]:
+        """
+        Register the OHLCV data sources of a symbol and market with
+        multiple time frames to resampled data providers.
+
+        Only the finest time frame of a symbol and market is
+        registered to a data provider from the index. Its window size
+        is extended to cover the windows of all time frames. The data
+        of the other time frames is derived from it with one shared
+        OHLCVResampler.
+
+        Args:
+            data_sources (List[DataSource]): The data sources to register.
+            backtest_date_range (BacktestDateRange): The date range for the
+                backtest data providers.
+
+        Returns:
+            List[DataSource]: The data sources that are not registered,
+                because they can't be derived from another time frame.
+        """
+        groups = defaultdict(list)
+        unregistered_data_sources = []
+
+        for data_source in data_sources:
+
+            if DataType.OHLCV.equals(data_source.data_type) \
+                    and data_source.time_frame is not None:
+                groups[(data_source.symbol, data_source.market)]\
+                    .append(data_source)
+            else:
+                unregistered_data_sources.append(data_source)
+
+        for group in groups.values():
+            base_data_source = min(
+                group, key=lambda x: x.time_frame.amount_of_minutes
+            )
+            base_time_frame = base_data_source.time_frame
+            resampled_data_sources = []
+
+            for data_source in group:
+
+                if OHLCVResampler.can_resample(
+                    base_time_frame, data_source.time_frame
+                ):
+                    resampled_data_sources.append(data_source)
+                else:
+                    unregistered_data_sources.append(data_source)
+
+            if len(resampled_data_sources) < 2:
+                unregistered_data_sources.extend(resampled_data_sources)
+                continue
+
+            # The base window must also contain the candles of the first
+            # window of every resampled time frame.
+            required_minutes = max(
+                ((data_source.window_size or 0) + 1)
+                * data_source.time_frame.amount_of_minutes
+                for data_source in resampled_data_sources
+            )
+            base_data_source = replace(
+                base_data_source,
+                identifier=None,
+                window_size=ceil(
+                    required_minutes / base_time_frame.amount_of_minutes
+                )
+            )
+            resampler = OHLCVResampler(
+                self._find_backtest_data_provider(
+                    base_data_source, backtest_date_range
+                )
+            )
+
+            for data_source in resampled_data_sources:
+                data_provider = ResampledOHLCVDataProvider(
+                    resampler=resampler,
+                    symbol=data_source.symbol,
+                    time_frame=data_source.time_frame,
+                    market=data_source.market,
+                    window_size=data_source.window_size,
+                    pandas=data_source.pandas
+                )
+                self._index_backtest_data_provider(data_source, data_provider)
+
+        return unregistered_data_sources
+
+    def _find_backtest_data_provider(
+        self,
+        data_source: DataSource,
+        backtest_date_range: BacktestDateRange
+    ) -> DataProvider:
         matches = []
 
         for data_provider in self.data_providers:
 
-            if data_provider.has_data(
+            if self.has_data(
+                data_provider,
                 data_source,
                 start_date=backtest_date_range.start_date,
                 end_date=backtest_date_range.end_date
@@ -170,7 +344,11 @@ class DataProviderIndex:
 
         # Sort by priority and pick the best one (lowest priority first)
         best_provider = sorted(matches, key=lambda x: x.priority)[0]
-        best_provider = best_provider.copy(data_source)
+        return best_provider.copy(data_source)
+
+    def _index_backtest_data_provider(
+        self, data_source: DataSource, best_provider: DataProvider
+    ) -> None:
         self.data_providers_lookup[data_source] = best_provider
 
         symbol = data_source.symbol
@@ -220,8 +398,6 @@ class DataProviderIndex:
             if symbol not in self.ticker_data_providers:
                 self.ticker_data_providers[symbol] = best_provider
 
-        return best_provider
-
     def get(self, data_source: DataSource) -> Optional[DataProvider]:
         """
         Get the data provider for a given data source.
@@ -273,6 +449,12 @@ class DataProviderIndex:
         self.data_providers_lookup = defaultdict()
         self.data_providers = []
 
+        # Remove the cached answers of data providers that are gone
+        self._capabilities = {
+            key: value for key, value in self._capabilities.items()
+            if value[0]() is not None
+        }
+
     def __len__(self):
         """
         Returns the number of data providers in the index.
@@ -352,6 +534,9 @@ class DataProviderService:
         self.data_provider_index = DataProviderIndex(default_data_providers)
         self.configuration_service = configuration_service
         self.market_credential_service = market_credential_service
+        self._event_loop = None
+        self._event_loop_thread = None
+        self._event_loop_lock = threading.Lock()
 
     def get(self, data_source: DataSource) -> Optional[DataProvider]:
         """
@@ -403,6 +588,155 @@ class DataProviderService:
             save=data_source.save,
         )
 
+    def get_data_for_data_sources(
+        self,
+        data_sources: List[DataSource],
+        date: datetime = None,
+        timeout: float = None,
+    ) -> List[Any]:
+        """
+        Function to get the data of multiple data sources concurrently.
+
+        The data is fetched with the get_data_async method of the data
+        providers on an event loop that is kept running in a background
+        thread, so that data providers can reuse their connections
+        between calls. Each data source is fetched with a timeout.
+
+        Args:
+            data_sources (List[DataSource]): The data sources to get
+                the data for.
+            date (datetime): The date to get data for.
+            timeout (float, optional): The timeout in seconds for
+                fetching the data of a single data source. Defaults to
+                the DATA_FETCH_TIMEOUT configuration value.
+
+        Raises:
+            OperationalException: If the data of a data source could
+                not be fetched within the timeout. Other errors are
+                raised as is, the first failing data source in the
+                given order determines the raised error.
+
+        Returns:
+            List[Any]: The data of each data source, in the order of
+                the given data sources.
+        """
+        data_providers = []
+
+        for data_source in data_sources:
+            data_provider = self.data_provider_index.get(
+                data_source=data_source
+            )
+
+            if data_provider is None:
+                self._throw_no_data_provider_exception(data_source.to_dict())
+
+            if self.configuration_service is not None:
+                data_provider.config = self.configuration_service.get_config()
+
+            data_providers.append(data_provider)
+
+        if timeout is None and self.configuration_service is not None:
+            timeout = self.configuration_service.get_config()\
+                .get(DATA_FETCH_TIMEOUT)
+
+        async def fetch(data_source, data_provider):
+            return await asyncio.wait_for(
+                data_provider.get_data_async(
+                    date=date,
+                    start_date=data_source.start_date,
+                    end_date=data_source.end_date,
+                    save=data_source.save,
+                ),
+                timeout=timeout
+            )
+
+        async def fetch_all():
+            return await asyncio.gather(
+                *[
+                    fetch(data_source, data_provider)
+                    for data_source, data_provider
+                    in zip(data_sources, data_providers)
+                ],
+                return_exceptions=True
+            )
+
+        results = self._run_async(fetch_all())
+
+        for data_source, result in zip(data_sources, results):
+
+            if isinstance(result, asyncio.TimeoutError):
+                raise OperationalException(
+                    f"Fetching data for {data_source.get_identifier()} "
+                    f"timed out after {timeout} seconds"
+                )
+
+            if isinstance(result, BaseException):
+                raise result
+
+        return results
+
+    def _run_async(self, coroutine):
+        """
+        Function to run a coroutine on the background event loop of the
+        service and wait for its result. The event loop is started
+        on first use.
+        """
+
+        with self._event_loop_lock:
+
+            if self._event_loop is None or self._event_loop.is_closed():
+                self._event_loop = asyncio.new_event_loop()
+                self._event_loop_thread = threading.Thread(
+                    name="Data provider event loop",
+                    target=self._event_loop.run_forever,
+                    daemon=True
+                )
+                self._event_loop_thread.start()
+
+            event_loop = self._event_loop
+
+        return asyncio.run_coroutine_threadsafe(
+            coroutine, event_loop
+        ).result()
+
+    def close(self):
+        """
+        Function to close the connections of the data providers that
+        were opened on the background event loop and to stop the
+        event loop.
+
+        Returns:
+            None
+        """
+
+        with self._event_loop_lock:
+            event_loop = self._event_loop
+            event_loop_thread = self._event_loop_thread
+            self._event_loop = None
+            self._event_loop_thread = None
+
+        if event_loop is None or event_loop.is_closed():
+            return
+
+        data_providers = list(self.data_provider_index.data_providers) + [
+            data_provider for _, data_provider
+            in self.data_provider_index.get_all()
+        ]
+
+        async def close_all():
+            await asyncio.gather(
+                *[
+                    data_provider.close_async()
+                    for data_provider in data_providers
+                ],
+                return_exceptions=True
+            )
+
+        asyncio.run_coroutine_threadsafe(close_all(), event_loop).result()
+        event_loop.call_soon_threadsafe(event_loop.stop)
+        event_loop_thread.join()
+        event_loop.close()
+
     def get_ticker_data(self, symbol, market, date):
         """
         Function to get a ticker for a given data source.
@@ -427,6 +761,26 @@ class DataProviderService:
                 )
             else:
                 if self.backtest_mode:
+                    price_index = self._get_price_index(ohlcv_data_provider)
+                    entry = None
+
+                    if price_index is not None:
+                        entry = price_index.get_as_of(date, direction="next")
+
+                    if entry is not None:
+                        return {
+                            "symbol": symbol,
+                            "market": market,
+                            "datetime": entry["datetime"],
+                            "open": entry["open"],
+                            "high": entry["high"],
+                            "low": entry["low"],
+                            "close": entry["close"],
+                            "volume": entry["close"],
+                            "ask": entry["close"],
+                            "bid": entry["close"],
+                        }
+
                     data = ohlcv_data_provider.get_backtest_data(
                         backtest_index_date=date,
                     )
@@ -483,6 +837,26 @@ class DataProviderService:
             else:
                 return data_provider.get_data(date=date)
 
+    @staticmethod
+    def _get_price_index(data_provider) -> Optional[PriceIndex]:
+        """
+        Get the price index of the prepared sliding windows of a
+        backtest data provider. Returns None if the data provider has
+        no sliding windows or no OHLC columns.
+        """
+        window_cache = getattr(data_provider, "window_cache", None)
+
+        if not isinstance(window_cache, SlidingWindowIndex) \
+                or len(window_cache) == 0:
+            return None
+
+        price_index = window_cache.get_price_index()
+
+        if not {"open", "high", "low", "close"}.issubset(price_index.prices):
+            return None
+
+        return price_index
+
     def get_ohlcv_data(
         self,
         symbol: str,
@@ -728,6 +1102,13 @@ class DataProviderService:
 
         # Filter out duplicate data_sources
         unique_data_sources = set(data_sources)
+        config = self.configuration_service.get_config()
+
+        if config.get(RESAMPLE_BACKTEST_OHLCV_DATA, False):
+            unique_data_sources = self.data_provider_index\
+                .register_resampled_backtest_data_sources(
+                    list(unique_data_sources), backtest_date_range
+                )
 
         if show_progress:
 
@@ -758,19 +1139,34 @@ class DataProviderService:
     def prepare_backtest_data(
         self,
         backtest_date_range: BacktestDateRange,
-        show_progress: bool = True
+        show_progress: bool = True,
+        max_workers: int = None
     ):
         """
         Prepare the backtest data for all registered data providers.
 
+        The data providers can be prepared concurrently in a thread
+        pool. Data providers keep their prepared data in memory, so
+        threads are used instead of processes. Downloads from the same
+        market share one rate limit budget, see MarketRateLimiter.
+
+        All data providers are prepared, also if some of them fail.
+        The failures are collected in the order of the registered
+        data sources and raised together afterwards.
+
         Args:
             backtest_date_range (BacktestDateRange): The date range for the
                 backtest data.
             show_progress (bool): Whether to show progress while preparing
                 the backtest data.
+            max_workers (int, optional): The number of data providers
+                that are prepared concurrently. Defaults to the
+                BACKTEST_DATA_PREPARATION_WORKERS configuration value.
 
         Raises:
-            OperationalException: If no data providers are registered.
+            OperationalException: If no data providers are registered or
+                if the backtest data of one or more data providers could
+                not be prepared.
 
         Returns:
             None
@@ -783,38 +1179,92 @@ class DataProviderService:
                 "backtest data."
             )
 
+        if max_workers is None:
+            config = self.configuration_service.get_config()
+            max_workers = config.get(BACKTEST_DATA_PREPARATION_WORKERS, 1)
+
+        if max_workers is None or max_workers < 1:
+            max_workers = 1
+
         logger.info(
             "Preparing backtest data for all registered data providers"
         )
+        data_providers = self.data_provider_index.get_all()
+        errors = [None] * len(data_providers)
+        progress = None
 
         if show_progress:
-            for data_source, data_provider in tqdm(
-                self.data_provider_index.get_all(),
+            progress = tqdm(
+                total=len(data_providers),
                 desc="Preparing backtest data",
                 colour="green"
-            ):
-                try:
-                    data_provider.prepare_backtest_data(
-                        backtest_start_date=backtest_date_range.start_date,
-                        backtest_end_date=backtest_date_range.end_date
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Error preparing backtest data for {data_source}: {e}"
-                    )
-        else:
-            for data_source, data_provider \
-                    in self.data_provider_index.get_all():
+            )
 
-                try:
-                    data_provider.prepare_backtest_data(
-                        backtest_start_date=backtest_date_range.start_date,
-                        backtest_end_date=backtest_date_range.end_date
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Error preparing backtest data for {data_source}: {e}"
-                    )
+        def prepare(data_provider):
+            data_provider.prepare_backtest_data(
+                backtest_start_date=backtest_date_range.start_date,
+                backtest_end_date=backtest_date_range.end_date
+            )
+
+        try:
+            if max_workers == 1 or len(data_providers) == 1:
+
+                for index, (_, data_provider) in enumerate(data_providers):
+
+                    try:
+                        prepare(data_provider)
+                    except Exception as e:
+                        errors[index] = e
+
+                    if progress is not None:
+                        progress.update(1)
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(data_providers))
+                ) as executor:
+                    futures = {
+                        executor.submit(prepare, data_provider): index
+                        for index, (_, data_provider)
+                        in enumerate(data_providers)
+                    }
+
+                    for future in as_completed(futures):
+                        errors[futures[future]] = future.exception()
+
+                        if progress is not None:
+                            progress.update(1)
+        finally:
+
+            if progress is not None:
+                progress.close()
+
+        failures = [
+            (data_source, error) for (data_source, _), error
+            in zip(data_providers, errors) if error is not None
+        ]
+
+        # Create the price indexes for ticker lookups once
+        for (data_source, data_provider), error \
+                in zip(data_providers, errors):
+
+            if error is None and DataType.OHLCV.equals(data_source.data_type):
+                self._get_price_index(data_provider)
+
+        if len(failures) > 0:
+
+            for data_source, error in failures:
+                logger.error(
+                    f"Error preparing backtest data for {data_source}: "
+                    f"{error}"
+                )
+
+            failure_messages = "\n".join(
+                f"- {data_source}: {error}" for data_source, error in failures
+            )
+            raise OperationalException(
+                f"Could not prepare backtest data for {len(failures)} of "
+                f"{len(data_providers)} data sources:\n{failure_messages}"
+            )
 
     def get_data_files(self):
         """
@@ -0,0 +1,527 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Union
+
+import polars as pl
+
+from investing_algorithm_framework.domain import DataProvider, \
+    OperationalException, DataSource, DataType, TimeFrame, \
+    convert_polars_to_pandas, SlidingWindowIndex, get_missing_data_gaps, \
+    create_missing_data_gaps, clip_missing_data_gaps, \
+    expand_missing_data_gaps, count_data_points
+
+MINUTES_PER_DAY = 1440
+
+
+class OHLCVResampler:
+    """
+    Resampler that derives OHLCV data of coarser time frames from the
+    data of one base data provider.
+
+    The base data provider holds the finest time frame of a symbol and
+    market. Its data is loaded once, and the data of every coarser time
+    frame is aggregated from it with a vectorized group_by_dynamic and
+    cached per time frame. All time frames are therefore derived from
+    the same candles and are consistent with each other.
+
+    A resampled candle is labeled with its open time and aggregates the
+    base candles in [open time, open time + time frame), the same as
+    the candles of an exchange. Incomplete candles at the start and
+    the end of the base data are dropped.
+
+    Attributes:
+        data_provider (DataProvider): The data provider of the base
+            time frame.
+        time_frame (TimeFrame): The base time frame.
+    """
+
+    def __init__(self, data_provider: DataProvider):
+        self.data_provider = data_provider
+        self.time_frame = TimeFrame.from_value(data_provider.time_frame)
+        self._prepared_date_range = None
+        self._cache: Dict[TimeFrame, pl.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_interval(time_frame: TimeFrame) -> str:
+        """
+        Get the polars interval of a time frame. Weeks, months and
+        years are calendar intervals, all other time frames are
+        a fixed number of minutes.
+
+        Args:
+            time_frame (TimeFrame): The time frame to get the interval for.
+
+        Returns:
+            str: The polars interval, e.g. "15m", "1w" or "1mo".
+        """
+        time_frame = TimeFrame.from_value(time_frame)
+
+        if TimeFrame.ONE_WEEK.equals(time_frame):
+            return "1w"
+
+        if TimeFrame.ONE_MONTH.equals(time_frame):
+            return "1mo"
+
+        if TimeFrame.ONE_YEAR.equals(time_frame):
+            return "1y"
+
+        return f"{time_frame.amount_of_minutes}m"
+
+    @staticmethod
+    def can_resample(
+        base_time_frame: TimeFrame, time_frame: TimeFrame
+    ) -> bool:
+        """
+        Check if a time frame can be derived from the base time frame.
+        Every candle of the time frame must consist of whole base
+        candles.
+
+        Args:
+            base_time_frame (TimeFrame): The base time frame.
+            time_frame (TimeFrame): The time frame to derive.
+
+        Returns:
+            bool: True if the time frame can be derived from the base
+                time frame, False otherwise.
+        """
+        base_time_frame = TimeFrame.from_value(base_time_frame)
+        time_frame = TimeFrame.from_value(time_frame)
+        base_minutes = base_time_frame.amount_of_minutes
+
+        if time_frame < base_time_frame:
+            return False
+
+        if OHLCVResampler.get_interval(time_frame)[-1] != "m":
+            return MINUTES_PER_DAY % base_minutes == 0
+
+        return time_frame.amount_of_minutes % base_minutes == 0
+
+    def prepare(
+        self,
+        backtest_start_date: datetime,
+        backtest_end_date: datetime
+    ) -> None:
+        """
+        Prepare the backtest data of the base data provider. The base
+        data is prepared once for a backtest date range, also when
+        multiple resampled data providers are prepared concurrently.
+
+        Args:
+            backtest_start_date (datetime): The start date of the backtest.
+            backtest_end_date (datetime): The end date of the backtest.
+
+        Returns:
+            None
+        """
+        date_range = (backtest_start_date, backtest_end_date)
+
+        with self._lock:
+
+            if self._prepared_date_range == date_range:
+                return
+
+            self.data_provider.prepare_backtest_data(
+                backtest_start_date=backtest_start_date,
+                backtest_end_date=backtest_end_date
+            )
+            self._prepared_date_range = date_range
+            self._cache = {}
+
+    def get(self, time_frame: TimeFrame) -> pl.DataFrame:
+        """
+        Get the prepared base data resampled to the given time frame.
+        The resampled data is cached per time frame.
+
+        Args:
+            time_frame (TimeFrame): The time frame to get the data for.
+
+        Returns:
+            pl.DataFrame: The OHLCV data of the time frame.
+        """
+        time_frame = TimeFrame.from_value(time_frame)
+
+        with self._lock:
+
+            if time_frame not in self._cache:
+                self._cache[time_frame] = self.resample(
+                    self.data_provider.data, time_frame
+                )
+
+            return self._cache[time_frame]
+
+    def resample(
+        self, data: pl.DataFrame, time_frame: TimeFrame
+    ) -> pl.DataFrame:
+        """
+        Resample OHLCV data of the base time frame to the given
+        time frame.
+
+        Args:
+            data (pl.DataFrame): The OHLCV data of the base time frame.
+            time_frame (TimeFrame): The time frame to resample to.
+
+        Raises:
+            OperationalException: If the time frame can not be derived
+                from the base time frame.
+
+        Returns:
+            pl.DataFrame: The resampled OHLCV data.
+        """
+        time_frame = TimeFrame.from_value(time_frame)
+
+        if not self.can_resample(self.time_frame, time_frame):
+            raise OperationalException(
+                f"Can not resample {self.time_frame.value} data "
+                f"to time frame {time_frame.value}"
+            )
+
+        if data is None or len(data) == 0:
+            return data
+
+        data = data.sort("Datetime")
+
+        if time_frame.equals(self.time_frame):
+            return data
+
+        interval = self.get_interval(time_frame)
+        first_date = data["Datetime"][0]
+        end_date = data["Datetime"][-1] + timedelta(
+            minutes=self.time_frame.amount_of_minutes
+        )
+        resampled = data.group_by_dynamic(
+            "Datetime",
+            every=interval,
+            closed="left",
+            label="left",
+            start_by="monday" if interval == "1w" else "window",
+        ).agg(
+            pl.col("Open").first(),
+            pl.col("High").max(),
+            pl.col("Low").min(),
+            pl.col("Close").last(),
+            pl.col("Volume").sum(),
+        )
+        return resampled.filter(
+            (pl.col("Datetime") >= first_date) &
+            (pl.col("Datetime").dt.offset_by(interval) <= end_date)
+        )
+
+
+class ResampledOHLCVDataProvider(DataProvider):
+    """
+    Data provider for OHLCV data that is derived from the data of a
+    finer time frame with an OHLCVResampler.
+
+    The data provider index registers one resampled data provider for
+    every time frame of a symbol and market, that all share the same
+    resampler. Only the data of the finest time frame is downloaded,
+    stored and loaded, see the RESAMPLE_BACKTEST_OHLCV_DATA
+    configuration value.
+
+    Attributes:
+        resampler (OHLCVResampler): The resampler that provides the
+            data of the base time frame.
+        pandas (bool): Whether to return the data as a pandas DataFrame.
+    """
+    data_type = DataType.OHLCV
+    data_provider_identifier = "resampled_ohlcv_data_provider"
+
+    def __init__(
+        self,
+        resampler: OHLCVResampler,
+        symbol: str,
+        time_frame: str,
+        market: str,
+        window_size=None,
+        data_provider_identifier: str = None,
+        pandas: bool = False
+    ):
+        if data_provider_identifier is None:
+            data_provider_identifier = self.data_provider_identifier
+
+        super().__init__(
+            symbol=symbol,
+            market=market,
+            time_frame=time_frame,
+            window_size=window_size,
+            data_provider_identifier=data_provider_identifier,
+            data_type=DataType.OHLCV.value
+        )
+        self.resampler = resampler
+        self.pandas = pandas
+        self.data = None
+        self.window_cache = SlidingWindowIndex()
+        self.missing_data_gaps = None
+        self._start_date_data_source = None
+        self._end_date_data_source = None
+
+    def has_data(
+        self,
+        data_source: DataSource,
+        start_date: datetime = None,
+        end_date: datetime = None
+    ) -> bool:
+        """
+        Check if the data source can be derived from the base data.
+
+        Args:
+            data_source (DataSource): The data source to check.
+            start_date (datetime, optional): The start date for the data.
+            end_date (datetime, optional): The end date for the data.
+
+        Returns:
+            bool: True if the data source can be resampled from the
+                base data, False otherwise.
+        """
+        return DataType.OHLCV.equals(data_source.data_type) \
+            and data_source.symbol == self.symbol \
+            and data_source.market == self.market \
+            and data_source.time_frame is not None \
+            and OHLCVResampler.can_resample(
+                self.resampler.time_frame, data_source.time_frame
+            )
+
+    def get_data(
+        self,
+        date: datetime = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        save: bool = False,
+    ):
+        """
+        Fetches the data of the base data provider and resamples it
+        to the time frame of this data provider.
+
+        Args:
+            date (datetime, optional): A specific date to fetch data for.
+            start_date (datetime, optional): The start date for the data.
+            end_date (datetime, optional): The end date for the data.
+            save (bool, optional): Whether to save the base data.
+
+        Returns:
+            DataFrame: The resampled OHLCV data.
+        """
+        data = self.resampler.data_provider.get_data(
+            date=date, start_date=start_date, end_date=end_date, save=save
+        )
+
+        if isinstance(data, pl.DataFrame):
+            data = self.resampler.resample(data, self.time_frame)
+
+            if self.window_size is not None and start_date is None:
+                data = data.tail(self.window_size)
+
+        if self.pandas:
+            data = convert_polars_to_pandas(data)
+
+        return data
+
+    def prepare_backtest_data(
+        self,
+        backtest_start_date,
+        backtest_end_date,
+    ) -> None:
+        """
+        Prepares the base data and the sliding windows of the
+        resampled data for the given backtest date range.
+
+        Args:
+            backtest_start_date (datetime): The start date for the
+                backtest data.
+            backtest_end_date (datetime): The end date for the
+                backtest data.
+
+        Returns:
+            None
+        """
+        self.resampler.prepare(backtest_start_date, backtest_end_date)
+        self.data = self.resampler.get(self.time_frame)
+
+        if len(self.data) == 0:
+            raise OperationalException(
+                f"No {self.time_frame.value} data could be resampled "
+                f"from the {self.resampler.time_frame.value} data of "
+                f"{self.symbol} {self.market}."
+            )
+
+        self._start_date_data_source = self.data["Datetime"][0]
+        self._end_date_data_source = self.data["Datetime"][-1]
+
+        if self.window_size is not None:
+            self.window_cache = SlidingWindowIndex.from_data(
+                data=self.data,
+                window_duration=timedelta(
+                    minutes=self.time_frame.amount_of_minutes
+                    * self.window_size
+                ),
+                start_date=backtest_start_date,
+                end_date=backtest_end_date
+            )
+
+            # Convert the data to pandas once, pandas windows are slices of it
+            if self.pandas:
+                self.window_cache.to_pandas()
+
+        self.missing_data_gaps = get_missing_data_gaps(
+            self.data,
+            self._start_date_data_source,
+            self._end_date_data_source,
+            OHLCVResampler.get_interval(self.time_frame)
+        )
+
+    def get_backtest_data(
+        self,
+        backtest_index_date: datetime = None,
+        backtest_start_date: datetime = None,
+        backtest_end_date: datetime = None,
+        data_source: DataSource = None
+    ):
+        """
+        Fetches the resampled backtest data for a given date or
+        date range.
+
+        Args:
+            backtest_index_date (datetime): The date for which to fetch
+               backtest data.
+            backtest_start_date (datetime): The start date for the
+               backtest data.
+            backtest_end_date (datetime): The end date for the
+               backtest data.
+            data_source (Optional[DataSource]): The data source for which to
+                fetch backtest data.
+
+        Raises:
+            OperationalException: If no data is available for the
+                given date.
+
+        Returns:
+           DataFrame: The backtest data for the given date or date range.
+        """
+
+        if backtest_start_date is not None and \
+                backtest_end_date is not None:
+            data = self.data.filter(
+                (pl.col("Datetime") >= backtest_start_date) &
+                (pl.col("Datetime") <= backtest_end_date)
+            )
+        else:
+            data = self.window_cache.get_as_of(
+                backtest_index_date, direction="next", pandas=self.pandas
+            )
+
+            if data is None:
+                message = "No data available for the " \
+                    f"date: {backtest_index_date} " \
+                    "within the prepared backtest data"
+
+                if data_source is not None:
+                    message += f" for data source {data_source.identifier}"
+
+                raise OperationalException(f"{message}.")
+
+        if self.pandas and isinstance(data, pl.DataFrame):
+            data = convert_polars_to_pandas(data)
+
+        return data
+
+    def copy(self, data_source: DataSource) -> "DataProvider":
+        """
+        Create a copy of the data provider for the given data source,
+        that shares the resampler of this data provider.
+
+        Args:
+            data_source (DataSource): The data source to copy.
+
+        Returns:
+            DataProvider: A new instance of the data provider with the
+                specified data source.
+        """
+        return ResampledOHLCVDataProvider(
+            resampler=self.resampler,
+            symbol=data_source.symbol,
+            time_frame=data_source.time_frame,
+            market=data_source.market,
+            window_size=data_source.window_size,
+            data_provider_identifier=self.data_provider_identifier,
+            pandas=data_source.pandas
+        )
+
+    def get_number_of_data_points(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> int:
+        """
+        Returns the number of resampled data points available between
+        the given start and end dates.
+
+        Args:
+            start_date (datetime): The start date.
+            end_date (datetime): The end date.
+
+        Returns:
+            int: The number of available data points.
+        """
+        return count_data_points(self.data, start_date, end_date)
+
+    def get_missing_data_dates(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[datetime]:
+        """
+        Returns a list of dates for which resampled data is missing
+        between the given start and end dates.
+
+        Args:
+            start_date (datetime): The start date for checking missing data.
+            end_date (datetime): The end date for checking missing data.
+
+        Returns:
+            List[datetime]: A list of dates for which data is missing.
+        """
+        missing_dates = expand_missing_data_gaps(
+            self.get_missing_data_gaps(start_date, end_date),
+            OHLCVResampler.get_interval(self.time_frame)
+        )
+        return [
+            date for date in missing_dates if start_date < date < end_date
+        ]
+
+    def get_missing_data_gaps(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> pl.DataFrame:
+        """
+        Returns the gaps in the resampled data between the given start
+        and end dates (inclusive).
+
+        Args:
+            start_date (datetime): The start date for checking missing data.
+            end_date (datetime): The end date for checking missing data.
+
+        Returns:
+            pl.DataFrame: A DataFrame with a row for every gap and the
+                columns start, end and length.
+        """
+        interval = OHLCVResampler.get_interval(self.time_frame)
+
+        if self.missing_data_gaps is None:
+            return create_missing_data_gaps([], interval)
+
+        return clip_missing_data_gaps(
+            self.missing_data_gaps, start_date, end_date, interval
+        )
+
+    def get_data_source_file_path(self) -> Union[str, None]:
+        """
+        Get the file path of the base data, the resampled data
+        itself is not stored.
+
+        Returns:
+            Union[str, None]: The file path of the base data if stored
+                locally, otherwise None.
+        """
+        return self.resampler.data_provider.get_data_source_file_path()
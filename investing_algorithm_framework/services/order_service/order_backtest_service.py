@@ -20,6 +20,7 @@ class OrderBacktestService(OrderService):
         portfolio_configuration_service,
         portfolio_snapshot_service,
         configuration_service,
+        status_cache=None,
     ):
         super().__init__(
             configuration_service=configuration_service,
@@ -29,6 +30,7 @@ class OrderBacktestService(OrderService):
             portfolio_configuration_service=portfolio_configuration_service,
             portfolio_snapshot_service=portfolio_snapshot_service,
             trade_service=trade_service,
+            status_cache=status_cache,
         )
         self.configuration_service = configuration_service
 
@@ -63,6 +65,16 @@ class OrderBacktestService(OrderService):
         ]
         return order
 
+    def commit_placed_order(self):
+        """
+        Backtest orders are not placed on an exchange, so their records
+        are committed with the unit of work of the iteration.
+
+        Returns:
+            None
+        """
+        pass
+
     def check_pending_orders(self, market_data):
         """
         Function to check if any pending orders have executed. It querys the
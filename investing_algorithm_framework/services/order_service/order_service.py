@@ -31,7 +31,11 @@ class OrderService(RepositoryService):
             service responsible for managing market credentials.
         trade_service (TradeService): The service responsible for
             managing trades.
+        status_cache (StatusCache): Optional cache of the open and
+            created orders, shared by all order services.
     """
+    cached_statuses = (OrderStatus.OPEN.value, OrderStatus.CREATED.value)
+    status_type = OrderStatus
 
     def __init__(
         self,
@@ -44,9 +48,12 @@ class OrderService(RepositoryService):
         trade_service,
         portfolio_provider_lookup=None,
         order_executor_lookup=None,
-        market_credential_service=None
+        market_credential_service=None,
+        status_cache=None
     ):
-        super(OrderService, self).__init__(order_repository)
+        super(OrderService, self).__init__(
+            order_repository, status_cache=status_cache
+        )
         self.configuration_service = configuration_service
         self.order_repository = order_repository
         self.position_service = position_service
@@ -170,6 +177,11 @@ class OrderService(RepositoryService):
         position = self._create_position_if_not_exists(symbol, portfolio)
         order.position_id = position.id
         order = self.order_repository.save(order)
+
+        if execute:
+            self.commit_placed_order()
+
+        self.add_to_status_cache(order)
         order_id = order.id
         order_side = order.order_side
 
@@ -192,7 +204,11 @@ class OrderService(RepositoryService):
             else:
                 self._sync_portfolio_with_created_sell_order(order)
 
+        if execute:
+            self.commit_placed_order()
+
         order = self.get(order_id)
+        self.add_to_status_cache(order)
         return order
 
     def update(self, object_id, data):
@@ -220,6 +236,10 @@ class OrderService(RepositoryService):
         """
         previous_order = self.order_repository.get(object_id)
         new_order = self.order_repository.update(object_id, data)
+        self.add_to_status_cache(new_order)
+
+        # The cached open trades contain the orders of the trade
+        self.trade_service.clear_status_cache()
         filled_difference = new_order.get_filled() \
             - previous_order.get_filled()
 
@@ -253,6 +273,25 @@ class OrderService(RepositoryService):
 
         return new_order
 
+    def sort_cached_objects(self, orders):
+        # The order repository returns the most recent orders first
+        return sorted(
+            orders, key=lambda order: order.created_at, reverse=True
+        )
+
+    def commit_placed_order(self):
+        """
+        Function to commit the record of an order that has been placed
+        on an exchange, together with the trade and portfolio changes
+        made for it. The records are committed right away instead of
+        with the unit of work of the iteration, so that they are not
+        lost if the iteration fails after the order has been placed.
+
+        Returns:
+            None
+        """
+        self.order_repository.commit_unit_of_work()
+
     def execute_order(self, order, portfolio) -> Order:
         """
         Function to execute an order. The function will execute the order
@@ -1,28 +1,72 @@
+from investing_algorithm_framework.domain import OperationalException
+
+
 class RepositoryService:
+    """
+    Base service for services that manage the objects of a repository.
+
+    When a status cache is given, the queries on one of the
+    cached_statuses (optionally combined with a target symbol) are served
+    from the cache instead of the repository. The cache is kept up to date
+    with the objects that are created, updated and saved through the
+    service, and cleared on bulk operations.
 
-    def __init__(self, repository):
+    Attributes:
+        repository: The repository of the service.
+        status_cache (StatusCache): Optional cache of the objects
+            with one of the cached_statuses.
+        cached_statuses (tuple): The status values that are cached.
+        status_type: The status enum used to convert status
+            query parameters.
+    """
+    cached_statuses = ()
+    status_type = None
+    CACHEABLE_QUERY_PARAMS = {"status", "target_symbol"}
+
+    def __init__(self, repository, status_cache=None):
         self.repository = repository
+        self.status_cache = status_cache
 
     def create(self, data, save=True):
-        return self.repository.create(data, save=save)
+        created_object = self.repository.create(data, save=save)
+
+        if save:
+            self.add_to_status_cache(created_object)
+
+        return created_object
 
     def get(self, object_id):
         return self.repository.get(object_id)
 
     def get_all(self, query_params=None):
+        cached_objects = self._get_cached_objects(query_params)
+
+        if cached_objects is not None:
+            return cached_objects
+
         return self.repository.get_all(query_params)
 
     def update(self, object_id, data):
-        return self.repository.update(object_id, data)
+        updated_object = self.repository.update(object_id, data)
+        self.add_to_status_cache(updated_object)
+        return updated_object
 
     def update_all(self, query_params, data):
-        return self.repository.update_all(query_params, data)
+        result = self.repository.update_all(query_params, data)
+        self.clear_status_cache()
+        return result
 
     def delete(self, object_id):
+
+        if self.status_cache is not None:
+            self.status_cache.remove(object_id)
+
         return self.repository.delete(object_id)
 
     def delete_all(self, query_params):
-        return self.repository.delete_all(query_params)
+        result = self.repository.delete_all(query_params)
+        self.clear_status_cache()
+        return result
 
     def find(self, query_params):
         return self.repository.find(query_params)
@@ -31,10 +75,101 @@ class RepositoryService:
         return self.repository.count(query_params)
 
     def exists(self, query_params):
+        cached_query = self._get_cached_query(query_params)
+
+        if cached_query is not None:
+            return self.status_cache.count(*cached_query) > 0
+
         return self.repository.exists(query_params)
 
     def save(self, object):
-        return self.repository.save(object)
+        saved_object = self.repository.save(object)
+        self.add_to_status_cache(saved_object)
+        return saved_object
 
     def save_all(self, objects):
-        return self.repository.save_objects(objects)
+        saved_objects = self.repository.save_objects(objects)
+        self.clear_status_cache()
+        return saved_objects
+
+    def add_to_status_cache(self, item):
+        """
+        Function to add a created or updated object to the status cache.
+
+        Args:
+            item: The object that has been created or updated.
+
+        Returns:
+            None
+        """
+
+        if self.status_cache is not None:
+            self.status_cache.add(item)
+
+    def clear_status_cache(self):
+        """
+        Function to clear the status cache. This function should be
+        called when objects are written without the updated objects
+        being available, e.g. with a bulk operation.
+
+        Returns:
+            None
+        """
+
+        if self.status_cache is not None:
+            self.status_cache.clear()
+
+    def sort_cached_objects(self, objects):
+        """
+        Function to sort the objects served from the status cache in the
+        same order as the repository returns them. The cached objects
+        are given in the order of their ids.
+
+        Args:
+            objects (list): The cached objects.
+
+        Returns:
+            list: The sorted objects.
+        """
+        return objects
+
+    def _get_cached_objects(self, query_params):
+        cached_query = self._get_cached_query(query_params)
+
+        if cached_query is None:
+            return None
+
+        return self.sort_cached_objects(
+            self.status_cache.get(*cached_query)
+        )
+
+    def _get_cached_query(self, query_params):
+
+        if self.status_cache is None or not query_params:
+            return None
+
+        query_params = {
+            key: value for key, value in query_params.items()
+            if value is not None
+        }
+
+        if "status" not in query_params \
+                or not self.CACHEABLE_QUERY_PARAMS.issuperset(query_params):
+            return None
+
+        try:
+            status = self.status_type.from_value(query_params["status"])
+        except (ValueError, OperationalException):
+            return None
+
+        status = status.value
+
+        if status not in self.cached_statuses:
+            return None
+
+        if not self.status_cache.is_loaded(status):
+            self.status_cache.load(
+                status, self.repository.get_all({"status": status})
+            )
+
+        return status, query_params.get("target_symbol")
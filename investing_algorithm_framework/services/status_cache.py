@@ -0,0 +1,157 @@
+from copy import deepcopy
+from threading import RLock
+
+
+class StatusCache:
+    """
+    Cache of repository objects grouped by status and target symbol.
+
+    A status is only served from the cache once it has been loaded. After
+    that the cache is kept up to date by adding the objects that are
+    created or updated, which removes them from the status they had
+    before. The cache is shared by all services of the same type, so that
+    an object written by one service is seen by all other services.
+
+    The cache keeps its own copies of the objects and returns copies of
+    them, so that changing a returned object does not change the cache.
+
+    Attributes:
+        objects (dict): The cached objects as
+            {status: {target_symbol: {id: object}}}.
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self._lock = RLock()
+
+    def is_loaded(self, status) -> bool:
+        """
+        Function to check if a status is loaded in the cache.
+
+        Args:
+            status (str): The status value.
+
+        Returns:
+            bool: True if the objects with the status are cached.
+        """
+        return status in self.objects
+
+    def load(self, status, objects):
+        """
+        Function to load all objects with a status into the cache.
+
+        Args:
+            status (str): The status value.
+            objects (list): All objects with the status.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            symbols = {}
+
+            for item in objects:
+                symbols.setdefault(item.target_symbol, {})[item.id] = item
+
+            self.objects[status] = symbols
+
+    def get(self, status, target_symbol=None):
+        """
+        Function to get copies of the cached objects of a status,
+        optionally filtered on target symbol. The objects are returned
+        in the order of their ids.
+
+        Args:
+            status (str): The status value.
+            target_symbol (str): The target symbol to filter on.
+
+        Returns:
+            list: The copies of the cached objects.
+        """
+
+        with self._lock:
+            items = sorted(
+                self._get_items(status, target_symbol),
+                key=lambda item: item.id
+            )
+            return deepcopy(items)
+
+    def count(self, status, target_symbol=None) -> int:
+        """
+        Function to count the cached objects of a status, optionally
+        filtered on target symbol.
+
+        Args:
+            status (str): The status value.
+            target_symbol (str): The target symbol to filter on.
+
+        Returns:
+            int: The number of cached objects.
+        """
+
+        with self._lock:
+            return len(self._get_items(status, target_symbol))
+
+    def _get_items(self, status, target_symbol):
+        symbols = self.objects.get(status, {})
+
+        if target_symbol is not None:
+            return list(symbols.get(target_symbol, {}).values())
+
+        return [
+            item for objects in symbols.values()
+            for item in objects.values()
+        ]
+
+    def add(self, item):
+        """
+        Function to add a created or updated object to the cache. The
+        object is removed from the status it was cached under before,
+        and a copy of it is added to its current status if that status
+        is loaded.
+
+        Args:
+            item: The object to add.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.remove(item.id)
+            symbols = self.objects.get(item.status)
+
+            if symbols is not None:
+                symbols.setdefault(item.target_symbol, {})[item.id] = \
+                    deepcopy(item)
+
+    def remove(self, object_id):
+        """
+        Function to remove an object from the cache.
+
+        Args:
+            object_id: The id of the object.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+
+            for symbols in self.objects.values():
+
+                for objects in symbols.values():
+                    objects.pop(object_id, None)
+
+    def clear(self):
+        """
+        Function to clear the cache. All statuses are loaded again from
+        the repository on their next query.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.objects = {}
@@ -19,7 +19,12 @@ class TradeService(RepositoryService):
     is responsible for creating, updating, and deleting trades. It also
     takes care of keeping track of all sell transactions that are
     associated with a trade.
+
+    The open trades are served from the optional status cache, that is
+    shared by all trade services.
     """
+    cached_statuses = (TradeStatus.OPEN.value,)
+    status_type = TradeStatus
 
     def __init__(
         self,
@@ -30,9 +35,12 @@ class TradeService(RepositoryService):
         position_repository,
         portfolio_repository,
         configuration_service,
-        order_metadata_repository
+        order_metadata_repository,
+        status_cache=None
     ):
-        super(TradeService, self).__init__(trade_repository)
+        super(TradeService, self).__init__(
+            trade_repository, status_cache=status_cache
+        )
         self.order_repository = order_repository
         self.portfolio_repository = portfolio_repository
         self.position_repository = position_repository
@@ -41,6 +49,12 @@ class TradeService(RepositoryService):
         self.trade_take_profit_repository = trade_take_profit_repository
         self.order_metadata_repository = order_metadata_repository
 
+    def _add_order_to_trade(self, trade, order):
+        self.repository.add_order_to_trade(trade, order)
+
+        # The trade is not reloaded after adding the order
+        self.clear_status_cache()
+
     def create_trade_from_buy_order(self, buy_order) -> Union[Trade, None]:
         """
         Function to create a trade from a buy order. If the given buy
@@ -142,7 +156,7 @@ class TradeService(RepositoryService):
                     update_data["status"] = TradeStatus.CLOSED.value
 
                 self.update(trade_id, update_data)
-                self.repository.add_order_to_trade(trade, sell_order)
+                self._add_order_to_trade(trade, sell_order)
 
                 # Create metadata object
                 self.order_metadata_repository.\
@@ -166,7 +180,7 @@ class TradeService(RepositoryService):
                         "net_gain": trade.net_gain + net_gain
                     }
                 )
-                self.repository.add_order_to_trade(trade, sell_order)
+                self._add_order_to_trade(trade, sell_order)
 
                 # Create an order metadata object
                 self.order_metadata_repository.\
@@ -316,7 +330,7 @@ class TradeService(RepositoryService):
                 })
 
             # Add the sell order to the trade
-            self.repository.add_order_to_trade(trade, sell_order)
+            self._add_order_to_trade(trade, sell_order)
 
             # Update the trade
             net_gain = (sell_price * sell_amount) - open_price * sell_amount
@@ -532,6 +546,9 @@ class TradeService(RepositoryService):
         portfolio.total_net_gain -= total_net_gain
         portfolio.net_size -= total_net_gain
         self.portfolio_repository.save(portfolio)
+
+        # The cached trades contain the updated stop losses and take profits
+        self.clear_status_cache()
         return trade
 
     def update_trade_with_buy_order(
@@ -790,7 +807,9 @@ class TradeService(RepositoryService):
             "sell_percentage": sell_percentage,
             "active": True
         }
-        return self.trade_stop_loss_repository.create(creation_data)
+        stop_loss = self.trade_stop_loss_repository.create(creation_data)
+        self.clear_status_cache()
+        return stop_loss
 
     def add_take_profit(
         self,
@@ -853,7 +872,9 @@ class TradeService(RepositoryService):
             "sell_percentage": sell_percentage,
             "active": True
         }
-        return self.trade_take_profit_repository.create(creation_data)
+        take_profit = self.trade_take_profit_repository.create(creation_data)
+        self.clear_status_cache()
+        return take_profit
 
     def get_triggered_stop_loss_orders(self):
         """
@@ -953,6 +974,11 @@ class TradeService(RepositoryService):
 
         self.trade_stop_loss_repository\
             .save_objects(to_be_saved_stop_loss_objects)
+
+        # The saved stop losses belong to the cached trades
+        if len(to_be_saved_stop_loss_objects) > 0:
+            self.clear_status_cache()
+
         return sell_orders_data
 
     def get_triggered_take_profit_orders(self):
@@ -1060,6 +1086,11 @@ class TradeService(RepositoryService):
 
         self.trade_take_profit_repository\
             .save_objects(to_be_saved_take_profit_objects)
+
+        # The saved take profits belong to the cached trades
+        if len(to_be_saved_take_profit_objects) > 0:
+            self.clear_status_cache()
+
         return sell_orders_data
 
     def _create_order_id(self) -> str:
@@ -0,0 +1,144 @@
+import os
+import shutil
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+from investing_algorithm_framework import create_app, RESOURCE_DIRECTORY, \
+    TradingStrategy, PortfolioConfiguration, TimeUnit, Algorithm, \
+    BacktestDateRange, INDEX_DATETIME, SnapshotInterval
+from investing_algorithm_framework.domain import BACKTEST_FAST_FORWARD
+from investing_algorithm_framework.services import DataProviderService
+
+END_DATE = datetime(2023, 12, 2, tzinfo=timezone.utc)
+START_DATE = END_DATE - timedelta(days=1)
+
+
+class EntrySignalStrategy(TradingStrategy):
+    strategy_id = "entry_signal_strategy"
+    time_unit = TimeUnit.MINUTE
+    interval = 30
+    data_sources = []
+
+    def __init__(self, entry_signal_dates=None):
+        super().__init__()
+        self.entry_signal_dates = entry_signal_dates
+        self.runs = []
+
+    def generate_entry_signal_dates(self, data):
+        return self.entry_signal_dates
+
+    def run_strategy(self, context, data):
+        self.runs.append(context.config[INDEX_DATETIME])
+
+
+class DefaultStrategy(TradingStrategy):
+    strategy_id = "default_strategy"
+    time_unit = TimeUnit.MINUTE
+    interval = 30
+    data_sources = []
+
+    def __init__(self):
+        super().__init__()
+        self.runs = []
+
+    def run_strategy(self, context, data):
+        self.runs.append(context.config[INDEX_DATETIME])
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.resource_directory = os.path.abspath(
+            os.path.join(
+                os.path.realpath(__file__),
+                os.pardir,
+                os.pardir,
+                os.pardir,
+                "resources"
+            )
+        )
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        for directory in ["databases", "backtest_databases"]:
+            path = os.path.join(self.resource_directory, directory)
+
+            if os.path.exists(path):
+                shutil.rmtree(path)
+
+    def run_backtest(self, strategy, fast_forward):
+        app = create_app(
+            config={
+                RESOURCE_DIRECTORY: self.resource_directory,
+                BACKTEST_FAST_FORWARD: fast_forward
+            }
+        )
+        algorithm = Algorithm()
+        algorithm.add_strategy(strategy)
+        app.add_portfolio_configuration(
+            PortfolioConfiguration(
+                market="bitvavo",
+                trading_symbol="EUR",
+                initial_balance=1000
+            )
+        )
+        return app.run_backtest(
+            algorithm=algorithm,
+            backtest_date_range=BacktestDateRange(
+                start_date=START_DATE, end_date=END_DATE
+            ),
+            snapshot_interval=SnapshotInterval.STRATEGY_ITERATION,
+            risk_free_rate=0.027
+        )
+
+    def test_fast_forward_runs_strategy_on_entry_signals(self):
+        strategy = EntrySignalStrategy(
+            entry_signal_dates=[
+                START_DATE + timedelta(minutes=10),
+                START_DATE + timedelta(hours=5),
+                # Naive dates are interpreted as UTC
+                datetime(2023, 12, 1, 12, 45),
+                # Dates after the last schedule date are ignored
+                END_DATE + timedelta(minutes=10),
+            ]
+        )
+        backtest = self.run_backtest(strategy, fast_forward=True)
+        self.assertEqual(
+            [
+                START_DATE + timedelta(minutes=30),
+                START_DATE + timedelta(hours=5),
+                START_DATE + timedelta(hours=13),
+            ],
+            strategy.runs
+        )
+
+        # Snapshots are still taken at every schedule date
+        run = backtest.get_all_backtest_runs()[0]
+        self.assertEqual(49, len(run.portfolio_snapshots))
+
+    def test_fast_forward_without_entry_signal_dates(self):
+        strategy = EntrySignalStrategy(entry_signal_dates=None)
+        self.run_backtest(strategy, fast_forward=True)
+        self.assertEqual(49, len(strategy.runs))
+
+    def test_entry_signal_dates_without_fast_forward(self):
+        strategy = EntrySignalStrategy(entry_signal_dates=[])
+        self.run_backtest(strategy, fast_forward=False)
+        self.assertEqual(49, len(strategy.runs))
+
+    def test_fast_forward_without_generate_entry_signal_dates(self):
+        strategy = DefaultStrategy()
+        self.assertFalse(strategy.supports_fast_forward)
+        self.assertTrue(EntrySignalStrategy().supports_fast_forward)
+
+        # The data for the entry signal dates is not loaded for
+        # strategies that do not implement generate_entry_signal_dates
+        with patch.object(
+            DataProviderService, "get_vectorized_backtest_data"
+        ) as get_vectorized_backtest_data:
+            self.run_backtest(strategy, fast_forward=True)
+            get_vectorized_backtest_data.assert_not_called()
+
+        self.assertEqual(49, len(strategy.runs))
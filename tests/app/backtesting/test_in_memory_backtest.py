@@ -0,0 +1,172 @@
+import os
+import shutil
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from investing_algorithm_framework import create_app, RESOURCE_DIRECTORY, \
+    TradingStrategy, TimeUnit, BacktestDateRange, DataSource, \
+    PortfolioConfiguration, CSVOHLCVDataProvider, Algorithm, \
+    SnapshotInterval
+from investing_algorithm_framework.domain import IN_MEMORY_BACKTEST_STORAGE
+from investing_algorithm_framework.infrastructure import Session
+
+
+class MovingAverageStrategy(TradingStrategy):
+    strategy_id = "moving_average"
+    time_unit = TimeUnit.HOUR
+    interval = 2
+    data_sources = [
+        DataSource(
+            identifier="BTC/EUR-ohlcv-2h",
+            data_type="ohlcv",
+            market="BITVAVO",
+            symbol="BTC/EUR",
+            time_frame="2h",
+            window_size=20,
+            pandas=True
+        )
+    ]
+
+    def run_strategy(self, context, data):
+        df = data["BTC/EUR-ohlcv-2h"]
+        close = df["Close"][-1]
+        moving_average = df["Close"].mean()
+
+        if not context.has_position("BTC") \
+                and not context.has_open_orders("BTC") \
+                and close > moving_average:
+            context.create_limit_order(
+                target_symbol="BTC",
+                price=close,
+                order_side="BUY",
+                percentage_of_portfolio=20
+            )
+        elif context.has_position("BTC") \
+                and not context.has_open_orders("BTC") \
+                and close < moving_average:
+            context.create_limit_order(
+                target_symbol="BTC",
+                price=close,
+                order_side="SELL",
+                percentage_of_position=100
+            )
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.resource_directory = os.path.abspath(
+            os.path.join(
+                os.path.realpath(__file__),
+                os.pardir,
+                os.pardir,
+                os.pardir,
+                "resources"
+            )
+        )
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        for directory in ["databases", "backtest_databases"]:
+            path = os.path.join(self.resource_directory, directory)
+
+            if os.path.exists(path):
+                shutil.rmtree(path)
+
+    def run_backtest(self, in_memory):
+        app = create_app(
+            config={
+                RESOURCE_DIRECTORY: self.resource_directory,
+                IN_MEMORY_BACKTEST_STORAGE: in_memory
+            }
+        )
+        app.add_data_provider(
+            CSVOHLCVDataProvider(
+                storage_path=os.path.join(
+                    self.resource_directory,
+                    "data",
+                    "OHLCV_BTC-EUR_BITVAVO_2h_2021-11-24-08-00_"
+                    "2023-12-31-00-00.csv"
+                ),
+                symbol="BTC/EUR",
+                time_frame="2h",
+                market="BITVAVO",
+                data_provider_identifier="BTC/EUR-ohlcv-2h",
+                pandas=True
+            ),
+            priority=0
+        )
+        app.add_portfolio_configuration(
+            PortfolioConfiguration(
+                market="BITVAVO",
+                trading_symbol="EUR",
+                initial_balance=1000
+            )
+        )
+        algorithm = Algorithm()
+        algorithm.add_strategy(MovingAverageStrategy())
+        backtest = app.run_backtest(
+            algorithm=algorithm,
+            backtest_date_range=BacktestDateRange(
+                start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                end_date=datetime(2023, 2, 1, tzinfo=timezone.utc)
+            ),
+            snapshot_interval=SnapshotInterval.STRATEGY_ITERATION,
+            risk_free_rate=0.027
+        )
+        return backtest.get_all_backtest_runs()[0]
+
+    def test_in_memory_backtest_without_database(self):
+        # An in-memory backtest in a new process has no database set up
+        bind = Session.kw.get("bind")
+        Session.configure(bind=None)
+
+        try:
+            run = self.run_backtest(in_memory=True)
+        finally:
+            Session.configure(bind=bind)
+
+        self.assertNotEqual(0, len(run.trades))
+        self.assertNotEqual(0, len(run.portfolio_snapshots))
+
+    def test_in_memory_backtest_matches_sql_backtest(self):
+        sql_run = self.run_backtest(in_memory=False)
+        in_memory_run = self.run_backtest(in_memory=True)
+        self.assertNotEqual(0, len(sql_run.orders))
+        self.assertNotEqual(0, len(sql_run.trades))
+
+        for attribute in [
+            "orders", "trades", "positions", "portfolio_snapshots"
+        ]:
+            self.assertEqual(
+                [
+                    self._to_comparable_dict(item.to_dict())
+                    for item in getattr(sql_run, attribute)
+                ],
+                [
+                    self._to_comparable_dict(item.to_dict())
+                    for item in getattr(in_memory_run, attribute)
+                ],
+                attribute
+            )
+
+    def _to_comparable_dict(self, data):
+        # Order ids are random and updated_at is the time of the update,
+        # so these differ between any two runs. The orders of a trade are
+        # loaded in the order of their ids by the SQL repositories.
+        comparable_data = {
+            key: value for key, value in data.items()
+            if key not in ("id", "updated_at")
+        }
+
+        if "orders" in comparable_data:
+            comparable_data["orders"] = sorted(
+                [
+                    self._to_comparable_dict(order)
+                    for order in comparable_data["orders"]
+                ],
+                key=lambda order: (order["created_at"], order["order_side"])
+            )
+
+        return comparable_data
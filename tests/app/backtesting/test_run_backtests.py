@@ -16,6 +16,26 @@ class TestStrategy(TradingStrategy):
         pass
 
 
+class MinutelyTestStrategy(TradingStrategy):
+    strategy_id = "minutely_test_strategy"
+    time_unit = TimeUnit.MINUTE
+    interval = 1
+    data_sources = []
+
+    def run_strategy(self, context, data):
+        pass
+
+
+class HalfHourlyTestStrategy(TradingStrategy):
+    strategy_id = "half_hourly_test_strategy"
+    time_unit = TimeUnit.MINUTE
+    interval = 30
+    data_sources = []
+
+    def run_strategy(self, context, data):
+        pass
+
+
 class Test(TestCase):
     """
     Collection of tests for backtest report operations
@@ -82,3 +102,59 @@ class Test(TestCase):
             risk_free_rate=0.027
         )
         self.assertEqual(3, len(reports))
+
+    def test_run_backtests_with_workers(self):
+        """
+        Test if the backtests are run in worker processes and returned
+        in the order of the date ranges and algorithms
+        """
+        app = create_app(
+            config={RESOURCE_DIRECTORY: self.resource_dir}
+        )
+        algorithm_one = Algorithm()
+        algorithm_one.add_strategy(MinutelyTestStrategy())
+        algorithm_two = Algorithm()
+        algorithm_two.add_strategy(HalfHourlyTestStrategy())
+        app.add_portfolio_configuration(
+            PortfolioConfiguration(
+                market="bitvavo",
+                trading_symbol="EUR",
+                initial_balance=1000
+            )
+        )
+        end_date = datetime(2023, 12, 2, tzinfo=timezone.utc)
+        start_date = end_date - timedelta(days=1)
+        date_range_one = BacktestDateRange(
+            start_date=start_date,
+            end_date=end_date
+        )
+        date_range_two = BacktestDateRange(
+            start_date=end_date,
+            end_date=end_date + timedelta(hours=12)
+        )
+        reports = app.run_backtests(
+            algorithms=[algorithm_one, algorithm_two],
+            backtest_date_ranges=[date_range_one, date_range_two],
+            risk_free_rate=0.027,
+            workers=2
+        )
+        runs = [report.get_all_backtest_runs()[0] for report in reports]
+        self.assertEqual(
+            [start_date, start_date, end_date, end_date],
+            [run.backtest_start_date for run in runs]
+        )
+        self.assertEqual(
+            [1441, 49, 721, 25], [run.number_of_runs for run in runs]
+        )
+
+        # The databases of the worker processes are removed
+        backtest_database_dir = os.path.join(
+            self.resource_dir, "backtest_databases"
+        )
+        self.assertEqual(
+            [],
+            [
+                file_name for file_name in os.listdir(backtest_database_dir)
+                if file_name.startswith(f"backtest-database-{os.getpid()}-")
+            ]
+        )
@@ -0,0 +1,193 @@
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import Dict, Any
+from unittest import TestCase
+
+import pandas as pd
+import polars as pl
+
+from investing_algorithm_framework import create_app, RESOURCE_DIRECTORY, \
+    TradingStrategy, TimeUnit, BacktestDateRange, DataSource, \
+    PositionSize, CSVOHLCVDataProvider
+from investing_algorithm_framework.domain import convert_polars_to_pandas
+
+
+class MovingAverageStrategy(TradingStrategy):
+    time_unit = TimeUnit.HOUR
+    interval = 2
+    symbols = ["BTC"]
+    position_sizes = [
+        PositionSize(symbol="BTC", percentage_of_portfolio=20.0)
+    ]
+
+    def __init__(self, period):
+        self.period = period
+        super().__init__(
+            strategy_id=f"moving_average_{period}",
+            data_sources=[
+                DataSource(
+                    identifier="BTC/EUR-ohlcv-2h",
+                    data_type="ohlcv",
+                    market="BITVAVO",
+                    symbol="BTC/EUR",
+                    time_frame="2h",
+                    window_size=period,
+                    pandas=True
+                )
+            ]
+        )
+
+    def _moving_average(self, data):
+        df = data["BTC/EUR-ohlcv-2h"]
+
+        if isinstance(df, pl.DataFrame):
+            df = convert_polars_to_pandas(df)
+
+        df["moving_average"] = df["Close"].rolling(self.period).mean()
+        return df
+
+    def generate_buy_signals(
+        self, data: Dict[str, Any]
+    ) -> Dict[str, pd.Series]:
+        df = self._moving_average(data)
+        return {"BTC": df["Close"] > df["moving_average"]}
+
+    def generate_sell_signals(
+        self, data: Dict[str, Any]
+    ) -> Dict[str, pd.Series]:
+        df = self._moving_average(data)
+        return {"BTC": df["Close"] < df["moving_average"]}
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.resource_directory = os.path.abspath(
+            os.path.join(
+                os.path.realpath(__file__),
+                os.pardir,
+                os.pardir,
+                os.pardir,
+                "resources"
+            )
+        )
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        for directory in ["databases", "backtest_databases"]:
+            path = os.path.join(self.resource_directory, directory)
+
+            if os.path.exists(path):
+                shutil.rmtree(path)
+
+    def run_vector_backtests(self, strategies, workers=None):
+        app = create_app(
+            config={RESOURCE_DIRECTORY: self.resource_directory}
+        )
+        app.add_data_provider(
+            CSVOHLCVDataProvider(
+                storage_path=os.path.join(
+                    self.resource_directory,
+                    "data",
+                    "OHLCV_BTC-EUR_BITVAVO_2h_2021-11-24-08-00_"
+                    "2023-12-31-00-00.csv"
+                ),
+                symbol="BTC/EUR",
+                time_frame="2h",
+                market="BITVAVO",
+                data_provider_identifier="BTC/EUR-ohlcv-2h",
+                pandas=True
+            ),
+            priority=0
+        )
+        return app.run_vector_backtests(
+            initial_amount=1000,
+            strategies=strategies,
+            backtest_date_ranges=[
+                BacktestDateRange(
+                    start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                    end_date=datetime(2023, 6, 1, tzinfo=timezone.utc)
+                ),
+                BacktestDateRange(
+                    start_date=datetime(2023, 6, 1, tzinfo=timezone.utc),
+                    end_date=datetime(2023, 12, 1, tzinfo=timezone.utc)
+                ),
+            ],
+            risk_free_rate=0.027,
+            market="BITVAVO",
+            trading_symbol="EUR",
+            show_progress=False,
+            workers=workers
+        )
+
+    def test_run_vector_backtests_with_workers(self):
+        periods = [20, 50, 100]
+        backtests = self.run_vector_backtests(
+            [MovingAverageStrategy(period) for period in periods]
+        )
+        worker_backtests = self.run_vector_backtests(
+            [MovingAverageStrategy(period) for period in periods],
+            workers=2
+        )
+        self.assertEqual(3, len(worker_backtests))
+
+        for backtest, worker_backtest in zip(backtests, worker_backtests):
+            runs = backtest.get_all_backtest_runs()
+            worker_runs = worker_backtest.get_all_backtest_runs()
+            self.assertEqual(2, len(worker_runs))
+
+            for run, worker_run in zip(runs, worker_runs):
+                self.assertEqual(
+                    run.backtest_start_date, worker_run.backtest_start_date
+                )
+                self.assertNotEqual(0, len(worker_run.trades))
+                self.assertEqual(len(run.trades), len(worker_run.trades))
+                self.assertEqual(
+                    run.portfolio_snapshots[-1].total_value,
+                    worker_run.portfolio_snapshots[-1].total_value
+                )
+
+        # The strategies with a longer moving average trade less often
+        number_of_trades = [
+            len(backtest.get_all_backtest_runs()[0].trades)
+            for backtest in worker_backtests
+        ]
+        self.assertEqual(
+            sorted(number_of_trades, reverse=True), number_of_trades
+        )
+
+    def test_portfolio_snapshots_match_trades(self):
+        backtest = self.run_vector_backtests([MovingAverageStrategy(20)])[0]
+        run = backtest.get_all_backtest_runs()[0]
+        snapshots = run.portfolio_snapshots
+        closed_trades = [
+            trade for trade in run.trades if trade.closed_at is not None
+        ]
+        open_trades = [
+            trade for trade in run.trades if trade.closed_at is None
+        ]
+        total_net_gain = sum(trade.net_gain for trade in closed_trades)
+        open_value = sum(
+            trade.filled_amount * trade.last_reported_price
+            for trade in open_trades
+        )
+        unallocated = 1000 + total_net_gain - sum(
+            trade.cost for trade in open_trades
+        )
+
+        self.assertEqual(
+            run.backtest_start_date, snapshots[0].created_at
+        )
+        self.assertAlmostEqual(total_net_gain, snapshots[-1].total_net_gain)
+        self.assertAlmostEqual(unallocated, snapshots[-1].unallocated)
+        self.assertAlmostEqual(
+            unallocated + open_value, snapshots[-1].total_value
+        )
+
+        for trade in closed_trades:
+            self.assertAlmostEqual(
+                trade.net_gain,
+                (trade.orders[-1].price - trade.open_price) * trade.amount
+            )
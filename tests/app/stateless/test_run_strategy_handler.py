@@ -0,0 +1,74 @@
+from investing_algorithm_framework.app.stateless.action_handlers import \
+    RunStrategyHandler
+from investing_algorithm_framework.domain import PortfolioConfiguration, \
+    MarketCredential, OrderSide, OrderType, OrderStatus
+from tests.resources import TestBase
+
+
+class FailingStrategyOrchestratorService:
+    """
+    Strategy orchestrator that creates an open order and then fails.
+    """
+
+    def __init__(self, order_service, portfolio):
+        self.order_service = order_service
+        self.portfolio = portfolio
+
+    def get_strategies(self, strategy_ids):
+        return ["failing_strategy"]
+
+    def get_tasks(self):
+        return []
+
+    def run_strategy(self, strategy, context, sync):
+        self.order_service.create(
+            {
+                "portfolio_id": self.portfolio.id,
+                "target_symbol": "BTC",
+                "amount": 1,
+                "trading_symbol": "EUR",
+                "price": 10,
+                "order_side": OrderSide.BUY.value,
+                "order_type": OrderType.LIMIT.value,
+                "status": OrderStatus.OPEN.value,
+            },
+            execute=False
+        )
+        raise ValueError()
+
+
+class TestRunStrategyHandler(TestBase):
+    market_credentials = [
+        MarketCredential(
+            market="BINANCE",
+            api_key="api_key",
+            secret_key="secret_key",
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="BINANCE",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000,
+    }
+
+    def test_rolled_back_orders_are_not_cached(self):
+        order_service = self.app.container.order_service()
+        portfolio = self.app.container.portfolio_service().get_all()[0]
+        self.assertFalse(order_service.exists({"status": "OPEN"}))
+        strategy_orchestrator_service = FailingStrategyOrchestratorService(
+            order_service, portfolio
+        )
+
+        with self.assertRaises(ValueError):
+            RunStrategyHandler().handle_event(
+                {}, self.app.context, strategy_orchestrator_service
+            )
+
+        self.assertFalse(order_service.exists({"status": "OPEN"}))
+        self.assertEqual(
+            [], order_service.get_all({"status": OrderStatus.OPEN})
+        )
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+import polars as pl
+
+from investing_algorithm_framework.domain import get_missing_data_gaps, \
+    clip_missing_data_gaps, expand_missing_data_gaps, count_data_points, \
+    create_missing_data_gaps
+
+
+class TestDataCompleteness(TestCase):
+
+    def setUp(self):
+        self.start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        self.end = self.start + timedelta(hours=99)
+        missing = set(range(10, 15)) | {40} | set(range(95, 100))
+        self.dates = [
+            self.start + timedelta(hours=i)
+            for i in range(100) if i not in missing
+        ]
+        self.missing_dates = sorted(
+            self.start + timedelta(hours=i) for i in missing
+        )
+        self.data = pl.DataFrame({"Datetime": self.dates}).with_columns(
+            pl.col("Datetime").cast(
+                pl.Datetime(time_unit="ms", time_zone="UTC")
+            )
+        )
+
+    def test_get_missing_data_gaps(self):
+        gaps = get_missing_data_gaps(self.data, self.start, self.end, "1h")
+        self.assertEqual(["start", "end", "length"], gaps.columns)
+        self.assertEqual(
+            [
+                (self.start + timedelta(hours=10),
+                 self.start + timedelta(hours=14), 5),
+                (self.start + timedelta(hours=40),
+                 self.start + timedelta(hours=40), 1),
+                (self.start + timedelta(hours=95),
+                 self.start + timedelta(hours=99), 5),
+            ],
+            gaps.rows()
+        )
+        self.assertEqual(
+            self.missing_dates, expand_missing_data_gaps(gaps, "1h")
+        )
+        self.assertTrue(
+            gaps.equals(create_missing_data_gaps(self.missing_dates, "1h"))
+        )
+
+    def test_clip_missing_data_gaps(self):
+        gaps = get_missing_data_gaps(self.data, self.start, self.end, "1h")
+        start_date = self.start + timedelta(hours=12, minutes=30)
+        end_date = self.start + timedelta(hours=96)
+        clipped = clip_missing_data_gaps(gaps, start_date, end_date, "1h")
+        self.assertEqual([2, 1, 2], clipped["length"].to_list())
+        self.assertEqual(
+            [
+                date for date in self.missing_dates
+                if start_date <= date <= end_date
+            ],
+            expand_missing_data_gaps(clipped, "1h")
+        )
+
+    def test_count_data_points(self):
+        start_date = self.start + timedelta(hours=5)
+        end_date = self.start + timedelta(hours=50)
+        self.assertEqual(
+            len([d for d in self.dates if start_date <= d <= end_date]),
+            count_data_points(self.data, start_date, end_date)
+        )
+        self.assertEqual(0, count_data_points(self.data, end_date, start_date))
@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+import pandas as pd
+import polars as pl
+
+from investing_algorithm_framework.domain import SlidingWindowIndex, \
+    convert_polars_to_pandas
+
+
+class TestSlidingWindowIndex(TestCase):
+
+    def setUp(self):
+        self.start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        self.data = pl.DataFrame({
+            "Datetime": [
+                self.start + timedelta(hours=i) for i in range(100)
+            ],
+            "Close": [float(i) for i in range(100)],
+        }).with_columns(
+            pl.col("Datetime").cast(
+                pl.Datetime(time_unit="ms", time_zone="UTC")
+            )
+        )
+
+    def test_windows_equal_filtered_data(self):
+        duration = timedelta(hours=10)
+        index = SlidingWindowIndex.from_data(
+            data=self.data,
+            window_duration=duration,
+            start_date=self.start + timedelta(hours=5),
+            end_date=self.start + timedelta(hours=80),
+        )
+        self.assertEqual(76, len(index))
+
+        for key, window in index.items():
+            expected = self.data.filter(
+                (pl.col("Datetime") <= key) &
+                (pl.col("Datetime") >= key - duration)
+            )
+            self.assertTrue(expected.equals(window))
+
+    def test_missing_key(self):
+        index = SlidingWindowIndex.from_data(
+            data=self.data,
+            window_duration=timedelta(hours=10),
+            start_date=self.start,
+            end_date=self.start + timedelta(hours=10),
+        )
+        date = self.start + timedelta(minutes=30)
+        self.assertNotIn(date, index)
+
+        with self.assertRaises(KeyError):
+            index[date]
+
+    def test_add(self):
+        index = SlidingWindowIndex.from_data(
+            data=self.data,
+            window_duration=timedelta(hours=10),
+            start_date=self.start,
+            end_date=self.start + timedelta(hours=10),
+        )
+        date = self.start + timedelta(days=30)
+        index.add(date, start=90, end=100)
+        self.assertIn(date, index)
+        self.assertEqual(date, list(index)[-1])
+        self.assertEqual(10, len(index[date]))
+        self.assertEqual(99.0, index[date]["Close"][-1])
+
+    def test_get_as_of(self):
+        index = SlidingWindowIndex.from_data(
+            data=self.data,
+            window_duration=timedelta(hours=10),
+            start_date=self.start + timedelta(hours=20),
+            end_date=self.start + timedelta(hours=40),
+        )
+        date = self.start + timedelta(hours=25, minutes=30)
+        window = index.get_as_of(date, direction="next")
+        self.assertEqual(26.0, window["Close"][-1])
+        window = index.get_as_of(date, direction="previous")
+        self.assertEqual(25.0, window["Close"][-1])
+
+        exact = self.start + timedelta(hours=30)
+        self.assertEqual(exact, index.get_as_of_key(exact, "next"))
+        self.assertEqual(exact, index.get_as_of_key(exact, "previous"))
+
+        self.assertIsNone(
+            index.get_as_of(self.start + timedelta(hours=41), "next")
+        )
+        self.assertIsNone(
+            index.get_as_of(self.start + timedelta(hours=19), "previous")
+        )
+
+        with self.assertRaises(ValueError):
+            index.get_as_of(date, direction="nearest")
+
+    def test_get_as_of_pandas(self):
+        index = SlidingWindowIndex.from_data(
+            data=self.data,
+            window_duration=timedelta(hours=10),
+            start_date=self.start + timedelta(hours=20),
+            end_date=self.start + timedelta(hours=40),
+        )
+        date = self.start + timedelta(hours=25, minutes=30)
+        window = index.get_as_of(date, direction="next", pandas=True)
+        pd.testing.assert_frame_equal(
+            convert_polars_to_pandas(index.get_as_of(date, "next")), window
+        )
+
+        # The data is converted once and windows are copies of it
+        pandas_data = index.pandas_data
+        window["Close"] = 0.0
+        index.get_as_of(date, direction="previous", pandas=True)
+        self.assertIs(pandas_data, index.pandas_data)
+        self.assertEqual(26.0, pandas_data["Close"].iloc[26])
+
+    def test_get_price_index(self):
+        index = SlidingWindowIndex.from_data(
+            data=self.data,
+            window_duration=timedelta(hours=10),
+            start_date=self.start + timedelta(hours=20),
+            end_date=self.start + timedelta(hours=40),
+        )
+        index.add(self.start + timedelta(hours=45, minutes=30), 30, 40)
+        price_index = index.get_price_index()
+        self.assertIs(price_index, index.get_price_index())
+
+        for minutes in range(0, 50 * 60, 45):
+            date = self.start + timedelta(minutes=minutes)
+
+            for direction in ["next", "previous"]:
+                window = index.get_as_of(date, direction)
+                entry = price_index.get_as_of(date, direction)
+
+                if window is None:
+                    self.assertIsNone(entry)
+                else:
+                    self.assertEqual(window["Datetime"][-1], entry["datetime"])
+                    self.assertEqual(window["Close"][-1], entry["close"])
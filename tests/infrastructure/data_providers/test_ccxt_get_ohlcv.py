@@ -0,0 +1,117 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+from ccxt.base.exchange import Exchange
+import polars as pl
+
+from investing_algorithm_framework.domain import TimeFrame
+from investing_algorithm_framework.infrastructure import \
+    CCXTOHLCVDataProvider
+
+
+class PagedExchange(Exchange):
+    """
+    Exchange stub that returns pages of 100 hourly candles.
+    """
+
+    def __init__(self):
+        super().__init__({})
+        self.rateLimit = 0
+        self.has = dict(self.has, fetchOHLCV=True)
+
+    def fetch_ohlcv(
+        self, symbol, timeframe="1m", since=None, limit=None, params={}
+    ):
+        duration = self.parse_timeframe(timeframe) * 1000
+        return [
+            [since + index * duration, 1.0, 2.0, 0.5, 1.5, index]
+            for index in range(100)
+        ]
+
+
+class Test(TestCase):
+
+    @patch.object(
+        CCXTOHLCVDataProvider,
+        "initialize_exchange",
+        return_value=PagedExchange()
+    )
+    def test_get_ohlcv_decodes_pages(self, _):
+        data_provider = CCXTOHLCVDataProvider()
+        start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        end_date = datetime(2023, 1, 10, 12, 30, tzinfo=timezone.utc)
+        data = data_provider.get_ohlcv(
+            symbol="btc/eur",
+            time_frame=TimeFrame.ONE_HOUR,
+            from_timestamp=start_date,
+            market="BINANCE",
+            to_timestamp=end_date,
+        )
+
+        self.assertEqual(
+            ["Datetime", "Open", "High", "Low", "Close", "Volume"],
+            data.columns
+        )
+        self.assertEqual(
+            pl.Datetime(time_unit="ms", time_zone="UTC"),
+            data["Datetime"].dtype
+        )
+        self.assertEqual(start_date, data["Datetime"].min())
+
+        # The candles after the end date of the last page are filtered out
+        self.assertEqual(
+            datetime(2023, 1, 10, 12, tzinfo=timezone.utc),
+            data["Datetime"].max()
+        )
+        self.assertEqual(9 * 24 + 13, len(data))
+        self.assertEqual(len(data), data["Datetime"].n_unique())
+
+    def test_get_data_live_only_fetches_new_candles(self):
+        requested_ranges = []
+        close = {"value": 1.0}
+
+        def get_ohlcv(
+            symbol, time_frame, from_timestamp, market, to_timestamp=None
+        ):
+            requested_ranges.append((from_timestamp, to_timestamp))
+            dates = pl.datetime_range(
+                from_timestamp, to_timestamp, "1h", eager=True
+            )
+            return pl.DataFrame({
+                "Datetime": dates,
+                "Open": [1.0] * len(dates),
+                "High": [1.0] * len(dates),
+                "Low": [1.0] * len(dates),
+                "Close": [close["value"]] * len(dates),
+                "Volume": [1.0] * len(dates),
+            }).with_columns(
+                pl.col("Datetime").cast(
+                    pl.Datetime(time_unit="ms", time_zone="UTC")
+                )
+            )
+
+        data_provider = CCXTOHLCVDataProvider(
+            symbol="BTC/EUR",
+            market="BINANCE",
+            time_frame="1h",
+            window_size=10,
+        )
+        data_provider.get_ohlcv = get_ohlcv
+        date = datetime(2023, 1, 1, 12, tzinfo=timezone.utc)
+        data = data_provider.get_data(date=date)
+        self.assertEqual(11, len(data))
+
+        # The next call only fetches from the last, possibly still
+        # forming, candle on
+        close["value"] = 2.0
+        next_date = datetime(2023, 1, 1, 14, tzinfo=timezone.utc)
+        data = data_provider.get_data(date=next_date)
+        self.assertEqual((date, next_date), requested_ranges[-1])
+        self.assertEqual(11, len(data))
+        self.assertEqual(next_date, data["Datetime"][-1])
+        self.assertEqual(
+            datetime(2023, 1, 1, 4, tzinfo=timezone.utc),
+            data["Datetime"][0]
+        )
+        self.assertEqual([1.0] * 8 + [2.0] * 3, data["Close"].to_list())
@@ -1,4 +1,7 @@
+import gzip
 import os
+import shutil
+import tempfile
 from datetime import datetime, timedelta, timezone
 from unittest import TestCase
 
@@ -57,6 +60,46 @@ class Test(TestCase):
             df.columns
         )
 
+    def test_csv_file_without_csv_extension(self):
+        file_name = "OHLCV_BTC-EUR_BINANCE" \
+                    "_2h_2023-08-07-07-59_2023-12-02-00-00.csv"
+        file_path = f"{self.resource_dir}/market_data_sources/{file_name}"
+        data_source = DataSource(
+            market="binance",
+            symbol="BTC/EUR",
+            time_frame="2h",
+            data_type="OHLCV",
+            window_size=200
+        )
+        date = datetime(2023, 8, 7, 8, 0, tzinfo=timezone.utc)
+        expected = CSVOHLCVDataProvider(
+            storage_path=file_path,
+            window_size=10,
+            market="binance",
+            symbol="BTC/EUR",
+            time_frame="2h"
+        ).get_data(data_source, start_date=date)
+
+        with tempfile.TemporaryDirectory() as directory:
+            txt_file_path = os.path.join(directory, "ohlcv.txt")
+            gzip_file_path = os.path.join(directory, "ohlcv.csv.gz")
+            shutil.copy(file_path, txt_file_path)
+
+            with open(file_path, "rb") as source, \
+                    gzip.open(gzip_file_path, "wb") as target:
+                shutil.copyfileobj(source, target)
+
+            for storage_path in [txt_file_path, gzip_file_path]:
+                data_provider = CSVOHLCVDataProvider(
+                    storage_path=storage_path,
+                    window_size=10,
+                    market="binance",
+                    symbol="BTC/EUR",
+                    time_frame="2h"
+                )
+                df = data_provider.get_data(data_source, start_date=date)
+                self.assertTrue(expected.equals(df))
+
     def test_throw_exception_when_missing_column_names_columns(self):
         file_name = "OHLCV_BTC-EUR_BINANCE_2h_NO_COLUMNS_2023-" \
                     "08-07-07-59_2023-12-02-00-00.csv"
@@ -377,3 +420,42 @@ class Test(TestCase):
                 minutes=TimeFrame.from_value(datasource.time_frame)
                 .amount_of_minutes
             )
+
+    def test_prepare_backtest_data_loads_only_required_rows(self):
+        file_name = "OHLCV_BTC-EUR_BINANCE" \
+                    "_2h_2023-08-07-07-59_2023-12-02-00-00.csv"
+        data_provider = CSVOHLCVDataProvider(
+            storage_path=f"{self.resource_dir}/"
+                         "market_data_sources/"
+                         f"{file_name}",
+            market="binance",
+            symbol="BTC/EUR",
+            time_frame="2h",
+            window_size=10,
+            columns=["Close"]
+        )
+
+        # Only the header and the date range are read on initialization
+        self.assertIsNone(data_provider._data)
+        self.assertEqual(
+            datetime(2023, 8, 7, 8, 0, tzinfo=timezone.utc),
+            data_provider._start_date_data_source
+        )
+
+        start_date = datetime(2023, 11, 1, tzinfo=timezone.utc)
+        end_date = datetime(2023, 11, 10, tzinfo=timezone.utc)
+        data_provider.prepare_backtest_data(start_date, end_date)
+        self.assertEqual(["Datetime", "Close"], data_provider.data.columns)
+        self.assertEqual(
+            start_date - timedelta(hours=20),
+            data_provider.data["Datetime"].min()
+        )
+        self.assertEqual(end_date, data_provider.data["Datetime"].max())
+
+        # Ranges outside the loaded rows are scanned from the file
+        data = data_provider.get_backtest_data(
+            backtest_index_date=end_date,
+            backtest_start_date=datetime(2023, 9, 1, tzinfo=timezone.utc),
+            backtest_end_date=datetime(2023, 9, 2, tzinfo=timezone.utc)
+        )
+        self.assertEqual(13, len(data))
@@ -0,0 +1,35 @@
+import threading
+from time import monotonic
+from unittest import TestCase
+
+from investing_algorithm_framework.infrastructure import MarketRateLimiter
+
+
+class Test(TestCase):
+
+    def test_requests_to_same_market_are_spaced(self):
+        rate_limiter = MarketRateLimiter()
+        request_times = []
+
+        def request():
+            rate_limiter.acquire("binance", 0.05)
+            request_times.append(monotonic())
+
+        threads = [threading.Thread(target=request) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        request_times.sort()
+
+        for previous, current in zip(request_times, request_times[1:]):
+            self.assertGreaterEqual(current - previous, 0.04)
+
+    def test_markets_have_separate_budgets(self):
+        rate_limiter = MarketRateLimiter()
+        self.assertEqual(0, rate_limiter.acquire("BINANCE", 0.2))
+        self.assertEqual(0, rate_limiter.acquire("BITVAVO", 0.2))
+        self.assertGreater(rate_limiter.acquire("binance", 0.2), 0.1)
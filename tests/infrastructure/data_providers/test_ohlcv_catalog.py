@@ -0,0 +1,135 @@
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from investing_algorithm_framework.infrastructure import OHLCVStorageCatalog
+from investing_algorithm_framework.infrastructure.data_providers.\
+    ohlcv_catalog import CATALOG_FILE_NAME, parse_ohlcv_file_name
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.storage_directory = tempfile.mkdtemp()
+
+        for file_name in [
+            "OHLCV_BTC-EUR_BINANCE_2h_2023-01-01-00-00_2023-12-31-00-00.csv",
+            "OHLCV_BTC-EUR_BINANCE_2h_2023-03-01-00-00_2023-06-01-00-00.csv",
+            "OHLCV_BTC-EUR_BINANCE_1d_2023-01-01-00-00_2023-12-31-00-00.csv",
+            "OHLCV_ETH-EUR_BINANCE_2h_2023-01-01-00-00_2023-12-31-00-00.csv",
+            "not_a_data_file.txt",
+        ]:
+            with open(os.path.join(self.storage_directory, file_name), "w"):
+                pass
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.storage_directory)
+
+    def test_parse_ohlcv_file_name(self):
+        attributes = parse_ohlcv_file_name(
+            "OHLCV_BTC-EUR_BINANCE_2h_2023-01-01-00-00_2023-12-31-00-00.csv"
+        )
+        self.assertEqual("BTC/EUR", attributes["symbol"])
+        self.assertEqual("BINANCE", attributes["market"])
+        self.assertEqual("2h", attributes["time_frame"])
+        self.assertEqual(
+            datetime(2023, 12, 31, tzinfo=timezone.utc),
+            attributes["end_date"]
+        )
+        self.assertIsNone(parse_ohlcv_file_name("not_a_data_file.txt"))
+
+    def test_find_best_covering_file(self):
+        catalog = OHLCVStorageCatalog(self.storage_directory)
+        file_path = catalog.find(
+            symbol="BTC/EUR",
+            market="binance",
+            time_frame="2h",
+            start_date=datetime(2023, 4, 1, tzinfo=timezone.utc),
+            end_date=datetime(2023, 5, 1, tzinfo=timezone.utc),
+        )
+        self.assertTrue(
+            file_path.endswith("2023-03-01-00-00_2023-06-01-00-00.csv")
+        )
+        file_path = catalog.find(
+            symbol="BTC/EUR",
+            market="binance",
+            time_frame="2h",
+            start_date=datetime(2023, 4, 1, tzinfo=timezone.utc),
+            end_date=datetime(2023, 8, 1, tzinfo=timezone.utc),
+        )
+        self.assertTrue(
+            file_path.endswith("2023-01-01-00-00_2023-12-31-00-00.csv")
+        )
+        self.assertIsNone(
+            catalog.find(
+                symbol="BTC/EUR",
+                market="binance",
+                time_frame="2h",
+                start_date=datetime(2022, 4, 1, tzinfo=timezone.utc),
+                end_date=datetime(2023, 8, 1, tzinfo=timezone.utc),
+            )
+        )
+
+    def test_catalog_is_persisted_and_refreshed(self):
+        catalog = OHLCVStorageCatalog(self.storage_directory)
+        catalog.refresh()
+        catalog_file_path = os.path.join(
+            self.storage_directory, CATALOG_FILE_NAME
+        )
+
+        with open(catalog_file_path, "r") as f:
+            self.assertEqual(4, len(json.load(f)["files"]))
+
+        file_name = \
+            "OHLCV_SOL-EUR_BINANCE_2h_2023-01-01-00-00_2023-12-31-00-00.csv"
+        file_path = os.path.join(self.storage_directory, file_name)
+
+        with open(file_path, "w"):
+            pass
+
+        catalog.add(file_path)
+        reloaded_catalog = OHLCVStorageCatalog(self.storage_directory)
+        self.assertEqual(
+            1, len(reloaded_catalog.get_entries("SOL/EUR", "BINANCE", "2h"))
+        )
+
+        os.remove(file_path)
+        catalog.refresh(force=True)
+        self.assertEqual(
+            0, len(catalog.get_entries("SOL/EUR", "BINANCE", "2h"))
+        )
+
+        # The catalog is saved through a temporary file of its own,
+        # which is not left behind
+        self.assertEqual(
+            [],
+            [
+                file_name for file_name in os.listdir(self.storage_directory)
+                if file_name.endswith(".tmp")
+            ]
+        )
+
+    def test_find_with_naive_dates(self):
+        catalog = OHLCVStorageCatalog(self.storage_directory)
+        file_path = catalog.find(
+            symbol="BTC/EUR",
+            market="binance",
+            time_frame="2h",
+            start_date=datetime(2023, 4, 1),
+            end_date=datetime(2023, 5, 1),
+        )
+        self.assertTrue(
+            file_path.endswith("2023-03-01-00-00_2023-06-01-00-00.csv")
+        )
+        self.assertIsNone(
+            catalog.find(
+                symbol="BTC/EUR",
+                market="binance",
+                time_frame="2h",
+                start_date=datetime(2022, 4, 1),
+                end_date=datetime(2023, 8, 1),
+            )
+        )
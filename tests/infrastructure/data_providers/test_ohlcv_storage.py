@@ -0,0 +1,187 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone, timedelta
+from unittest import TestCase
+
+import polars as pl
+
+from investing_algorithm_framework.domain import DataStorageFormat, \
+    TimeFrame, DATETIME_FORMAT_FILE_NAME
+from investing_algorithm_framework.infrastructure import \
+    CCXTOHLCVDataProvider, read_ohlcv_file, write_ohlcv_file, \
+    convert_ohlcv_files
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.resource_dir = os.path.abspath(
+            os.path.join(
+                os.path.dirname(os.path.realpath(__file__)),
+                os.pardir,
+                os.pardir,
+                "resources"
+            )
+        )
+        self.file_name = "OHLCV_BTC-EUR_BINANCE" \
+            "_2h_2023-08-07-07-59_2023-12-02-00-00.csv"
+        self.storage_directory = tempfile.mkdtemp()
+        shutil.copy(
+            os.path.join(
+                self.resource_dir, "market_data_sources", self.file_name
+            ),
+            self.storage_directory
+        )
+        self.csv_path = os.path.join(self.storage_directory, self.file_name)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.storage_directory)
+
+    def test_write_and_read_formats(self):
+        data = read_ohlcv_file(self.csv_path)
+
+        for storage_format in [
+            DataStorageFormat.PARQUET, DataStorageFormat.ARROW
+        ]:
+            file_path = os.path.join(
+                self.storage_directory,
+                f"data{storage_format.file_extension}"
+            )
+            write_ohlcv_file(data, file_path)
+            self.assertTrue(data.equals(read_ohlcv_file(file_path)))
+
+    def test_read_with_date_range_and_columns(self):
+        start_date = datetime(2023, 9, 1, tzinfo=timezone.utc)
+        end_date = datetime(2023, 10, 1, tzinfo=timezone.utc)
+        data = read_ohlcv_file(
+            self.csv_path,
+            start_date=start_date,
+            end_date=end_date,
+            columns=["Close"]
+        )
+        self.assertEqual(["Datetime", "Close"], data.columns)
+        self.assertGreaterEqual(data["Datetime"].min(), start_date)
+        self.assertLessEqual(data["Datetime"].max(), end_date)
+
+    def test_convert_ohlcv_files(self):
+        converted_files = convert_ohlcv_files(
+            self.storage_directory,
+            "parquet",
+            remove_source_files=True
+        )
+        self.assertEqual(1, len(converted_files))
+        self.assertTrue(converted_files[0].endswith(".parquet"))
+        self.assertFalse(os.path.exists(self.csv_path))
+
+    def test_ccxt_data_provider_reads_and_saves_parquet(self):
+        convert_ohlcv_files(self.storage_directory, DataStorageFormat.PARQUET)
+        data_provider = CCXTOHLCVDataProvider(
+            storage_directory=self.storage_directory,
+            storage_format="parquet",
+            config={DATETIME_FORMAT_FILE_NAME: "%Y-%m-%d-%H-%M"}
+        )
+        start_date = datetime(2023, 9, 1, tzinfo=timezone.utc)
+        end_date = datetime(2023, 10, 1, tzinfo=timezone.utc)
+        data = data_provider._get_data_from_storage(
+            storage_path=self.storage_directory,
+            symbol="BTC/EUR",
+            market="BINANCE",
+            time_frame=TimeFrame.TWO_HOUR,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        self.assertIsNotNone(data)
+        self.assertTrue(
+            data_provider.get_data_source_file_path().endswith(".parquet")
+        )
+
+        data_provider.save_data_to_storage(
+            symbol="ETH/EUR",
+            market="BINANCE",
+            time_frame=TimeFrame.TWO_HOUR,
+            start_date=start_date,
+            end_date=end_date,
+            data=data,
+            storage_directory_path=self.storage_directory,
+        )
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(
+                    self.storage_directory,
+                    "OHLCV_ETH-EUR_BINANCE_2h_2023-09-01-00-00_"
+                    "2023-10-01-00-00.parquet"
+                )
+            )
+        )
+
+    def test_get_data_only_downloads_missing_range(self):
+        requested_ranges = []
+
+        def get_ohlcv(
+            symbol, time_frame, from_timestamp, market, to_timestamp=None
+        ):
+            requested_ranges.append((from_timestamp, to_timestamp))
+            dates = []
+            date = from_timestamp
+
+            while date <= to_timestamp:
+                dates.append(date)
+                date += timedelta(hours=2)
+
+            return pl.DataFrame({
+                "Datetime": dates,
+                "Open": [1.0] * len(dates),
+                "High": [1.0] * len(dates),
+                "Low": [1.0] * len(dates),
+                "Close": [1.0] * len(dates),
+                "Volume": [1.0] * len(dates),
+            }).with_columns(
+                pl.col("Datetime").cast(
+                    pl.Datetime(time_unit="ms", time_zone="UTC")
+                )
+            )
+
+        data_provider = CCXTOHLCVDataProvider(
+            symbol="BTC/EUR",
+            market="BINANCE",
+            time_frame="2h",
+            storage_directory=self.storage_directory,
+            config={DATETIME_FORMAT_FILE_NAME: "%Y-%m-%d-%H-%M"}
+        )
+        data_provider.get_ohlcv = get_ohlcv
+        start_date = datetime(2023, 9, 1, tzinfo=timezone.utc)
+        end_date = datetime(2023, 12, 10, tzinfo=timezone.utc)
+        data = data_provider.get_data(
+            start_date=start_date, end_date=end_date, save=True
+        )
+
+        # Only the tail after the stored range is downloaded
+        self.assertEqual(
+            [(datetime(2023, 12, 2, tzinfo=timezone.utc), end_date)],
+            requested_ranges
+        )
+        self.assertEqual(start_date, data["Datetime"].min())
+        self.assertEqual(end_date, data["Datetime"].max())
+        self.assertEqual(
+            len(data), data["Datetime"].n_unique()
+        )
+
+        # The stored file is replaced by the merged file
+        self.assertFalse(os.path.exists(self.csv_path))
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(
+                    self.storage_directory,
+                    "OHLCV_BTC-EUR_BINANCE_2h_2023-08-07-07-59_"
+                    "2023-12-10-00-00.csv"
+                )
+            )
+        )
+
+        # The merged range is now served from storage
+        requested_ranges.clear()
+        data_provider.get_data(
+            start_date=start_date, end_date=end_date, save=True
+        )
+        self.assertEqual([], requested_ranges)
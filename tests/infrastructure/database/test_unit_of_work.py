@@ -0,0 +1,157 @@
+from sqlalchemy import event
+
+from investing_algorithm_framework.domain import PortfolioConfiguration, \
+    MarketCredential, OrderSide, OrderType, OrderStatus, \
+    OperationalException
+from investing_algorithm_framework.infrastructure import Session, \
+    unit_of_work
+from tests.resources import TestBase
+
+
+class TestUnitOfWork(TestBase):
+    market_credentials = [
+        MarketCredential(
+            market="BINANCE",
+            api_key="api_key",
+            secret_key="secret_key",
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="BINANCE",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000,
+    }
+
+    def setUp(self):
+        super().setUp()
+        self.order_service = self.app.container.order_service()
+        self.order_repository = self.app.container.order_repository()
+        self.portfolio = self.app.container.portfolio_service().get_all()[0]
+        self.commits = 0
+        # Savepoints also trigger the after_commit event of the session,
+        # so the commits of the database connection are counted
+        self.engine = Session().bind
+        event.listen(self.engine, "commit", self._count_commit)
+
+    def tearDown(self):
+        event.remove(self.engine, "commit", self._count_commit)
+        super().tearDown()
+
+    def _count_commit(self, connection):
+        self.commits += 1
+
+    def _create_order(self, execute=False):
+        return self.order_service.create(
+            {
+                "portfolio_id": self.portfolio.id,
+                "target_symbol": "BTC",
+                "amount": 1,
+                "trading_symbol": "EUR",
+                "price": 10,
+                "order_side": OrderSide.BUY.value,
+                "order_type": OrderType.LIMIT.value,
+                "status": OrderStatus.OPEN.value,
+            },
+            execute=execute
+        )
+
+    def test_commits_once(self):
+
+        with unit_of_work():
+            order = self._create_order()
+            self.order_service.update(order.id, {"filled": 1})
+            self.assertEqual(0, self.commits)
+
+        self.assertEqual(1, self.commits)
+        order = self.order_repository.get(order.id)
+        self.assertEqual(1, order.get_filled())
+        portfolio = self.app.container.portfolio_service().get(
+            self.portfolio.id
+        )
+        self.assertEqual(990, portfolio.get_unallocated())
+
+    def test_returns_detached_snapshots(self):
+
+        with unit_of_work():
+            order = self._create_order()
+            previous_order = self.order_repository.get(order.id)
+            updated_order = self.order_repository.update(
+                order.id, {"filled": 1}
+            )
+            self.assertEqual(0, previous_order.get_filled())
+            self.assertEqual(1, updated_order.get_filled())
+
+    def test_rollback_on_exception(self):
+
+        with self.assertRaises(ValueError):
+            with unit_of_work():
+                order = self._create_order()
+                raise ValueError()
+
+        self.assertEqual(0, self.commits)
+        self.assertFalse(self.order_repository.exists({"id": order.id}))
+
+    def test_nested_unit_of_work(self):
+
+        with unit_of_work() as session:
+
+            with unit_of_work() as nested_session:
+                self.assertIs(session, nested_session)
+                self._create_order()
+
+            self.assertEqual(0, self.commits)
+
+        self.assertEqual(1, self.commits)
+
+    def test_failed_operation_only_rolls_back_its_savepoint(self):
+
+        with unit_of_work():
+            order = self._create_order()
+            duplicate_order = self.order_repository.create(
+                {
+                    "id": order.id,
+                    "target_symbol": "ETH",
+                    "trading_symbol": "EUR",
+                    "amount": 1,
+                    "price": 10,
+                    "order_side": OrderSide.BUY.value,
+                    "order_type": OrderType.LIMIT.value,
+                    "status": OrderStatus.OPEN.value,
+                },
+                save=False
+            )
+
+            with self.assertRaises(OperationalException):
+                self.order_repository.save(duplicate_order)
+
+            self.order_service.update(order.id, {"filled": 1})
+
+        self.assertEqual(1, self.commits)
+        order = self.order_repository.get(order.id)
+        self.assertEqual("BTC", order.get_target_symbol())
+        self.assertEqual(1, order.get_filled())
+
+    def test_placed_order_is_committed(self):
+
+        with self.assertRaises(ValueError):
+            with unit_of_work():
+                order = self._create_order(execute=True)
+                raise ValueError()
+
+        # The order has been placed on the exchange, so its record is
+        # kept although the rest of the unit of work is rolled back
+        self.assertTrue(self.order_repository.exists({"id": order.id}))
+
+    def test_unit_of_work_without_database(self):
+        bind = Session.kw.get("bind")
+        Session.configure(bind=None)
+
+        try:
+            with unit_of_work() as session:
+                self.assertIsNone(session)
+        finally:
+            Session.configure(bind=bind)
@@ -0,0 +1,76 @@
+from investing_algorithm_framework.domain import OrderSide, OrderType, \
+    OrderStatus, TradeStatus
+from investing_algorithm_framework.infrastructure import \
+    InMemoryOrderRepository
+from tests.infrastructure.repositories.orders import test_order_repository
+from tests.infrastructure.repositories.trades import \
+    test_sql_trade_repository
+
+
+class TestInMemoryOrderRepository(
+    test_order_repository.TestSQLOrderRepositoryIntegration
+):
+    in_memory_storage = True
+
+    def test_repository_type(self):
+        self.assertIsInstance(self.repository, InMemoryOrderRepository)
+
+    def test_get_returns_snapshot(self):
+        order = self._create_order()
+        previous_order = self.repository.get(order.id)
+        updated_order = self.repository.update(order.id, {"filled": 1})
+        self.assertEqual(0, previous_order.get_filled())
+        self.assertEqual(1, updated_order.get_filled())
+        self.assertEqual(1, self.repository.get(order.id).get_filled())
+
+    def test_filter_by_status_after_update(self):
+        order = self._create_order()
+        self.assertEqual(
+            1, self.repository.count({"status": OrderStatus.OPEN.value})
+        )
+        self.repository.update(order.id, {"status": OrderStatus.CLOSED.value})
+        self.assertEqual(
+            0, self.repository.count({"status": OrderStatus.OPEN.value})
+        )
+        self.assertEqual(
+            1, self.repository.count({"status": OrderStatus.CLOSED.value})
+        )
+
+    def test_delete(self):
+        order = self._create_order()
+        self.repository.delete(order.id)
+        self.assertFalse(self.repository.exists({"id": order.id}))
+        self.assertEqual(
+            0, self.repository.count({"status": OrderStatus.OPEN.value})
+        )
+
+
+class TestInMemoryTradeRepository(test_sql_trade_repository.Test):
+    in_memory_storage = True
+
+    def test_trade_orders_keep_insertion_order(self):
+        order_service = self.app.container.order_service()
+        trade_service = self.app.container.trade_service()
+        buy_order = order_service.create(
+            {
+                "portfolio_id": 1,
+                "target_symbol": "BTC",
+                "amount": 1,
+                "trading_symbol": "EUR",
+                "price": 10,
+                "order_side": OrderSide.BUY.value,
+                "order_type": OrderType.LIMIT.value,
+                "status": OrderStatus.OPEN.value,
+            }
+        )
+        order_service.update(buy_order.id, {"filled": 1})
+        trade = trade_service.find({"order_id": buy_order.id})
+        self.assertEqual(TradeStatus.OPEN.value, trade.status)
+        trade_service.add_stop_loss(trade, 10)
+        trade = trade_service.get(trade.id)
+        self.assertEqual(1, len(trade.orders))
+        self.assertEqual(buy_order.id, trade.orders[0].id)
+        self.assertEqual(1, len(trade.stop_losses))
+        self.assertEqual(
+            1, len(trade_service.get_all({"portfolio_id": 1}))
+        )
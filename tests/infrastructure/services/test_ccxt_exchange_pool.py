@@ -0,0 +1,100 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+import ccxt
+
+from investing_algorithm_framework.domain import MarketCredential, \
+    OperationalException
+from investing_algorithm_framework.infrastructure import CCXTExchangePool, \
+    CCXTOrderExecutor, CCXTPortfolioProvider, CCXTOHLCVDataProvider
+
+
+class Test(TestCase):
+
+    def setUp(self):
+        self.pool = CCXTExchangePool.get_instance()
+        self.pool.clear()
+        self.addCleanup(self.pool.clear)
+        self.market_credential = MarketCredential(
+            market="binance", api_key="api_key", secret_key="secret_key"
+        )
+
+    def test_exchange_is_shared(self):
+        exchange = CCXTOrderExecutor.initialize_exchange(
+            "BINANCE", self.market_credential
+        )
+        self.assertIs(
+            exchange,
+            CCXTPortfolioProvider.initialize_exchange(
+                "binance", self.market_credential
+            )
+        )
+        self.assertIs(
+            exchange,
+            CCXTOHLCVDataProvider.initialize_exchange(
+                "binance", self.market_credential
+            )
+        )
+        self.assertIsNot(
+            exchange, CCXTOHLCVDataProvider.initialize_exchange(
+                "binance", None
+            )
+        )
+
+    def test_missing_market_credential(self):
+
+        with self.assertRaises(OperationalException):
+            CCXTOrderExecutor.initialize_exchange("binance", None)
+
+        with self.assertRaises(OperationalException):
+            CCXTPortfolioProvider.initialize_exchange("binance", None)
+
+        # Data providers can use an anonymous exchange
+        self.assertIsNotNone(
+            CCXTOHLCVDataProvider.initialize_exchange("binance", None)
+        )
+
+    @patch.object(ccxt.binance, "load_markets")
+    def test_markets_are_loaded_once(self, load_markets):
+        self.pool.load_markets("binance")
+        self.pool.load_markets("binance")
+        self.assertEqual(1, load_markets.call_count)
+
+        # Markets older than the ttl are reloaded
+        self.pool.load_markets("binance", ttl=0)
+        self.assertEqual(2, load_markets.call_count)
+        load_markets.assert_called_with(reload=True)
+
+    @patch.object(ccxt.binance, "load_markets")
+    def test_symbols_are_cached_on_disk(self, load_markets):
+        cache_file_path = os.path.join(
+            tempfile.mkdtemp(), ".ccxt_markets_cache.json"
+        )
+        self.addCleanup(shutil.rmtree, os.path.dirname(cache_file_path))
+        self.pool.get_exchange("binance").markets = {"BTC/EUR": {}}
+        symbols = self.pool.get_symbols(
+            "binance", cache_file_path=cache_file_path, cache_ttl=60
+        )
+        self.assertIn("BTC/EUR", symbols)
+        self.assertEqual(1, load_markets.call_count)
+
+        # A new pool, e.g. in another process, reads the symbols from disk
+        pool = CCXTExchangePool()
+        self.assertIn(
+            "BTC/EUR",
+            pool.get_symbols(
+                "binance", cache_file_path=cache_file_path, cache_ttl=60
+            )
+        )
+        self.assertEqual(1, load_markets.call_count)
+
+        # Expired symbols are loaded again
+        pool.get_exchange("binance").markets = {"ETH/EUR": {}}
+        symbols = pool.get_symbols(
+            "binance", cache_file_path=cache_file_path, cache_ttl=0
+        )
+        self.assertIn("ETH/EUR", symbols)
+        self.assertEqual(2, load_markets.call_count)
@@ -1,9 +1,11 @@
 from .portfolio_sync_service import PortfolioSyncServiceStub
 from .order_executor import OrderExecutorTest
 from .portfolio_provider import PortfolioProviderTest
+from .mock_exchange import MockAsyncExchange
 
 __all__ = [
     "PortfolioSyncServiceStub",
     "OrderExecutorTest",
     "PortfolioProviderTest",
+    "MockAsyncExchange",
 ]
@@ -0,0 +1,44 @@
+import asyncio
+
+from ccxt.async_support.base.exchange import Exchange
+
+
+class MockAsyncExchange(Exchange):
+    """
+    Local stand-in for a ccxt async_support exchange. It generates
+    candles for any symbol without network access and waits a fixed
+    latency for each fetch_ohlcv call, so that concurrent fetching
+    can be tested.
+    """
+
+    def __init__(self, config=None, latency=0.1, limit=500):
+        super().__init__(config or {})
+        self.id = "mock"
+        self.rateLimit = 0
+        self.has = dict(self.has, fetchOHLCV=True)
+        self.latency = latency
+        self.limit = limit
+        self.requests = []
+        self.closed = False
+
+    async def fetch_ohlcv(
+        self, symbol, timeframe="1m", since=None, limit=None, params={}
+    ):
+        self.requests.append((symbol, timeframe, since))
+        await asyncio.sleep(self.latency)
+        duration = self.parse_timeframe(timeframe) * 1000
+        now = self.milliseconds()
+        candles = []
+        timestamp = since - since % duration
+
+        if timestamp < since:
+            timestamp += duration
+
+        while timestamp <= now and len(candles) < self.limit:
+            candles.append([timestamp, 1.0, 2.0, 0.5, 1.5, 100.0])
+            timestamp += duration
+
+        return candles
+
+    async def close(self):
+        self.closed = True
@@ -38,6 +38,7 @@ class TestBase(TestCase):
     market_credentials = []
     market_data_source_service = None
     initialize = True
+    in_memory_storage = False
     resource_directory = os.path.dirname(__file__)
     data_providers = []
 
@@ -80,7 +81,12 @@ class TestBase(TestCase):
 
         if self.initialize:
             self.app.initialize_config()
-            self.app.initialize_storage()
+
+            if self.in_memory_storage:
+                self.app.initialize_in_memory_storage()
+            else:
+                self.app.initialize_storage()
+
             self.app.initialize_services()
             self.app.initialize_portfolios()
 
@@ -0,0 +1,128 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import DataProvider, DataType, \
+    DataSource, BacktestDateRange, ImproperlyConfigured
+from investing_algorithm_framework.services import DataProviderService, \
+    MarketCredentialService, ConfigurationService
+
+
+class CountingDataProvider(DataProvider):
+    data_type = DataType.CUSTOM
+    data_provider_identifier = "counting"
+
+    def __init__(self):
+        super().__init__()
+        self.has_data_calls = 0
+
+    def has_data(
+        self,
+        data_source: DataSource,
+        start_date: datetime = None,
+        end_date: datetime = None,
+    ) -> bool:
+        self.has_data_calls += 1
+        return DataType.CUSTOM.equals(data_source.data_type)
+
+    def get_data(self, date=None, start_date=None, end_date=None, save=False):
+        return None
+
+    def prepare_backtest_data(self, backtest_start_date, backtest_end_date):
+        pass
+
+    def get_backtest_data(
+        self,
+        backtest_index_date,
+        backtest_start_date=None,
+        backtest_end_date=None,
+        data_source=None,
+    ):
+        return None
+
+    def copy(self, data_source: DataSource) -> "DataProvider":
+        return CountingDataProvider()
+
+    def get_number_of_data_points(self, start_date, end_date) -> int:
+        return 0
+
+    def get_missing_data_dates(self, start_date, end_date):
+        return []
+
+    def get_data_source_file_path(self):
+        return None
+
+
+class UnreachableDataProvider(CountingDataProvider):
+    """
+    Data provider that can not check its data on the first call to
+    has_data, like a data provider with a network error.
+    """
+
+    def has_data(
+        self,
+        data_source: DataSource,
+        start_date: datetime = None,
+        end_date: datetime = None,
+    ) -> bool:
+        self.has_data_calls += 1
+
+        if self.has_data_calls == 1:
+            return None
+
+        return True
+
+
+class Test(TestCase):
+
+    def test_has_data_is_cached(self):
+        service = DataProviderService(
+            configuration_service=ConfigurationService(),
+            market_credential_service=MarketCredentialService(),
+            default_data_providers=[]
+        )
+        data_provider = CountingDataProvider()
+        data_sources = [
+            DataSource(data_type=DataType.CUSTOM, identifier=f"data_{i}")
+            for i in range(5)
+        ]
+        backtest_date_range = BacktestDateRange(
+            start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2023, 2, 1, tzinfo=timezone.utc)
+        )
+
+        for _ in range(3):
+            service.reset()
+            service.add_data_provider(data_provider)
+            service.index_backtest_data_providers(
+                data_sources, backtest_date_range, show_progress=False
+            )
+
+        # The data sources only differ in identifier
+        self.assertEqual(1, data_provider.has_data_calls)
+        self.assertEqual(5, len(service.data_provider_index))
+
+        # Other data providers do not share the cached answers
+        other_data_provider = CountingDataProvider()
+        service.reset()
+        service.add_data_provider(other_data_provider)
+        service.index_backtest_data_providers(
+            data_sources, backtest_date_range, show_progress=False
+        )
+        self.assertEqual(1, other_data_provider.has_data_calls)
+
+    def test_has_data_none_is_not_cached(self):
+        service = DataProviderService(
+            configuration_service=ConfigurationService(),
+            market_credential_service=MarketCredentialService(),
+            default_data_providers=[]
+        )
+        data_provider = UnreachableDataProvider()
+        service.add_data_provider(data_provider)
+        data_source = DataSource(data_type=DataType.CUSTOM, identifier="data")
+
+        with self.assertRaises(ImproperlyConfigured):
+            service.data_provider_index.register(data_source)
+
+        service.data_provider_index.register(data_source)
+        service.data_provider_index.register(data_source)
+        self.assertEqual(2, data_provider.has_data_calls)
@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from time import monotonic
+from unittest import TestCase
+from unittest.mock import patch
+
+from investing_algorithm_framework.domain import DataType, DataSource, \
+    OperationalException, RESOURCE_DIRECTORY, DATA_FETCH_TIMEOUT
+from investing_algorithm_framework.infrastructure import \
+    CCXTOHLCVDataProvider
+from investing_algorithm_framework.services import DataProviderService, \
+    MarketCredentialService, ConfigurationService
+from tests.resources.stubs import MockAsyncExchange
+
+
+class Test(TestCase):
+
+    def setUp(self):
+        self.resource_directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.resource_directory, "data"))
+        self.configuration_service = ConfigurationService()
+        self.configuration_service.add_value(
+            RESOURCE_DIRECTORY, self.resource_directory
+        )
+        self.service = DataProviderService(
+            configuration_service=self.configuration_service,
+            market_credential_service=MarketCredentialService(),
+            default_data_providers=[]
+        )
+        self.service.add_data_provider(CCXTOHLCVDataProvider())
+        self.exchange = MockAsyncExchange(latency=0.3)
+        self.data_sources = [
+            DataSource(
+                data_type=DataType.OHLCV,
+                symbol=symbol,
+                market="BINANCE",
+                time_frame="2h",
+                window_size=50,
+            )
+            for symbol in ["BTC/EUR", "ETH/EUR", "SOL/EUR", "ADA/EUR"]
+        ]
+        patchers = [
+            patch.object(
+                CCXTOHLCVDataProvider, "has_data", return_value=True
+            ),
+            patch.object(
+                CCXTOHLCVDataProvider,
+                "initialize_async_exchange",
+                return_value=self.exchange
+            )
+        ]
+
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.service.index_data_providers(self.data_sources)
+
+    def tearDown(self):
+        self.service.close()
+        shutil.rmtree(self.resource_directory)
+
+    def test_get_data_for_data_sources_concurrently(self):
+        start = monotonic()
+        results = self.service.get_data_for_data_sources(
+            self.data_sources, date=datetime.now(tz=timezone.utc)
+        )
+        elapsed = monotonic() - start
+
+        # All four data sources are fetched in about a single round trip
+        self.assertLess(elapsed, 4 * 0.3)
+        self.assertEqual(4, len(self.exchange.requests))
+        self.assertEqual(
+            ["BTC/EUR", "ETH/EUR", "SOL/EUR", "ADA/EUR"],
+            [request[0] for request in self.exchange.requests]
+        )
+
+        for data in results:
+            self.assertGreater(len(data), 0)
+            self.assertLessEqual(len(data), 51)
+
+        # The exchange is reused and closed together with the service
+        self.service.get_data_for_data_sources(
+            self.data_sources, date=datetime.now(tz=timezone.utc)
+        )
+        self.assertEqual(
+            1, CCXTOHLCVDataProvider.initialize_async_exchange.call_count
+        )
+        self.service.close()
+        self.assertTrue(self.exchange.closed)
+
+    def test_get_data_for_data_sources_timeout(self):
+        self.configuration_service.add_value(DATA_FETCH_TIMEOUT, 0.05)
+
+        with self.assertRaises(OperationalException) as context:
+            self.service.get_data_for_data_sources(
+                self.data_sources, date=datetime.now(tz=timezone.utc)
+            )
+
+        self.assertIn("timed out", str(context.exception))
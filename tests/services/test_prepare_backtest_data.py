@@ -0,0 +1,163 @@
+import threading
+from datetime import datetime, timezone
+from time import sleep
+from unittest import TestCase
+
+from investing_algorithm_framework.domain import DataProvider, DataType, \
+    DataSource, BacktestDateRange, OperationalException, \
+    BACKTEST_DATA_PREPARATION_WORKERS
+from investing_algorithm_framework.services import DataProviderService, \
+    MarketCredentialService, ConfigurationService
+
+
+class CustomDataProvider(DataProvider):
+    data_type = DataType.CUSTOM
+    data_provider_identifier = "custom"
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def __init__(self, identifier=None):
+        super().__init__()
+        self.identifier = identifier
+        self.prepared = False
+
+    def has_data(
+        self,
+        data_source: DataSource,
+        start_date: datetime = None,
+        end_date: datetime = None,
+    ) -> bool:
+        return DataType.CUSTOM.equals(data_source.data_type)
+
+    def get_data(
+        self,
+        date: datetime = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        save: bool = False,
+    ):
+        return None
+
+    def prepare_backtest_data(
+        self, backtest_start_date, backtest_end_date
+    ) -> None:
+
+        with CustomDataProvider.lock:
+            CustomDataProvider.running += 1
+            CustomDataProvider.max_running = max(
+                CustomDataProvider.max_running, CustomDataProvider.running
+            )
+
+        sleep(0.05)
+
+        with CustomDataProvider.lock:
+            CustomDataProvider.running -= 1
+
+        if self.identifier.startswith("failing"):
+            raise OperationalException(f"{self.identifier} has no data")
+
+        self.prepared = True
+
+    def get_backtest_data(
+        self,
+        backtest_index_date: datetime,
+        backtest_start_date: datetime = None,
+        backtest_end_date: datetime = None,
+        data_source: DataSource = None,
+    ):
+        return None
+
+    def copy(self, data_source: DataSource) -> "DataProvider":
+        return CustomDataProvider(data_source.identifier)
+
+    def get_number_of_data_points(self, start_date, end_date) -> int:
+        return 0
+
+    def get_missing_data_dates(self, start_date, end_date):
+        return []
+
+    def get_data_source_file_path(self):
+        return None
+
+
+class Test(TestCase):
+
+    def setUp(self):
+        CustomDataProvider.running = 0
+        CustomDataProvider.max_running = 0
+        self.configuration_service = ConfigurationService()
+        self.service = DataProviderService(
+            configuration_service=self.configuration_service,
+            market_credential_service=MarketCredentialService(),
+            default_data_providers=[]
+        )
+        self.service.add_data_provider(CustomDataProvider())
+        self.backtest_date_range = BacktestDateRange(
+            start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2023, 2, 1, tzinfo=timezone.utc)
+        )
+
+    def index(self, identifiers):
+        self.service.index_backtest_data_providers(
+            [
+                DataSource(data_type=DataType.CUSTOM, identifier=identifier)
+                for identifier in identifiers
+            ],
+            self.backtest_date_range,
+            show_progress=False
+        )
+
+    def test_prepare_backtest_data_concurrently(self):
+        self.index([f"data_{index}" for index in range(8)])
+        self.service.prepare_backtest_data(
+            self.backtest_date_range, show_progress=False, max_workers=4
+        )
+        self.assertGreater(CustomDataProvider.max_running, 1)
+        self.assertLessEqual(CustomDataProvider.max_running, 4)
+
+        for _, data_provider in self.service.data_provider_index.get_all():
+            self.assertTrue(data_provider.prepared)
+
+    def test_prepare_backtest_data_worker_count_from_config(self):
+        self.configuration_service.add_value(
+            BACKTEST_DATA_PREPARATION_WORKERS, 1
+        )
+        self.index([f"data_{index}" for index in range(4)])
+        self.service.prepare_backtest_data(
+            self.backtest_date_range, show_progress=False
+        )
+        self.assertEqual(1, CustomDataProvider.max_running)
+
+    def test_prepare_backtest_data_aggregates_errors(self):
+        self.index(["data_1", "failing_1", "data_2", "failing_2"])
+        data_sources = [
+            data_source.identifier for data_source, _
+            in self.service.data_provider_index.get_all()
+        ]
+        expected_failures = [
+            identifier for identifier in data_sources
+            if identifier.startswith("failing")
+        ]
+
+        with self.assertRaises(OperationalException) as context:
+            self.service.prepare_backtest_data(
+                self.backtest_date_range,
+                show_progress=False,
+                max_workers=4
+            )
+
+        message = str(context.exception)
+        self.assertIn("2 of 4 data sources", message)
+        self.assertLess(
+            message.index(f"{expected_failures[0]} has no data"),
+            message.index(f"{expected_failures[1]} has no data")
+        )
+
+        # All other data providers are still prepared
+        for data_source, data_provider \
+                in self.service.data_provider_index.get_all():
+            self.assertEqual(
+                not data_source.identifier.startswith("failing"),
+                data_provider.prepared
+            )
@@ -0,0 +1,129 @@
+import os
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+import polars as pl
+
+from investing_algorithm_framework.domain import DataSource, DataType, \
+    BacktestDateRange, TimeFrame, RESAMPLE_BACKTEST_OHLCV_DATA
+from investing_algorithm_framework.infrastructure import \
+    CSVOHLCVDataProvider, read_ohlcv_file
+from investing_algorithm_framework.services import DataProviderService, \
+    MarketCredentialService, ConfigurationService, OHLCVResampler, \
+    ResampledOHLCVDataProvider
+
+
+class Test(TestCase):
+
+    def setUp(self):
+        self.file_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
+            "resources",
+            "market_data_sources",
+            "OHLCV_BTC-EUR_BINANCE_2h_2023-08-07-07-59_2023-12-02-00-00.csv"
+        )
+        self.configuration_service = ConfigurationService()
+        self.configuration_service.add_value(
+            RESAMPLE_BACKTEST_OHLCV_DATA, True
+        )
+        self.service = DataProviderService(
+            configuration_service=self.configuration_service,
+            market_credential_service=MarketCredentialService(),
+            default_data_providers=[]
+        )
+        self.service.add_data_provider(
+            CSVOHLCVDataProvider(
+                storage_path=self.file_path,
+                symbol="BTC/EUR",
+                time_frame="2h",
+                market="BINANCE",
+            )
+        )
+        self.backtest_date_range = BacktestDateRange(
+            start_date=datetime(2023, 9, 1, tzinfo=timezone.utc),
+            end_date=datetime(2023, 10, 1, tzinfo=timezone.utc)
+        )
+        self.data_sources = [
+            DataSource(
+                data_type=DataType.OHLCV,
+                symbol="BTC/EUR",
+                market="BINANCE",
+                time_frame=time_frame,
+                window_size=window_size
+            )
+            for time_frame, window_size in [("2h", 10), ("4h", 10), ("1d", 5)]
+        ]
+
+    def test_resample(self):
+        data = read_ohlcv_file(self.file_path)
+        resampler = OHLCVResampler(
+            CSVOHLCVDataProvider(
+                storage_path=self.file_path,
+                symbol="BTC/EUR",
+                time_frame="2h",
+                market="BINANCE",
+            )
+        )
+        daily = resampler.resample(data, TimeFrame.ONE_DAY)
+        day = datetime(2023, 9, 12, tzinfo=timezone.utc)
+        candles = data.filter(
+            (pl.col("Datetime") >= day) &
+            (pl.col("Datetime") < day + timedelta(days=1))
+        )
+        candle = daily.filter(pl.col("Datetime") == day)
+        self.assertEqual(1, len(candle))
+        self.assertEqual(candles["Open"][0], candle["Open"][0])
+        self.assertEqual(candles["High"].max(), candle["High"][0])
+        self.assertEqual(candles["Low"].min(), candle["Low"][0])
+        self.assertEqual(candles["Close"][-1], candle["Close"][0])
+        self.assertAlmostEqual(candles["Volume"].sum(), candle["Volume"][0])
+
+        # The first day starts at 08:00 and is incomplete
+        self.assertEqual(
+            datetime(2023, 8, 8, tzinfo=timezone.utc), daily["Datetime"][0]
+        )
+        self.assertTrue(
+            OHLCVResampler.can_resample(TimeFrame.TWO_HOUR, TimeFrame.ONE_WEEK)
+        )
+        self.assertFalse(
+            OHLCVResampler.can_resample(
+                TimeFrame.TWO_HOUR, TimeFrame.ONE_HOUR
+            )
+        )
+
+    def test_register_resampled_data_sources(self):
+        self.service.index_backtest_data_providers(
+            self.data_sources, self.backtest_date_range, show_progress=False
+        )
+        data_providers = [
+            self.service.data_provider_index.get(data_source)
+            for data_source in self.data_sources
+        ]
+
+        for data_provider in data_providers:
+            self.assertIsInstance(data_provider, ResampledOHLCVDataProvider)
+            self.assertIs(data_providers[0].resampler, data_provider.resampler)
+
+        # The base window covers the warmup of the daily windows
+        self.assertEqual(
+            72, data_providers[0].resampler.data_provider.window_size
+        )
+        self.service.prepare_backtest_data(
+            self.backtest_date_range, show_progress=False
+        )
+        date = datetime(2023, 9, 15, tzinfo=timezone.utc)
+
+        for data_source, window_size in zip(self.data_sources, [10, 10, 5]):
+            data = self.service.get_backtest_data(
+                data_source, backtest_index_date=date
+            )
+            self.assertEqual(window_size + 1, len(data))
+            self.assertEqual(date, data["Datetime"][-1])
+
+        daily = self.service.get_backtest_data(
+            self.data_sources[2], backtest_index_date=date
+        )
+        two_hourly = self.service.get_backtest_data(
+            self.data_sources[0], backtest_index_date=date
+        )
+        self.assertEqual(daily["Open"][-1], two_hourly["Open"][-1])
@@ -0,0 +1,206 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential, OrderStatus, TradeStatus
+from investing_algorithm_framework.services import StatusCache
+from tests.resources import TestBase
+
+
+class CachedObject:
+
+    def __init__(self, id, status, target_symbol):
+        self.id = id
+        self.status = status
+        self.target_symbol = target_symbol
+
+
+class TestStatusCache(TestCase):
+
+    def test_add_moves_object_between_statuses(self):
+        cache = StatusCache()
+        cache.load("OPEN", [CachedObject(2, "OPEN", "BTC")])
+        cache.load("CREATED", [])
+        cache.add(CachedObject(1, "OPEN", "ETH"))
+        self.assertEqual([1, 2], [item.id for item in cache.get("OPEN")])
+        self.assertEqual(
+            [2], [item.id for item in cache.get("OPEN", "BTC")]
+        )
+        cache.add(CachedObject(2, "CREATED", "BTC"))
+        self.assertEqual([1], [item.id for item in cache.get("OPEN")])
+        self.assertEqual([2], [item.id for item in cache.get("CREATED")])
+
+        # Objects with a status that is not loaded are not cached
+        cache.add(CachedObject(1, "CLOSED", "ETH"))
+        self.assertFalse(cache.is_loaded("CLOSED"))
+        self.assertEqual([], cache.get("OPEN"))
+
+    def test_returns_copies(self):
+        cache = StatusCache()
+        cache.load("OPEN", [CachedObject(1, "OPEN", "BTC")])
+        cache.get("OPEN")[0].status = "CLOSED"
+        self.assertEqual("OPEN", cache.get("OPEN")[0].status)
+        self.assertEqual(1, cache.count("OPEN", "BTC"))
+
+        # Changes to an added object after adding it are not cached
+        item = CachedObject(2, "OPEN", "ETH")
+        cache.add(item)
+        item.target_symbol = "BTC"
+        self.assertEqual(1, cache.count("OPEN", "ETH"))
+        self.assertEqual("ETH", cache.get("OPEN", "ETH")[0].target_symbol)
+
+    def test_clear(self):
+        cache = StatusCache()
+        cache.load("OPEN", [CachedObject(1, "OPEN", "BTC")])
+        cache.clear()
+        self.assertFalse(cache.is_loaded("OPEN"))
+
+
+class TestOrderTradeStatusCache(TestBase):
+    market_credentials = [
+        MarketCredential(
+            market="binance",
+            api_key="api_key",
+            secret_key="secret_key",
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="binance",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000
+    }
+
+    def _create_order(self, order_service, target_symbol):
+        return order_service.create(
+            {
+                "target_symbol": target_symbol,
+                "trading_symbol": "EUR",
+                "amount": 10,
+                "order_side": "BUY",
+                "price": 10,
+                "order_type": "LIMIT",
+                "portfolio_id": 1,
+                "status": "CREATED",
+            }
+        )
+
+    def test_open_orders_are_served_from_cache(self):
+        order_service = self.app.container.order_service()
+        other_order_service = self.app.container.order_service()
+        btc_order = self._create_order(order_service, "BTC")
+        eth_order = self._create_order(order_service, "ETH")
+        open_orders = order_service.get_all({"status": OrderStatus.OPEN})
+        self.assertEqual(2, len(open_orders))
+        repository = order_service.repository
+
+        with patch.object(
+            repository, "get_all", wraps=repository.get_all
+        ) as get_all:
+            self.assertTrue(
+                other_order_service.exists(
+                    {"status": "OPEN", "target_symbol": "BTC"}
+                )
+            )
+            self.assertEqual(
+                [btc_order.id],
+                [
+                    order.id for order in other_order_service.get_all(
+                        {"status": "OPEN", "target_symbol": "BTC"}
+                    )
+                ]
+            )
+            get_all.assert_not_called()
+
+        # An update through another service instance is seen by all
+        other_order_service.update(
+            eth_order.id, {"status": "CLOSED", "filled": 10, "remaining": 0}
+        )
+        open_orders = order_service.get_all({"status": OrderStatus.OPEN})
+        self.assertEqual([btc_order.id], [order.id for order in open_orders])
+        self.assertEqual(
+            [order.id for order in open_orders],
+            [
+                order.id for order in order_service.repository.get_all(
+                    {"status": OrderStatus.OPEN}
+                )
+            ]
+        )
+        self.assertFalse(
+            order_service.exists({"status": "OPEN", "target_symbol": "ETH"})
+        )
+
+    def test_open_trades_are_served_from_cache(self):
+        order_service = self.app.container.order_service()
+        trade_service = self.app.container.trade_service()
+        order = self._create_order(order_service, "BTC")
+        self.assertEqual(
+            0, len(trade_service.get_all({"status": TradeStatus.OPEN}))
+        )
+        order_service.update(order.id, {"filled": 10})
+        open_trades = trade_service.get_all({"status": TradeStatus.OPEN})
+        self.assertEqual(1, len(open_trades))
+        repository = trade_service.repository
+
+        with patch.object(
+            repository, "get_all", wraps=repository.get_all
+        ) as get_all:
+            open_trades = self.app.container.trade_service().get_all(
+                {"status": "OPEN", "target_symbol": "BTC"}
+            )
+            self.assertEqual(1, len(open_trades))
+            get_all.assert_not_called()
+
+        trade_service.add_stop_loss(open_trades[0], 5)
+        open_trades = trade_service.get_all({"status": TradeStatus.OPEN})
+        self.assertEqual(1, len(open_trades[0].stop_losses))
+
+    def test_changing_returned_orders_does_not_change_cache(self):
+        order_service = self.app.container.order_service()
+        order = self._create_order(order_service, "BTC")
+        open_order = order_service.get_all({"status": OrderStatus.OPEN})[0]
+        open_order.status = OrderStatus.CLOSED.value
+        open_order.target_symbol = "ETH"
+        open_order.amount = 5
+        open_orders = order_service.get_all({"status": OrderStatus.OPEN})
+        self.assertEqual([order.id], [order.id for order in open_orders])
+        self.assertEqual("BTC", open_orders[0].target_symbol)
+        self.assertEqual(10, open_orders[0].amount)
+        self.assertTrue(
+            order_service.exists({"status": "OPEN", "target_symbol": "BTC"})
+        )
+        self.assertFalse(
+            order_service.exists({"status": "OPEN", "target_symbol": "ETH"})
+        )
+
+        # A returned order can be saved like an order of the repository
+        open_orders[0].amount = 5
+        order_service.save(open_orders[0])
+        self.assertEqual(5, order_service.repository.get(order.id).amount)
+        self.assertEqual(
+            5, order_service.get_all({"status": OrderStatus.OPEN})[0].amount
+        )
+
+    def test_changing_returned_trades_does_not_change_cache(self):
+        order_service = self.app.container.order_service()
+        trade_service = self.app.container.trade_service()
+        order = self._create_order(order_service, "BTC")
+        order_service.update(order.id, {"filled": 10})
+        trade = trade_service.get_all({"status": TradeStatus.OPEN})[0]
+        trade_service.add_stop_loss(trade, 5)
+        trade = trade_service.get_all({"status": TradeStatus.OPEN})[0]
+        trade.status = TradeStatus.CLOSED.value
+        trade.stop_losses.clear()
+        trade.orders[0].status = OrderStatus.CANCELED.value
+        open_trades = trade_service.get_all({"status": TradeStatus.OPEN})
+        self.assertEqual(1, len(open_trades))
+        self.assertEqual(TradeStatus.OPEN.value, open_trades[0].status)
+        self.assertEqual(1, len(open_trades[0].stop_losses))
+        self.assertEqual(
+            order_service.get(order.id).status,
+            open_trades[0].orders[0].status
+        )
+        self.assertTrue(trade_service.exists({"status": "OPEN"}))
@@ -0,0 +1,113 @@
+from unittest import TestCase
+
+import numpy as np
+
+from investing_algorithm_framework.services import VectorPortfolio
+
+
+class TestVectorPortfolio(TestCase):
+
+    def get_trades(self, vector_portfolio):
+        return list(zip(
+            vector_portfolio.symbol_indices.tolist(),
+            vector_portfolio.entry_indices.tolist(),
+            vector_portfolio.exit_indices.tolist()
+        ))
+
+    def run_single_symbol(self, signal):
+        return VectorPortfolio(
+            signals=np.array(signal, dtype=float).reshape(-1, 1),
+            prices=np.ones((len(signal), 1)),
+            capital_per_trade=[1],
+            initial_amount=1000
+        ).run()
+
+    def test_entries_and_exits(self):
+        vector_portfolio = self.run_single_symbol(
+            [0, -1, 1, 1, -1, -1, 1, -1, -1]
+        )
+        self.assertEqual(
+            [(0, 2, 4), (0, 6, 7)], self.get_trades(vector_portfolio)
+        )
+
+    def test_entry_at_start(self):
+        vector_portfolio = self.run_single_symbol([1, 1, 1, -1])
+        self.assertEqual([(0, 0, 3)], self.get_trades(vector_portfolio))
+
+    def test_open_trade_at_end(self):
+        vector_portfolio = self.run_single_symbol([0, 1, -1, -1, 1, 1])
+        self.assertEqual(
+            [(0, 1, 2), (0, 4, -1)], self.get_trades(vector_portfolio)
+        )
+
+    def test_without_buy_signals(self):
+        vector_portfolio = self.run_single_symbol([0, 0, -1, -1])
+        self.assertEqual([], self.get_trades(vector_portfolio))
+        self.assertEqual(
+            [1000] * 4, vector_portfolio.total_value.tolist()
+        )
+        self.assertEqual([], self.get_trades(self.run_single_symbol([])))
+
+    def run_two_symbols(self, initial_amount):
+        return VectorPortfolio(
+            signals=np.array([
+                [1, 0],
+                [1, 1],
+                [-1, 1],
+                [-1, -1],
+                [-1, 1],
+                [-1, 1],
+            ], dtype=float),
+            prices=np.array([
+                [10, 20],
+                [10, 20],
+                [12, 20],
+                [12, 20],
+                [12, 20],
+                [12, 25],
+            ], dtype=float),
+            capital_per_trade=[60, 60],
+            initial_amount=initial_amount
+        ).run()
+
+    def test_symbols_share_capital(self):
+        vector_portfolio = self.run_two_symbols(initial_amount=100)
+
+        # The first trade of the second symbol does not fit in the
+        # unallocated cash, while the trade of the first symbol is open
+        self.assertEqual(
+            [(0, 0, 2), (1, 4, -1)], self.get_trades(vector_portfolio)
+        )
+        self.assertEqual([12], vector_portfolio.net_gains[:1].tolist())
+        self.assertEqual(
+            [40, 40, 112, 112, 52, 52],
+            vector_portfolio.unallocated.tolist()
+        )
+        self.assertEqual(
+            [60, 60, 0, 0, 60, 75], vector_portfolio.allocated.tolist()
+        )
+        self.assertEqual(
+            [100, 100, 112, 112, 112, 127],
+            vector_portfolio.total_value.tolist()
+        )
+        self.assertEqual(
+            [0, 0, 12, 12, 12, 12], vector_portfolio.total_net_gain.tolist()
+        )
+        self.assertAlmostEqual(75 / 127, vector_portfolio.exposure[-1])
+        self.assertEqual(
+            [[6, 0], [6, 0], [0, 0], [0, 0], [0, 3], [0, 3]],
+            vector_portfolio.position.tolist()
+        )
+        self.assertEqual(10, vector_portfolio.get_last_price(0))
+        self.assertEqual(25, vector_portfolio.get_last_price(1))
+
+    def test_symbols_with_enough_capital(self):
+        vector_portfolio = self.run_two_symbols(initial_amount=1000)
+        self.assertEqual(
+            [(0, 0, 2), (1, 1, 3), (1, 4, -1)],
+            self.get_trades(vector_portfolio)
+        )
+        self.assertEqual(
+            [940, 880, 952, 1012, 952, 952],
+            vector_portfolio.unallocated.tolist()
+        )